@@ -0,0 +1,70 @@
+import argparse
+import random
+import time
+
+from engines import minesweeper
+from engines.minesweeper import MinesweeperState
+
+
+def create_board_nested(state):
+    # The original generator: retry random cells until a free one is found,
+    # then count neighbours cell by cell.
+    for _ in range(state.mines):
+        while True:
+            r = state.rng.randint(0, state.rows - 1)
+            c = state.rng.randint(0, state.columns - 1)
+            if state.board[r][c] != -1:
+                state.board[r][c] = -1
+                break
+    for r in range(state.rows):
+        for c in range(state.columns):
+            if state.board[r][c] == -1:
+                continue
+            count = 0
+            for i in range(max(0, r-1), min(state.rows, r+2)):
+                for j in range(max(0, c-1), min(state.columns, c+2)):
+                    if state.board[i][j] == -1:
+                        count += 1
+            state.board[r][c] = count
+
+
+def time_board(create, rows, columns, mines, seed):
+    state = MinesweeperState(rows, columns, mines, random.Random(seed))
+    start = time.perf_counter()
+    create(state)
+    return time.perf_counter() - start
+
+
+def run(sizes, density, seed, nested_limit):
+    results = []
+    for side in sizes:
+        mines = int(side * side * density)
+        row = {'side': side, 'mines': mines}
+        safe = (side // 2, side // 2)
+        row['sampled'] = time_board(lambda state: state.create_board(safe=safe), side, side, mines, seed)
+        if minesweeper.np is not None:
+            numpy = minesweeper.np
+            minesweeper.np = None
+            try:
+                row['pure_python'] = time_board(lambda state: state.create_board(safe=safe), side, side, mines, seed)
+            finally:
+                minesweeper.np = numpy
+        if side <= nested_limit:
+            row['nested'] = time_board(create_board_nested, side, side, mines, seed)
+        results.append(row)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minesweeper board generation benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 300, 1000])
+    parser.add_argument('--density', type=float, default=0.15)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--nested-limit', type=int, default=300,
+                        help="largest side length to run the original nested-loop generator on")
+    args = parser.parse_args()
+    print(f"numpy: {'yes' if minesweeper.np is not None else 'no'}")
+    for row in run(args.sizes, args.density, args.seed, args.nested_limit):
+        timings = ', '.join(f"{name} {row[name] * 1000:.1f}ms"
+                            for name in ('sampled', 'pure_python', 'nested') if name in row)
+        print(f"{row['side']}x{row['side']} ({row['mines']} mines): {timings}")
@@ -0,0 +1,74 @@
+import argparse
+import random
+import time
+
+from engines.pong import PongState
+
+
+class FastPong(PongState):
+    # Starts fast and is allowed to reach several ball widths per tick.
+    def __init__(self, speed):
+        self.BALL_SPEED = speed
+        self.MAX_BALL_SPEED = speed * 2
+        super().__init__()
+
+
+class WallPong(FastPong):
+    # Paddles as tall as the court: every point scored is a tunnelling bug.
+    PADDLE_HEIGHT = PongState.HEIGHT
+
+    def __init__(self, speed):
+        super().__init__(speed)
+        self.paddle_y = [0.0, 0.0]
+
+
+def overlaps(state, player):
+    x1, y1, x2, y2 = state.paddle_coords(player)
+    bx1, by1, bx2, by2 = state.ball_coords()
+    return x1 < bx2 and x2 > bx1 and y1 < by2 and y2 > by1
+
+
+def run_walls(ticks, speed):
+    state = WallPong(speed)
+    for _ in range(ticks):
+        state.step()
+    return sum(state.scores), state.hits
+
+
+def run_random(ticks, speed, rng):
+    # Random paddle movement. Checks that the ball stays on the court and is
+    # never left inside the paddle it is heading for.
+    state = FastPong(speed)
+    escaped = stuck = 0
+    bottom = state.HEIGHT - state.BALL_SIZE
+    for _ in range(ticks):
+        if rng.random() < 0.05:
+            state.set_paddle(rng.randrange(2), rng.choice((-1, 0, 1)))
+        state.step()
+        if not 0 <= state.ball_y <= bottom:
+            escaped += 1
+        if overlaps(state, 0 if state.ball_dx < 0 else 1):
+            stuck += 1
+    return state.scores, state.hits, escaped, stuck
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Pong physics stress test at high ball speed")
+    parser.add_argument('--ticks', type=int, default=2000000)
+    parser.add_argument('--speed', type=float, default=40, help="starting ball speed in pixels per tick")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tunnelled, hits = run_walls(args.ticks, args.speed)
+    elapsed = time.perf_counter() - start
+    print(f"walls:  {args.ticks} ticks in {elapsed:.1f}s ({args.ticks / elapsed:,.0f} ticks/s), "
+          f"{hits} paddle hits, {tunnelled} tunnelled")
+
+    start = time.perf_counter()
+    scores, hits, escaped, stuck = run_random(args.ticks, args.speed, random.Random(args.seed))
+    elapsed = time.perf_counter() - start
+    print(f"random: {args.ticks} ticks in {elapsed:.1f}s ({args.ticks / elapsed:,.0f} ticks/s), "
+          f"{hits} paddle hits, score {scores[0]}:{scores[1]}, {escaped} off court, {stuck} stuck in a paddle")
+    if tunnelled or escaped or stuck:
+        raise SystemExit(1)
@@ -0,0 +1,61 @@
+import argparse
+import random
+import time
+
+from engines.rock_paper_scissors import OUTCOMES
+from engines.rps_ai import RPSPredictor
+
+
+def synthetic_player(rng):
+    # The habits a synthetic player switches between, one per window of
+    # moves: a fixed cycle, a bias towards rock, beating the computer's
+    # last move, and uniform noise. Each maps (move number, computer's last
+    # move) to the player's move.
+    def cycle(i, last):
+        return i % 3
+
+    def biased(i, last):
+        return 0 if rng.random() < 0.5 else rng.randrange(3)
+
+    def counter(i, last):
+        return (last + 1) % 3
+
+    def noise(i, last):
+        return rng.randrange(3)
+    return [cycle, biased, counter, noise]
+
+
+def run(moves, windows, seed):
+    rng = random.Random(seed)
+    predictor = RPSPredictor(random.Random(seed + 1))
+    habits = synthetic_player(rng)
+    segment = moves // windows
+    rows = []
+    last = 0
+    for window in range(windows):
+        habit = habits[window % len(habits)]
+        outcomes = [0, 0, 0]
+        start = time.perf_counter()
+        for i in range(segment):
+            player = habit(i, last)
+            last = predictor.choose()
+            predictor.update(player, last)
+            outcomes[OUTCOMES[player][last]] += 1
+        elapsed = time.perf_counter() - start
+        rows.append((window * segment, habit.__name__, elapsed / segment, outcomes))
+    return rows, sum(len(p.counts) for p in predictor.predictors)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Adaptive Rock-Paper-Scissors predictor over a long synthetic history")
+    parser.add_argument('--moves', type=int, default=1000000)
+    parser.add_argument('--windows', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rows, entries = run(args.moves, args.windows, args.seed)
+    print(f"{'from move':>10} {'player':>8} {'per move':>9} {'player':>7} {'computer':>9} {'draws':>6}")
+    for first, habit, per_move, (draws, wins, losses) in rows:
+        total = draws + wins + losses
+        print(f"{first:>10} {habit:>8} {per_move * 1e6:>7.1f}us {wins / total:>7.1%} {losses / total:>9.1%} "
+              f"{draws / total:>6.1%}")
+    print(f"{entries} counts held, independent of history length")
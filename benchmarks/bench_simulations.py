@@ -0,0 +1,126 @@
+import argparse
+import random
+import string
+import time
+
+from engines.connect_four import ConnectFourState
+from engines.hangman import HangmanState
+from engines.memory import MemoryState
+from engines.minesweeper import MinesweeperState
+from engines.number_guessing import NumberGuessingState
+from engines.pong import PongState
+from engines.rock_paper_scissors import RockPaperScissorsState
+from engines.snake import DIRECTIONS, SnakeState
+from engines.tictactoe import TicTacToeState
+
+
+def play_memory(rng):
+    state = MemoryState(4, 4, rng)
+    cells = [(r, c) for r in range(4) for c in range(4)]
+    while not state.is_over:
+        hidden = [cell for cell in cells if not state.shown[cell[0]][cell[1]]]
+        for row, col in rng.sample(hidden, 2):
+            state.apply_move(row, col)
+        state.check_match()
+
+
+def play_minesweeper(rng):
+    state = MinesweeperState(10, 10, 15, rng)
+    state.create_board()
+    cells = [(r, c) for r in range(10) for c in range(10)]
+    rng.shuffle(cells)
+    for row, col in cells:
+        state.apply_move(row, col)
+        if state.is_over:
+            break
+
+
+def play_tictactoe(rng):
+    state = TicTacToeState()
+    while not state.is_over:
+        state.apply_move(*rng.choice(state.valid_moves()))
+
+
+def play_connect_four(rng):
+    state = ConnectFourState()
+    while not state.is_over:
+        state.apply_move(rng.choice(state.valid_moves()))
+
+
+def play_snake(rng):
+    state = SnakeState(20, 20, rng=rng)
+    names = list(DIRECTIONS)
+    for _ in range(500):
+        if rng.random() < 0.2:
+            state.direction = rng.choice(names)
+        if state.step() is None:
+            break
+
+
+def play_pong(rng):
+    state = PongState()
+    for _ in range(1000):
+        if rng.random() < 0.05:
+            state.set_paddle(rng.randrange(2), rng.choice((-1, 0, 1)))
+        state.step()
+
+
+def play_hangman(rng):
+    state = HangmanState(rng=rng)
+    letters = list(string.ascii_lowercase)
+    rng.shuffle(letters)
+    for letter in letters:
+        state.apply_move(letter)
+        if state.is_over:
+            break
+
+
+def play_number_guessing(rng):
+    state = NumberGuessingState(rng=rng)
+    low, high = state.low, state.high
+    while True:
+        guess = (low + high) // 2
+        outcome = state.apply_move(guess)
+        if outcome == 'correct':
+            break
+        if outcome == 'low':
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def play_rock_paper_scissors(rng):
+    state = RockPaperScissorsState(rng)
+    for _ in range(10):
+        state.apply_move(rng.choice(state.choices))
+
+
+GAMES = {
+    'memory': play_memory,
+    'minesweeper': play_minesweeper,
+    'tictactoe': play_tictactoe,
+    'connect_four': play_connect_four,
+    'snake': play_snake,
+    'pong': play_pong,
+    'hangman': play_hangman,
+    'number_guessing': play_number_guessing,
+    'rock_paper_scissors': play_rock_paper_scissors,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless random playouts of every game engine")
+    parser.add_argument('--seconds', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('games', nargs='*', default=list(GAMES))
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    for name in args.games:
+        play = GAMES[name]
+        games = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < args.seconds:
+            play(rng)
+            games += 1
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20}: {games / elapsed * 60:12.0f} games/min")
@@ -0,0 +1,46 @@
+import argparse
+import time
+
+from engines.snake import DIRECTIONS, SnakeState
+from engines.snake_ai import hamiltonian_cycle
+
+
+def run(length, steps):
+    side = int(length ** 0.5) + 2
+    side += side % 2
+    cycle = hamiltonian_cycle(side, side)
+    names = {delta: name for name, delta in DIRECTIONS.items()}
+    turns = [names[(b[0] - a[0], b[1] - a[1])] for a, b in zip(cycle, cycle[1:] + cycle[:1])]
+
+    state = SnakeState(side, side, body=cycle[:length])
+    state.food = (-1, -1)
+    position = length - 1
+    start = time.perf_counter()
+    for _ in range(steps):
+        state.direction = turns[position]
+        if state.step() is None:
+            raise RuntimeError("snake crashed during benchmark")
+        position = (position + 1) % len(cycle)
+    elapsed = time.perf_counter() - start
+
+    body = list(state.body)
+    probe = state.head
+    start = time.perf_counter()
+    for _ in range(1000):
+        probe in body
+    list_scan = (time.perf_counter() - start) / 1000
+    start = time.perf_counter()
+    for _ in range(1000):
+        probe in state.free_index
+    set_lookup = (time.perf_counter() - start) / 1000
+    return elapsed, list_scan, set_lookup
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Snake stepping benchmark")
+    parser.add_argument('--length', type=int, default=10000)
+    parser.add_argument('--steps', type=int, default=100000)
+    args = parser.parse_args()
+    elapsed, list_scan, set_lookup = run(args.length, args.steps)
+    print(f"{args.steps} steps of a {args.length}-segment snake in {elapsed:.3f}s ({args.steps / elapsed:.0f} steps/s)")
+    print(f"collision test: list scan {list_scan * 1e6:.1f}us, free-cell index {set_lookup * 1e6:.3f}us")
@@ -0,0 +1,55 @@
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import time
+
+from engines.snake import SnakeState
+from engines.snake_ai import SnakeAutopilot
+
+
+def play(job):
+    # One headless game under the autopilot. Returns (side, steps, final
+    # length, won, seconds).
+    side, seed, max_steps = job
+    state = SnakeState(side, side, rng=random.Random(seed))
+    autopilot = SnakeAutopilot(state)
+    steps = 0
+    start = time.perf_counter()
+    while state.alive and not state.won and steps < max_steps:
+        state.direction = autopilot.choose()
+        state.step()
+        steps += 1
+    return side, steps, len(state.body), state.won, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Snake autopilot games on growing boards")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 40, 60, 80, 100],
+                        help="square board sides; both sides odd has no Hamiltonian cycle")
+    parser.add_argument('--games', type=int, default=4, help="games per size")
+    parser.add_argument('--max-steps', type=int, default=50000000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    jobs = [(side, args.seed * 1000003 + side * 1000 + i, args.max_steps)
+            for side in args.sizes for i in range(args.games)]
+    start = time.perf_counter()
+    if args.workers == 1:
+        results = list(map(play, jobs))
+    else:
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.map(play, jobs)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'board':>9} {'won':>6} {'mean steps':>12} {'mean length':>12} {'steps/s':>10}")
+    for side in args.sizes:
+        games = [result for result in results if result[0] == side]
+        won = sum(result[3] for result in games)
+        steps = sum(result[1] for result in games)
+        seconds = sum(result[4] for result in games)
+        print(f"{side:>4}x{side:<4} {won / len(games):>6.0%} {statistics.mean(r[1] for r in games):>12,.0f} "
+              f"{statistics.mean(r[2] for r in games):>12,.0f} {steps / seconds:>10,.0f}")
+    print(f"{len(results)} games on {args.workers} workers in {elapsed:.1f}s")
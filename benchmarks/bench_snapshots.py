@@ -0,0 +1,81 @@
+import argparse
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from engines.memory import MemoryState
+from engines.minesweeper import MinesweeperState
+from snapshots import (decode_memory, decode_minesweeper, decode_snapshot, decode_sudoku, encode_memory,
+                       encode_minesweeper, encode_snapshot, encode_sudoku, write_snapshot)
+
+
+def minesweeper_state(side, rng):
+    state = MinesweeperState(side, side, side * side // 6, rng)
+    state.create_board(safe=(side // 2, side // 2))
+    state.apply_move(side // 2, side // 2)
+    for _ in range(side):
+        state.toggle_flag(rng.randrange(side), rng.randrange(side))
+    return state
+
+
+def memory_state(rng):
+    state = MemoryState(10, 10, rng)
+    for _ in range(30):
+        row, col = rng.randrange(10), rng.randrange(10)
+        if state.apply_move(row, col) and state.second_card is not None:
+            state.check_match()
+    return state
+
+
+def cases(rng):
+    givens = [[rng.choice([0, 0, rng.randint(1, 9)]) for _ in range(9)] for _ in range(9)]
+    entries = [[0 if value else rng.randint(0, 9) for value in row] for row in givens]
+    return [
+        ('sudoku', 'sudoku', (givens, entries), lambda s: encode_sudoku(*s), decode_sudoku),
+        ('memory 10x10', 'memory', memory_state(rng), encode_memory, decode_memory),
+        ('minesweeper 100x100', 'minesweeper', minesweeper_state(100, rng), encode_minesweeper, decode_minesweeper),
+        ('minesweeper 1000x1000', 'minesweeper', minesweeper_state(1000, rng), encode_minesweeper, decode_minesweeper),
+    ]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def run(repeat, seed):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.snap')
+        for name, game, state, encode, decode in cases(random.Random(seed)):
+            runs = repeat if 'x1000' not in name else max(1, repeat // 20)
+
+            def save():
+                data = encode_snapshot(game, encode(state))
+                write_snapshot(path, data)
+                return data
+
+            def load():
+                with open(path, 'rb') as f:
+                    return decode(decode_snapshot(f.read(), game))
+
+            data, save_time = timed(save, runs)
+            _, load_time = timed(load, runs)
+            pickled = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+            _, pickle_load = timed(lambda: pickle.loads(pickled), runs)
+            results.append((name, len(data), save_time, load_time, len(pickled), pickle_load))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot size and save/load latency")
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for name, size, save_time, load_time, pickled, pickle_load in run(args.repeat, args.seed):
+        print(f"{name}: {size} bytes, save {save_time * 1000:.2f}ms, load {load_time * 1000:.2f}ms "
+              f"(pickle {pickled} bytes, load {pickle_load * 1000:.2f}ms)")
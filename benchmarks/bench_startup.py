@@ -0,0 +1,47 @@
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+try:
+    root = main.tk.Tk()
+except main.tk.TclError:
+    print(imported - start, -1)
+else:
+    main.GameLauncher(root)
+    root.update()
+    print(imported - start, time.perf_counter() - start)
+    root.destroy()
+'''
+
+
+def measure(runs):
+    # Each run is a fresh interpreter so module caches do not hide the cost.
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, capture_output=True, text=True, check=True)
+        import_time, first_frame = (float(value) for value in out.stdout.split())
+        samples.append((import_time, first_frame))
+    return samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Launcher cold-start benchmark")
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    samples = measure(args.runs)
+    imports = sorted(sample[0] for sample in samples)
+    frames = sorted(sample[1] for sample in samples if sample[1] >= 0)
+    print(f"import main: median {imports[len(imports) // 2] * 1000:.1f}ms over {len(imports)} runs")
+    if frames:
+        print(f"first frame: median {frames[len(frames) // 2] * 1000:.1f}ms over {len(frames)} runs")
+    else:
+        print("first frame: no display available")
@@ -0,0 +1,65 @@
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.suite import HARD_PUZZLES
+from engines.sudoku_dlx import SudokuDLX, format_grid, make_puzzle, parse_grid
+from engines.sudoku_solver import SudokuSolver
+
+
+def build_corpus(box, count, clues, seed):
+    rng = random.Random(seed)
+    return [make_puzzle(box, clues, rng) for _ in range(count)]
+
+
+def load_corpus(path):
+    with open(path) as f:
+        return [parse_grid(line) for line in f if line.strip() and not line.startswith('#')]
+
+
+def time_each(puzzles, run):
+    times = []
+    for cells in puzzles:
+        start = time.perf_counter()
+        run(cells)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(name, times):
+    print(f"{name:<28} median {statistics.median(times) * 1000:9.1f}ms  max {max(times) * 1000:9.1f}ms  "
+          f"total {sum(times):7.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dancing Links Sudoku solver on a corpus of large puzzles")
+    parser.add_argument('--corpus', help="puzzle file, one grid per line (default: generate one)")
+    parser.add_argument('--save', help="write the generated corpus to this file")
+    parser.add_argument('--box', type=int, default=5, help="box side of generated puzzles (5 = 25x25)")
+    parser.add_argument('--count', type=int, default=10)
+    parser.add_argument('--clues', type=float, default=0.6, help="share of cells given in generated puzzles")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus:
+        puzzles = load_corpus(args.corpus)
+    else:
+        start = time.perf_counter()
+        puzzles = build_corpus(args.box, args.count, int(args.box ** 4 * args.clues), args.seed)
+        print(f"generated {len(puzzles)} unique puzzles in {time.perf_counter() - start:.1f}s")
+        if args.save:
+            with open(args.save, 'w') as f:
+                f.writelines(format_grid(cells) + '\n' for cells in puzzles)
+
+    size = round(len(puzzles[0]) ** 0.5)
+    report(f"{size}x{size} build", time_each(puzzles, SudokuDLX))
+    report(f"{size}x{size} solve", time_each(puzzles, lambda cells: SudokuDLX(cells).solve()))
+    counts = []
+    report(f"{size}x{size} count (limit 2)",
+           time_each(puzzles, lambda cells: counts.append(SudokuDLX(cells).count_solutions(2))))
+    print(f"{counts.count(1)}/{len(puzzles)} puzzles have a unique solution")
+
+    hard = [list(SudokuSolver(p).cells) for p in HARD_PUZZLES]
+    report("9x9 hard, dancing links", time_each(hard, lambda cells: SudokuDLX(cells).solve()))
+    report("9x9 hard, bitmask solver", time_each(hard, lambda cells: SudokuSolver(cells).solve()))
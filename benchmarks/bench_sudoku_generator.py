@@ -0,0 +1,28 @@
+import argparse
+import random
+import time
+
+from engines.sudoku_generator import TIERS, generate, grade
+
+
+def run(count, seed):
+    rng = random.Random(seed)
+    results = {}
+    for tier in TIERS:
+        start = time.perf_counter()
+        hits = 0
+        for _ in range(count):
+            if grade(generate(tier, rng)) == tier:
+                hits += 1
+        elapsed = time.perf_counter() - start
+        results[tier] = (count / elapsed, hits)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sudoku generator throughput per difficulty tier")
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for tier, (rate, hits) in run(args.count, args.seed).items():
+        print(f"{tier:>8}: {rate:8.2f} puzzles/s  ({hits}/{args.count} graded as {tier})")
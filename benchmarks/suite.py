@@ -0,0 +1,323 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from engines.connect_four import ConnectFourState
+from engines.memory import MemoryState
+from engines.minesweeper import MinesweeperState
+from engines.rps_ai import RPSPredictor
+from engines.snake import DIRECTIONS, SnakeState
+from engines.snake_ai import hamiltonian_cycle
+from engines.sudoku_dlx import SudokuDLX, make_puzzle
+from engines.sudoku_solver import SudokuSolver
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+THRESHOLD = 0.25
+
+HARD_PUZZLES = [
+    "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "1.......2.9.4...5...6...7...5.9.3.......7.......85..4.7.....6...3...9.8...2.....1",
+    "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "..1..4.......6.3.5...9.....8.....7.3.......285...7.6..3...8...6..92......4...1...",
+]
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    # A benchmark is a setup function returning (run, iterations): run() is
+    # timed and its time divided by iterations.
+    def decorate(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorate
+
+
+@benchmark('sudoku.solve_hard')
+def sudoku_solve_hard():
+    def run():
+        for puzzle in HARD_PUZZLES:
+            SudokuSolver(puzzle).solve()
+    return run, len(HARD_PUZZLES)
+
+
+@benchmark('sudoku.dlx_hard')
+def sudoku_dlx_hard():
+    def run():
+        for puzzle in HARD_PUZZLES:
+            SudokuDLX(puzzle).solve()
+    return run, len(HARD_PUZZLES)
+
+
+@benchmark('sudoku.dlx_25')
+def sudoku_dlx_25():
+    # Uniqueness is not needed to time a solve, and skipping it keeps the
+    # setup fast.
+    puzzle = make_puzzle(5, 375, random.Random(0), unique=False)
+
+    def run():
+        SudokuDLX(puzzle).solve()
+    return run, 1
+
+
+def minesweeper_create(side):
+    def setup():
+        rng = random.Random(0)
+
+        def run():
+            MinesweeperState(side, side, side * side // 6, rng).create_board(safe=(side // 2, side // 2))
+        return run, 1
+    return setup
+
+
+for side in (10, 100, 300):
+    benchmark(f'minesweeper.create_board.{side}')(minesweeper_create(side))
+
+
+def minesweeper_reveal(side):
+    # One flood fill that opens most of a sparse board.
+    def setup():
+        state = MinesweeperState(side, side, side * side // 50, random.Random(0))
+        state.create_board(safe=(side // 2, side // 2))
+        board = state.board
+
+        def run():
+            fresh = MinesweeperState(side, side, state.mines)
+            fresh.board = board
+            fresh.generated = True
+            fresh.apply_move(side // 2, side // 2)
+        return run, 1
+    return setup
+
+
+for side in (30, 100, 300):
+    benchmark(f'minesweeper.reveal.{side}')(minesweeper_reveal(side))
+
+
+@benchmark('connect_four.check_winner')
+def connect_four_check_winner():
+    # Random games, so every apply_move runs the bitboard four-in-a-row test.
+    rng = random.Random(0)
+    games = []
+    for _ in range(200):
+        state = ConnectFourState()
+        moves = []
+        while not state.is_over:
+            col = rng.choice(state.valid_moves())
+            state.apply_move(col)
+            moves.append(col)
+        games.append(moves)
+    total = sum(len(moves) for moves in games)
+
+    def run():
+        for moves in games:
+            state = ConnectFourState()
+            for col in moves:
+                state.apply_move(col)
+    return run, total
+
+
+@benchmark('snake.step')
+def snake_step():
+    side = 32
+    cycle = hamiltonian_cycle(side, side)
+    names = {delta: name for name, delta in DIRECTIONS.items()}
+    turns = [names[(b[0] - a[0], b[1] - a[1])] for a, b in zip(cycle, cycle[1:] + cycle[:1])]
+    length, steps = 500, 20000
+
+    def run():
+        state = SnakeState(side, side, body=cycle[:length])
+        state.food = (-1, -1)
+        position = length - 1
+        for _ in range(steps):
+            state.direction = turns[position]
+            state.step()
+            position = (position + 1) % len(cycle)
+    return run, steps
+
+
+@benchmark('rock_paper_scissors.predict')
+def rock_paper_scissors_predict():
+    # A long history first, so the timed moves show that the cost per move
+    # does not grow with it.
+    rng = random.Random(0)
+    predictor = RPSPredictor(random.Random(1))
+    for _ in range(100000):
+        predictor.update(rng.randrange(3), predictor.choose())
+    moves = [rng.randrange(3) for _ in range(10000)]
+
+    def run():
+        for player in moves:
+            predictor.update(player, predictor.choose())
+    return run, len(moves)
+
+
+@benchmark('memory.generate_board')
+def memory_generate_board():
+    rng = random.Random(0)
+
+    def run():
+        for _ in range(100):
+            MemoryState(10, 10, rng)
+    return run, 100
+
+
+# The widget benchmarks need a display. The checked-in baseline has no
+# entries for them, so they are only compared against a baseline saved on
+# the same machine.
+tk_root = None
+
+
+def widget_root():
+    # One hidden Tk root shared by every widget benchmark; None without a
+    # display.
+    global tk_root
+    if tk_root is None:
+        import tkinter as tk
+        try:
+            tk_root = tk.Tk()
+        except tk.TclError:
+            return None
+        tk_root.withdraw()
+    return tk_root
+
+
+def grid_widgets(rows, columns, cell_size):
+    def setup():
+        import tkinter as tk
+        from grid_canvas import GridCanvas
+        root = widget_root()
+        if root is None:
+            return None
+
+        def run():
+            window = tk.Toplevel(root)
+            GridCanvas(window, rows, columns, cell_size=cell_size).pack()
+            window.update_idletasks()
+            window.destroy()
+        return run, 1
+    return setup
+
+
+benchmark('widgets.tictactoe_grid')(grid_widgets(3, 3, 100))
+benchmark('widgets.memory_grid')(grid_widgets(10, 10, 60))
+benchmark('widgets.minesweeper_grid')(grid_widgets(10, 10, 24))
+
+
+def measure(setup, repeat, min_time):
+    # Repeats run() until min_time has passed per sample; reports seconds
+    # per iteration.
+    prepared = setup()
+    if prepared is None:
+        return None
+    run, iterations = prepared
+    run()
+    samples = []
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        samples.append(elapsed / (loops * iterations))
+    return {'median_s': statistics.median(samples), 'min_s': min(samples), 'samples': len(samples)}
+
+
+def run_suite(selected, repeat, min_time):
+    global tk_root
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        result = measure(setup, repeat, min_time)
+        if result is not None:
+            results[name] = result
+    if tk_root is not None:
+        tk_root.destroy()
+        tk_root = None
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    # Returns (name, baseline seconds, current seconds, ratio) rows and the
+    # names that got slower than the threshold allows. Medians are compared.
+    rows, regressions = [], []
+    for name, result in report['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        ratio = result['median_s'] / before['median_s']
+        rows.append((name, before['median_s'], result['median_s'], ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hot-path benchmark suite with baseline comparison")
+    parser.add_argument('benchmarks', nargs='*', help="name prefixes to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds per sample")
+    parser.add_argument('--json', help="write the results to this file ('-' for stdout)")
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="allowed slowdown against the baseline before failing (0.25 = 25%%)")
+    parser.add_argument('--list', action='store_true')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        sys.exit(0)
+
+    report = run_suite(args.benchmarks, args.repeat, args.min_time)
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    rows, regressions = compare(report, baseline, args.threshold) if baseline else ([], [])
+    compared = {name: (before, ratio) for name, before, _, ratio in rows}
+    if args.json != '-':
+        for name, result in report['results'].items():
+            line = f"{name:<32} {format_time(result['median_s']):>10}"
+            if name in compared:
+                before, ratio = compared[name]
+                flag = "  REGRESSION" if name in regressions else ""
+                line += f"   baseline {format_time(before):>10}  x{ratio:.2f}{flag}"
+            print(line)
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,56 @@
+from engines.cards import Hand, Shoe
+
+
+DEALER_STANDS = 17
+
+
+def dealer_should_hit(hand):
+    # The dealer draws to 17 and stands on every 17, soft ones included.
+    return hand.value < DEALER_STANDS
+
+
+def settle(player_value, dealer_value):
+    # Ties go to the dealer.
+    if player_value > 21:
+        return 'dealer'
+    if dealer_value > 21 or player_value > dealer_value:
+        return 'player'
+    return 'dealer'
+
+
+class BlackjackState:
+    def __init__(self, shoe=None):
+        self.shoe = shoe or Shoe()
+        self.deal()
+
+
+    def deal(self):
+        if self.shoe.needs_shuffle:
+            self.shoe.shuffle()
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        self.game_over = False
+        self.winner = None
+        for _ in range(2):
+            self.player_hand.add_card(self.shoe.draw_card())
+            self.dealer_hand.add_card(self.shoe.draw_card())
+
+
+    def hit(self):
+        if self.game_over:
+            return None
+        card = self.shoe.draw_card()
+        self.player_hand.add_card(card)
+        if self.player_hand.value > 21:
+            self.game_over = True
+            self.winner = 'dealer'
+        return card
+
+
+    def stand(self):
+        if self.game_over:
+            return
+        while dealer_should_hit(self.dealer_hand):
+            self.dealer_hand.add_card(self.shoe.draw_card())
+        self.winner = settle(self.player_hand.value, self.dealer_hand.value)
+        self.game_over = True
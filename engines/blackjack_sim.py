@@ -0,0 +1,179 @@
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from engines.blackjack import DEALER_STANDS
+from engines.cards import DECK_SIZE, VALUE, Shoe
+
+
+UPCARDS = list(range(1, 11))
+BUST = 22
+# Probability of drawing each value from an infinite shoe.
+DRAW = {value: (4 if value == 10 else 1) / 13 for value in range(1, 11)}
+
+
+def dealer_outcomes(samples, rng):
+    # Monte Carlo estimate of the dealer's final total (BUST for over 21)
+    # for each upcard value, drawing from an infinite shoe.
+    outcomes = {}
+    for up in UPCARDS:
+        counts = {}
+        for _ in range(samples):
+            hard, ace = up, up == 1
+            while True:
+                total = hard + 10 if ace and hard <= 11 else hard
+                if total >= DEALER_STANDS:
+                    break
+                value = VALUE[rng.randrange(DECK_SIZE)]
+                hard += value
+                ace = ace or value == 1
+            final = BUST if total > 21 else total
+            counts[final] = counts.get(final, 0) + 1
+        outcomes[up] = {final: count / samples for final, count in counts.items()}
+    return outcomes
+
+
+def stand_ev(total, outcomes):
+    # Ties go to the dealer, so only a higher total or a dealer bust wins.
+    if total > 21:
+        return -1.0
+    win = sum(p for final, p in outcomes.items() if final == BUST or final < total)
+    return win - (1 - win)
+
+
+def basic_strategy(outcomes):
+    # Exact expected values over an infinite shoe given the dealer outcome
+    # estimates: for each (hard total, holds an ace, upcard), whether hitting
+    # beats standing. Totals only grow, so the recursion terminates.
+    strategy = {}
+    values = {}
+
+    def ev(hard, ace, up):
+        key = (hard, ace, up)
+        if key in values:
+            return values[key]
+        total = hard + 10 if ace and hard <= 11 else hard
+        stand = stand_ev(total, outcomes[up])
+        hit = 0.0
+        for value, p in DRAW.items():
+            if hard + value > 21:
+                hit -= p
+            else:
+                hit += p * ev(hard + value, ace or value == 1, up)
+        strategy[key] = hit > stand
+        values[key] = max(hit, stand)
+        return values[key]
+
+    for up in UPCARDS:
+        for hard in range(2, 22):
+            for ace in (False, True):
+                ev(hard, ace, up)
+    return strategy, values
+
+
+def hit_table(strategy):
+    # Flattened for the simulation loop: index ((soft << 5) | total) * 11 + upcard.
+    table = bytearray(2 * 32 * 11)
+    for (hard, ace, up), hit in strategy.items():
+        soft = ace and hard <= 11
+        total = hard + 10 if soft else hard
+        table[((soft << 5) | total) * 11 + up] = hit
+    return bytes(table)
+
+
+def play_hands(job):
+    # Plays hands through a real shoe, reshuffling at the cut card. Hand
+    # values are tracked incrementally as in Hand, but with plain ints so the
+    # loop stays tight. Returns (hands, net units, wins, player busts).
+    hands, seed, decks, penetration, table = job
+    shoe = Shoe(decks, penetration, random.Random(seed))
+    draw = shoe.draw_card
+    net = wins = busts = 0
+    for _ in range(hands):
+        if shoe.needs_shuffle:
+            shoe.shuffle()
+        p1, d1, p2, d2 = draw(), draw(), draw(), draw()
+        hard = VALUE[p1] + VALUE[p2]
+        ace = p1 < 4 or p2 < 4
+        up = VALUE[d1]
+        while True:
+            soft = ace and hard <= 11
+            total = hard + 10 if soft else hard
+            if total >= 21 or not table[((soft << 5) | total) * 11 + up]:
+                break
+            card = draw()
+            hard += VALUE[card]
+            ace = ace or card < 4
+        if total > 21:
+            net -= 1
+            busts += 1
+            continue
+
+        dealer = up + VALUE[d2]
+        dealer_ace = d1 < 4 or d2 < 4
+        while True:
+            dealer_total = dealer + 10 if dealer_ace and dealer <= 11 else dealer
+            if dealer_total >= DEALER_STANDS:
+                break
+            card = draw()
+            dealer += VALUE[card]
+            dealer_ace = dealer_ace or card < 4
+        if dealer_total > 21 or total > dealer_total:
+            net += 1
+            wins += 1
+        else:
+            net -= 1
+    return hands, net, wins, busts
+
+
+def simulate(hands, workers, decks, penetration, table, seed):
+    chunks = workers * 4
+    jobs = [(hands // chunks + (i < hands % chunks), seed * 1000003 + i, decks, penetration, table)
+            for i in range(chunks)]
+    if workers == 1:
+        results = list(map(play_hands, jobs))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(play_hands, jobs)
+    return tuple(map(sum, zip(*results)))
+
+
+def format_strategy(strategy):
+    header = '      ' + ' '.join(f"{'A' if up == 1 else up:>2}" for up in UPCARDS[1:] + [1])
+    lines = ["Hard totals (H = hit, S = stand):", header]
+    for total in range(5, 21):
+        row = [strategy[(total, False, up)] for up in UPCARDS[1:] + [1]]
+        lines.append(f"{total:>5} " + ' '.join(f"{'H' if hit else 'S':>2}" for hit in row))
+    lines += ["", "Soft totals:", header]
+    for total in range(13, 21):
+        row = [strategy[(total - 10, True, up)] for up in UPCARDS[1:] + [1]]
+        lines.append(f" A,{total - 11:<2} " + ' '.join(f"{'H' if hit else 'S':>2}" for hit in row))
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo house edge and basic strategy for the launcher's "
+                                                 "Blackjack rules (dealer stands on 17, ties lose)")
+    parser.add_argument('--hands', type=int, default=1000000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--penetration', type=float, default=0.75)
+    parser.add_argument('--dealer-samples', type=int, default=200000,
+                        help="dealer hands per upcard used to estimate the strategy")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    outcomes = dealer_outcomes(args.dealer_samples, random.Random(args.seed))
+    strategy, _ = basic_strategy(outcomes)
+    print(format_strategy(strategy))
+    print(f"\nstrategy estimated in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    hands, net, wins, busts = simulate(args.hands, args.workers, args.decks, args.penetration,
+                                       hit_table(strategy), args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{hands} hands on {args.workers} workers in {elapsed:.1f}s ({hands / elapsed:,.0f} hands/s)")
+    print(f"house edge {-net / hands:.2%}  player wins {wins / hands:.2%}  player busts {busts / hands:.2%}")
@@ -0,0 +1,101 @@
+import random
+
+
+# A card is an int 0..51: rank * 4 + suit, with ranks ace..king as 0..12.
+RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+SUITS = ['♠', '♥', '♦', '♣']
+DECK_SIZE = 52
+
+# Blackjack value of every card with aces counted as 1.
+VALUE = [min(card // 4 + 1, 10) for card in range(DECK_SIZE)]
+
+
+def rank_of(card):
+    return card >> 2
+
+
+def suit_of(card):
+    return card & 3
+
+
+def is_red(card):
+    return suit_of(card) in (1, 2)
+
+
+def card_name(card):
+    return RANKS[card >> 2] + SUITS[card & 3]
+
+
+class Hand:
+    # Keeps the hard total (aces as 1) and whether there is an ace as cards
+    # arrive; one ace can count 11 whenever that does not bust the hand.
+    __slots__ = ('cards', 'hard', 'aces')
+
+    def __init__(self):
+        self.cards = []
+        self.hard = 0
+        self.aces = 0
+
+
+    def add_card(self, card):
+        self.cards.append(card)
+        self.hard += VALUE[card]
+        if card < 4:
+            self.aces += 1
+
+
+    @property
+    def soft(self):
+        return self.aces > 0 and self.hard <= 11
+
+
+    @property
+    def value(self):
+        return self.hard + 10 if self.soft else self.hard
+
+
+    def get_value(self):
+        return self.value
+
+
+    def __len__(self):
+        return len(self.cards)
+
+
+    def __str__(self):
+        return ', '.join(card_name(card) for card in self.cards)
+
+
+class Shoe:
+    # One or more decks shuffled together. Cards are dealt from the end of
+    # the list; once the cut card (penetration) is passed, needs_shuffle is
+    # set and the owner reshuffles between rounds. An empty shoe reshuffles
+    # on its own.
+    def __init__(self, decks=1, penetration=0.75, rng=random):
+        self.decks = decks
+        self.rng = rng
+        self.cards = []
+        self.cut = 0
+        self.penetration = penetration
+        self.shuffle()
+
+
+    def shuffle(self):
+        self.cards = list(range(DECK_SIZE)) * self.decks
+        self.rng.shuffle(self.cards)
+        self.cut = int(len(self.cards) * (1 - self.penetration))
+
+
+    @property
+    def needs_shuffle(self):
+        return len(self.cards) <= self.cut
+
+
+    def draw_card(self):
+        if not self.cards:
+            self.shuffle()
+        return self.cards.pop()
+
+
+    def __len__(self):
+        return len(self.cards)
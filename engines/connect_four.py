@@ -0,0 +1,84 @@
+ROWS = 6
+COLUMNS = 7
+STRIDE = ROWS + 1
+
+BOTTOM_ROW = sum(1 << (col * STRIDE) for col in range(COLUMNS))
+FULL_BOARD = BOTTOM_ROW * ((1 << ROWS) - 1)
+
+
+def bottom_mask(col):
+    return 1 << (col * STRIDE)
+
+
+def top_mask(col):
+    return 1 << (col * STRIDE + ROWS - 1)
+
+
+def column_mask(col):
+    return ((1 << ROWS) - 1) << (col * STRIDE)
+
+
+def has_four(pieces):
+    # Columns are stored bottom-up in STRIDE-bit groups with a spare bit on
+    # top, so shifting by 1, STRIDE, STRIDE - 1 and STRIDE + 1 walks the
+    # vertical, horizontal and both diagonal directions without wrapping.
+    for shift in (1, STRIDE, STRIDE - 1, STRIDE + 1):
+        pairs = pieces & (pieces >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+class ConnectFourState:
+    def __init__(self):
+        self.rows = ROWS
+        self.columns = COLUMNS
+        self.pieces = {'Red': 0, 'Yellow': 0}
+        self.mask = 0
+        self.heights = [0] * COLUMNS
+        self.turn = 'Red'
+        self.winner = None
+        self.moves = 0
+
+
+    def apply_move(self, col):
+        # Drops a piece for the player to move and returns the row it landed
+        # in (0 is the top row), or None if the move is not legal.
+        if self.is_over or not 0 <= col < self.columns or self.heights[col] == self.rows:
+            return None
+        height = self.heights[col]
+        bit = 1 << (col * STRIDE + height)
+        self.pieces[self.turn] |= bit
+        self.mask |= bit
+        self.heights[col] += 1
+        self.moves += 1
+        if has_four(self.pieces[self.turn]):
+            self.winner = self.turn
+        else:
+            self.turn = 'Yellow' if self.turn == 'Red' else 'Red'
+        return self.rows - 1 - height
+
+
+    def valid_moves(self):
+        if self.is_over:
+            return []
+        return [col for col in range(self.columns) if self.heights[col] < self.rows]
+
+
+    def piece_at(self, row, col):
+        bit = 1 << (col * STRIDE + self.rows - 1 - row)
+        for color, pieces in self.pieces.items():
+            if pieces & bit:
+                return color
+        return ''
+
+
+    def position(self):
+        # (pieces of the player to move, all pieces, moves played): the form
+        # the search works on.
+        return self.pieces[self.turn], self.mask, self.moves
+
+
+    @property
+    def is_over(self):
+        return self.winner is not None or self.moves == self.rows * self.columns
@@ -0,0 +1,172 @@
+import random
+import time
+
+from engines.connect_four import BOTTOM_ROW, COLUMNS, FULL_BOARD, ROWS, STRIDE, column_mask
+
+
+WIN_SCORE = 1000
+MAX_MOVES = ROWS * COLUMNS
+CENTER_ORDER = [3, 2, 4, 1, 5, 0, 6]
+EXACT, LOWER, UPPER = 0, 1, 2
+MAX_TABLE_SIZE = 1000000
+
+# difficulty: (max depth, seconds per move, chance of a random move)
+DIFFICULTIES = {
+    'easy': (2, 0.2, 0.3),
+    'medium': (6, 0.5, 0.0),
+    'hard': (MAX_MOVES, 2.0, 0.0),
+}
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def popcount(bits):
+    return bin(bits).count('1')
+
+
+def winning_cells(pieces, mask):
+    # Empty cells that would complete four in a row for `pieces`.
+    cells = (pieces << 1) & (pieces << 2) & (pieces << 3)
+    for shift in (STRIDE, STRIDE - 1, STRIDE + 1):
+        pair = (pieces << shift) & (pieces << 2 * shift)
+        cells |= pair & (pieces << 3 * shift)
+        cells |= pair & (pieces >> shift)
+        pair = (pieces >> shift) & (pieces >> 2 * shift)
+        cells |= pair & (pieces << shift)
+        cells |= pair & (pieces >> 3 * shift)
+    return cells & (FULL_BOARD ^ mask)
+
+
+class ConnectFourAI:
+    def __init__(self, difficulty='medium', time_budget=None, rng=random):
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        self.max_depth, budget, self.blunder_rate = DIFFICULTIES[difficulty]
+        self.time_budget = budget if time_budget is None else time_budget
+        self.rng = rng
+        self.table = {}
+        self.nodes = 0
+        self.deadline = None
+        self.task = None
+
+
+    def choose_move(self, position, task=None):
+        # position is ConnectFourState.position(): a snapshot, so the search
+        # can run on a worker thread while the board keeps changing.
+        pieces, mask, moves = position
+        legal = [col for col in CENTER_ORDER if not mask & (1 << (col * STRIDE + ROWS - 1))]
+        if not legal:
+            return None
+        if self.rng.random() < self.blunder_rate:
+            return self.rng.choice(legal)
+
+        if len(self.table) > MAX_TABLE_SIZE:
+            self.table.clear()
+        self.task = task
+        self.deadline = time.perf_counter() + self.time_budget
+        self.nodes = 0
+        best = legal[0]
+        for depth in range(1, min(self.max_depth, MAX_MOVES - moves) + 1):
+            try:
+                score, col = self.search_root(pieces, mask, moves, depth, legal)
+            except SearchTimeout:
+                break
+            best = col
+            if abs(score) > WIN_SCORE - MAX_MOVES - 1:
+                break
+        return best
+
+
+    def search_root(self, pieces, mask, moves, depth, legal):
+        entry = self.table.get(pieces + mask)
+        ordered = legal
+        if entry is not None and entry[3] in legal:
+            ordered = [entry[3]] + [col for col in legal if col != entry[3]]
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_score, best_col = alpha, ordered[0]
+        for col in ordered:
+            move = (mask + (1 << (col * STRIDE))) & column_mask(col)
+            if winning_cells(pieces, mask) & move:
+                return WIN_SCORE - moves - 1, col
+            score = -self.negamax(pieces ^ mask, mask | move, moves + 1, depth - 1, -beta, -alpha)
+            if score > best_score:
+                best_score, best_col = score, col
+                alpha = max(alpha, score)
+        self.table[pieces + mask] = (depth, EXACT, best_score, best_col)
+        return best_score, best_col
+
+
+    def negamax(self, pieces, mask, moves, depth, alpha, beta):
+        self.nodes += 1
+        if not self.nodes & 1023 and (time.perf_counter() > self.deadline or
+                                       (self.task is not None and self.task.cancelled)):
+            raise SearchTimeout()
+        if moves == MAX_MOVES:
+            return 0
+
+        possible = (mask + BOTTOM_ROW) & FULL_BOARD
+        mine = winning_cells(pieces, mask)
+        if possible & mine:
+            return WIN_SCORE - moves - 1
+        opponent = pieces ^ mask
+        theirs = winning_cells(opponent, mask)
+        forced = possible & theirs
+        if forced:
+            if forced & (forced - 1):
+                return -(WIN_SCORE - moves - 2)
+            possible = forced
+        # never play directly underneath a cell the opponent wins on
+        possible &= ~(theirs >> 1)
+        if not possible:
+            return -(WIN_SCORE - moves - 2)
+        if depth == 0:
+            return self.evaluate(pieces, mask, mine, theirs)
+
+        key = pieces + mask
+        alpha_orig = alpha
+        entry = self.table.get(key)
+        best_col = None
+        if entry is not None:
+            entry_depth, flag, value, best_col = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        ordered = CENTER_ORDER
+        if best_col is not None:
+            ordered = [best_col] + [col for col in CENTER_ORDER if col != best_col]
+        best_score = -WIN_SCORE - 1
+        for col in ordered:
+            move = possible & column_mask(col)
+            if not move:
+                continue
+            score = -self.negamax(opponent, mask | move, moves + 1, depth - 1, -beta, -alpha)
+            if score > best_score:
+                best_score, best_col = score, col
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (depth, flag, best_score, best_col)
+        return best_score
+
+
+    def evaluate(self, pieces, mask, mine, theirs):
+        center = column_mask(COLUMNS // 2)
+        return (2 * (popcount(mine) - popcount(theirs)) +
+                popcount(pieces & center) - popcount((pieces ^ mask) & center))
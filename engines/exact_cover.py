@@ -0,0 +1,142 @@
+class ExactCover:
+    # Knuth's Dancing Links over flat lists instead of node objects: node i
+    # has left[i], right[i], up[i], down[i], its column header column[i] and
+    # the row it belongs to in row_of[i]. Node 0 is the root and nodes
+    # 1..columns are the column headers, whose size[] counts their nodes.
+    def __init__(self, columns):
+        count = columns + 1
+        self.columns = columns
+        self.left = [i - 1 for i in range(count)]
+        self.left[0] = columns
+        self.right = [i + 1 for i in range(count)]
+        self.right[columns] = 0
+        self.up = list(range(count))
+        self.down = list(range(count))
+        self.column = list(range(count))
+        self.size = [0] * count
+        self.row_of = [-1] * count
+        self.rows = 0
+
+
+    def add_row(self, columns):
+        # columns are 0-based column numbers; returns the row's number.
+        row = self.rows
+        first = len(self.left)
+        last = first + len(columns) - 1
+        left, right, up, down = self.left, self.right, self.up, self.down
+        for node, col in enumerate(columns, first):
+            col += 1
+            left.append(node - 1 if node > first else last)
+            right.append(node + 1 if node < last else first)
+            up.append(up[col])
+            down.append(col)
+            down[up[col]] = node
+            up[col] = node
+            self.column.append(col)
+            self.row_of.append(row)
+            self.size[col] += 1
+        self.rows += 1
+        return row
+
+
+    def cover(self, col):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+
+    def uncover(self, col):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+
+    def solutions(self, limit=None):
+        # Algorithm X without recursion: stack holds the node chosen at each
+        # level. Yields each solution as a list of row numbers. The matrix is
+        # restored when the generator finishes or is closed early.
+        right, down, column, size, row_of = self.right, self.down, self.column, self.size, self.row_of
+        cover, uncover = self.cover, self.uncover
+        stack = []
+        found = 0
+        try:
+            while True:
+                col = right[0]
+                if col == 0:
+                    yield [row_of[node] for node in stack]
+                    found += 1
+                    if limit is not None and found >= limit:
+                        return
+                    node = None
+                else:
+                    # Branch on the column with the fewest remaining rows.
+                    best = col
+                    fewest = size[col]
+                    while fewest > 1:
+                        col = right[col]
+                        if not col:
+                            break
+                        if size[col] < fewest:
+                            best, fewest = col, size[col]
+                    node = None
+                    if fewest:
+                        cover(best)
+                        node = down[best]
+                        stack.append(node)
+                        j = right[node]
+                        while j != node:
+                            cover(column[j])
+                            j = right[j]
+                        continue
+                # Backtrack to the next untried row of the deepest level.
+                while stack:
+                    node = stack.pop()
+                    self.unselect(node)
+                    col = column[node]
+                    node = down[node]
+                    if node != col:
+                        stack.append(node)
+                        j = right[node]
+                        while j != node:
+                            cover(column[j])
+                            j = right[j]
+                        break
+                    uncover(col)
+                else:
+                    return
+        finally:
+            while stack:
+                node = stack.pop()
+                self.unselect(node)
+                uncover(column[node])
+
+
+    def unselect(self, node):
+        # Uncovers the other columns of a chosen row, in reverse order.
+        left, column = self.left, self.column
+        j = left[node]
+        while j != node:
+            self.uncover(column[j])
+            j = left[j]
+
+
+    def count_solutions(self, limit=None):
+        return sum(1 for _ in self.solutions(limit))
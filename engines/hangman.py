@@ -0,0 +1,42 @@
+import random
+
+
+WORD_LIST = ["python", "java", "hangman", "challenge", "tkinter"]
+
+
+class HangmanState:
+    def __init__(self, word_list=WORD_LIST, max_attempts=6, rng=random):
+        self.word = rng.choice(word_list)
+        self.guessed_letters = set()
+        self.max_attempts = max_attempts
+        self.attempts_left = max_attempts
+
+
+    def apply_move(self, letter):
+        letter = letter.lower()
+        if letter in self.guessed_letters or not letter.isalpha() or len(letter) != 1 or self.is_over:
+            return False
+        self.guessed_letters.add(letter)
+        if letter not in self.word:
+            self.attempts_left -= 1
+        return True
+
+
+    @property
+    def display_word(self):
+        return ''.join([letter if letter in self.guessed_letters else '_' for letter in self.word])
+
+
+    @property
+    def won(self):
+        return all(letter in self.guessed_letters for letter in self.word)
+
+
+    @property
+    def lost(self):
+        return self.attempts_left == 0
+
+
+    @property
+    def is_over(self):
+        return self.won or self.lost
@@ -0,0 +1,64 @@
+import random
+
+
+class MemoryState:
+    def __init__(self, rows, columns, rng=random):
+        self.rows = rows
+        self.columns = columns
+        self.rng = rng
+        self.turn = 0
+        self.scores = [0, 0]
+        self.first_card = None
+        self.second_card = None
+        self.shown = [[False for _ in range(columns)] for _ in range(rows)]
+        self.board = self.generate_board()
+
+
+    def generate_icons(self):
+        icons = []
+        for i in range((self.rows * self.columns) // 2):
+            icons.append(str(i))
+            icons.append(str(i))
+        self.rng.shuffle(icons)
+        return icons
+
+
+    def generate_board(self):
+        icons = self.generate_icons()
+        board = []
+        for row in range(self.rows):
+            board_row = []
+            for col in range(self.columns):
+                board_row.append(icons.pop() if icons else '')
+            board.append(board_row)
+        return board
+
+
+    def apply_move(self, row, col):
+        if self.shown[row][col] or self.second_card is not None or not self.board[row][col]:
+            return False
+        self.shown[row][col] = True
+        if self.first_card is None:
+            self.first_card = (row, col)
+        else:
+            self.second_card = (row, col)
+        return True
+
+
+    def check_match(self):
+        r1, c1 = self.first_card
+        r2, c2 = self.second_card
+        matched = self.board[r1][c1] == self.board[r2][c2]
+        if matched:
+            self.scores[self.turn] += 1
+        else:
+            self.shown[r1][c1] = self.shown[r2][c2] = False
+            self.turn = 1 - self.turn
+        self.first_card = None
+        self.second_card = None
+        return matched
+
+
+    @property
+    def is_over(self):
+        return sum(self.scores) == (self.rows * self.columns) // 2
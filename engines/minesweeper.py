@@ -0,0 +1,145 @@
+import random
+from bisect import bisect_right
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def safe_zone(rows, columns, mines, safe):
+    # Flat indices kept free of mines around the first click: the whole 3x3
+    # block when there is room for it, otherwise just the clicked cell.
+    if safe is None:
+        return []
+    row, col = safe
+    block = [r * columns + c for r in range(max(0, row-1), min(rows, row+2))
+             for c in range(max(0, col-1), min(columns, col+2))]
+    if rows * columns - len(block) >= mines:
+        return block
+    if rows * columns - 1 >= mines:
+        return [row * columns + col]
+    return []
+
+
+def place_mines(rows, columns, mines, rng=random, safe=None):
+    # Samples without replacement from the cells outside the safe zone by
+    # sampling positions in the shorter range and shifting them past the
+    # excluded indices.
+    excluded = sorted(safe_zone(rows, columns, mines, safe))
+    picks = rng.sample(range(rows * columns - len(excluded)), mines)
+    if not excluded:
+        return picks
+    shifted = []
+    for pick in picks:
+        skip = bisect_right(excluded, pick)
+        while skip < len(excluded) and excluded[skip] <= pick + skip:
+            skip += 1
+        shifted.append(pick + skip)
+    return shifted
+
+
+def neighbour_counts(rows, columns, mine_indices):
+    if np is not None:
+        mines = np.zeros((rows + 2, columns + 2), dtype=np.int8)
+        inner = mines[1:-1, 1:-1]
+        flat = np.zeros(rows * columns, dtype=np.int8)
+        flat[list(mine_indices)] = 1
+        inner[:, :] = flat.reshape(rows, columns)
+        counts = sum(mines[1 + dr:rows + 1 + dr, 1 + dc:columns + 1 + dc]
+                     for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+        counts[inner == 1] = -1
+        return counts.tolist()
+
+    # Separable 3x3 box sum: add horizontal neighbours row by row, then add
+    # the rows above and below. Mine cells are overwritten afterwards.
+    mine_rows = [[0] * columns for _ in range(rows)]
+    for index in mine_indices:
+        r, c = divmod(index, columns)
+        mine_rows[r][c] = 1
+    across = []
+    for row in mine_rows:
+        padded = [0] + row + [0]
+        across.append([a + b + c for a, b, c in zip(padded, padded[1:], padded[2:])])
+    zero = [0] * columns
+    board = []
+    for r in range(rows):
+        above = across[r - 1] if r else zero
+        below = across[r + 1] if r + 1 < rows else zero
+        board.append([a + b + c for a, b, c in zip(above, across[r], below)])
+    for index in mine_indices:
+        r, c = divmod(index, columns)
+        board[r][c] = -1
+    return board
+
+
+class MinesweeperState:
+    def __init__(self, rows, columns, mines, rng=random):
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.rng = rng
+        self.board = [[0] * columns for _ in range(rows)]
+        self.revealed = [[False] * columns for _ in range(rows)]
+        self.flagged = set()
+        self.revealed_count = 0
+        self.exploded = False
+        self.generated = False
+
+
+    def create_board(self, safe=None):
+        mine_indices = place_mines(self.rows, self.columns, self.mines, self.rng, safe)
+        self.board = neighbour_counts(self.rows, self.columns, mine_indices)
+        self.generated = True
+
+
+    def apply_move(self, row, col):
+        # Returns the cells opened by the move; stepping on a mine opens
+        # just that cell and sets exploded.
+        if not self.generated or self.is_over or self.revealed[row][col] or (row, col) in self.flagged:
+            return []
+        if self.board[row][col] == -1:
+            self.exploded = True
+            return [(row, col)]
+        return self.flood_fill(row, col)
+
+
+    def flood_fill(self, row, col):
+        if self.revealed[row][col]:
+            return []
+        self.revealed[row][col] = True
+        opened = []
+        queue = deque([(row, col)])
+        while queue:
+            r, c = queue.popleft()
+            opened.append((r, c))
+            if self.board[r][c] != 0:
+                continue
+            for i in range(max(0, r-1), min(self.rows, r+2)):
+                for j in range(max(0, c-1), min(self.columns, c+2)):
+                    if not self.revealed[i][j] and (i, j) not in self.flagged:
+                        self.revealed[i][j] = True
+                        queue.append((i, j))
+        self.revealed_count += len(opened)
+        return opened
+
+
+    def toggle_flag(self, row, col):
+        if self.revealed[row][col]:
+            return None
+        if (row, col) in self.flagged:
+            self.flagged.discard((row, col))
+            return False
+        self.flagged.add((row, col))
+        return True
+
+
+    @property
+    def won(self):
+        return self.revealed_count == self.rows * self.columns - self.mines
+
+
+    @property
+    def is_over(self):
+        return self.exploded or self.won
@@ -0,0 +1,306 @@
+from math import comb
+
+from engines.minesweeper import MinesweeperState
+
+
+MAX_COMPONENT = 40
+MAX_CACHE = 10000
+NO_GUESS_ATTEMPTS = 500
+
+
+def enumerate_component(cells, constraints, limit):
+    # Backtracks over every mine assignment of one frontier component and
+    # returns {mines: [solutions, mine count per cell]}.
+    index = {cell: i for i, cell in enumerate(cells)}
+    of_cell = [[] for _ in cells]
+    need = []
+    left = []
+    for k, (members, count) in enumerate(constraints):
+        for cell in members:
+            of_cell[index[cell]].append(k)
+        need.append(count)
+        left.append(len(members))
+    assignment = [0] * len(cells)
+    totals = {}
+
+    def assign(i, mines):
+        if i == len(cells):
+            entry = totals.get(mines)
+            if entry is None:
+                entry = totals[mines] = [0, [0] * len(cells)]
+            entry[0] += 1
+            counts = entry[1]
+            for j, value in enumerate(assignment):
+                if value:
+                    counts[j] += 1
+            return
+        for value in (0, 1):
+            if mines + value > limit:
+                break
+            if any(not 0 <= need[k] - value <= left[k] - 1 for k in of_cell[i]):
+                continue
+            for k in of_cell[i]:
+                need[k] -= value
+                left[k] -= 1
+            assignment[i] = value
+            assign(i + 1, mines + value)
+            for k in of_cell[i]:
+                need[k] += value
+                left[k] += 1
+        assignment[i] = 0
+
+    assign(0, 0)
+    return totals
+
+
+def convolve(a, b):
+    result = {}
+    for m, ways in a.items():
+        for n, other in b.items():
+            result[m + n] = result.get(m + n, 0) + ways * other
+    return result
+
+
+class MinesweeperSolver:
+    # Works only from what the player can see: revealed numbers and the total
+    # mine count. Mines it has proven are kept between calls, as are the
+    # enumerations of frontier components, so repeated hints on a board that
+    # changed in one corner only re-enumerate that corner.
+    def __init__(self, state):
+        self.state = state
+        self.mines = set()
+        self.cache = {}
+
+
+    def constraints(self):
+        state = self.state
+        constraints = {}
+        for r in range(state.rows):
+            for c in range(state.columns):
+                if not state.revealed[r][c] or state.board[r][c] <= 0:
+                    continue
+                unknown = []
+                count = state.board[r][c]
+                for i in range(max(0, r-1), min(state.rows, r+2)):
+                    for j in range(max(0, c-1), min(state.columns, c+2)):
+                        if state.revealed[i][j]:
+                            continue
+                        if (i, j) in self.mines:
+                            count -= 1
+                        else:
+                            unknown.append((i, j))
+                if unknown:
+                    constraints[frozenset(unknown)] = count
+        return constraints
+
+
+    def deduce(self, constraints):
+        # Single-cell rules (a count of zero or of every unknown neighbour)
+        # and the subset rule: if A is inside B, B - A holds count(B) - count(A).
+        safe, mines = set(), set()
+        while True:
+            found_safe = set()
+            found_mines = set()
+            for cells, count in constraints.items():
+                if count == 0:
+                    found_safe |= cells
+                elif count == len(cells):
+                    found_mines |= cells
+            if found_safe or found_mines:
+                safe |= found_safe
+                mines |= found_mines
+                reduced = {}
+                for cells, count in constraints.items():
+                    rest = cells - found_safe - found_mines
+                    if rest:
+                        reduced[rest] = count - len(cells & found_mines)
+                constraints = reduced
+                continue
+
+            containing = {}
+            for cells in constraints:
+                for cell in cells:
+                    containing.setdefault(cell, []).append(cells)
+            derived = {}
+            for small, count in constraints.items():
+                for big in containing[next(iter(small))]:
+                    if small < big:
+                        rest = big - small
+                        if rest not in constraints:
+                            derived[rest] = constraints[big] - count
+            if not derived:
+                return safe, mines, constraints
+            constraints.update(derived)
+
+
+    def components(self, constraints):
+        parent = {}
+
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        for cells in constraints:
+            for cell in cells:
+                parent.setdefault(cell, cell)
+            first = find(next(iter(cells)))
+            for cell in cells:
+                parent[find(cell)] = first
+
+        groups = {}
+        for cells, count in constraints.items():
+            groups.setdefault(find(next(iter(cells))), []).append((cells, count))
+        return list(groups.values())
+
+
+    def component_totals(self, group, limit):
+        key = frozenset(group)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] >= limit:
+            return cached[1], cached[2]
+        cells = sorted(set().union(*(cells for cells, _ in group)))
+        if len(cells) > MAX_COMPONENT:
+            return cells, None
+        totals = enumerate_component(cells, group, limit)
+        if len(self.cache) > MAX_CACHE:
+            self.cache.clear()
+        self.cache[key] = (limit, cells, totals)
+        return cells, totals
+
+
+    def probabilities(self, constraints, unknown):
+        # Exact mine probability of every unknown cell. Components are
+        # enumerated independently and combined with the number of ways to
+        # place the remaining mines among cells no number touches.
+        #
+        # A component too large to enumerate has its constraints dropped:
+        # its cells join the unconstrained ones. Every real layout is still
+        # counted, so a cell that comes out at exactly 0 or 1 is proven
+        # either way; other values are approximate, and for those cells the
+        # densest local count is shown instead.
+        remaining = self.state.mines - len(self.mines)
+        frontier = set().union(*constraints) if constraints else set()
+        components = []
+        estimates = {}
+        for group in self.components(constraints):
+            cells, totals = self.component_totals(group, remaining)
+            if totals is None:
+                for members, count in group:
+                    for cell in members:
+                        estimates[cell] = max(estimates.get(cell, 0.0), count / len(members))
+                frontier -= set(cells)
+                continue
+            components.append((cells, totals))
+        interior = len(unknown) - len(frontier)
+
+        def ways(distributions):
+            result = {0: 1}
+            for distribution in distributions:
+                result = convolve(result, distribution)
+            return result
+
+        def fill(frontier_mines, extra=0):
+            left = remaining - frontier_mines - extra
+            if left < 0 or left > interior - extra:
+                return 0
+            return comb(interior - extra, left)
+
+        distributions = [{m: entry[0] for m, entry in totals.items()} for _, totals in components]
+        everything = ways(distributions)
+        total = sum(count * fill(m) for m, count in everything.items())
+        if total == 0:
+            return None
+
+        exact = {}
+        for k, (cells, totals) in enumerate(components):
+            others = ways(distributions[:k] + distributions[k+1:])
+            weights = {m: sum(count * fill(m + n) for n, count in others.items()) for m in totals}
+            for j, cell in enumerate(cells):
+                exact[cell] = sum(entry[1][j] * weights[m] for m, entry in totals.items())
+        if interior:
+            inside = sum(count * fill(m, 1) for m, count in everything.items())
+            for cell in unknown:
+                if cell not in frontier:
+                    exact[cell] = inside
+
+        probabilities = {}
+        for cell, weight in exact.items():
+            if weight == 0:
+                probabilities[cell] = 0.0
+            elif weight == total:
+                probabilities[cell] = 1.0
+            elif cell in estimates:
+                # Deduction has already settled counts of 0 or of every cell,
+                # so an estimate is never 0 or 1 itself.
+                probabilities[cell] = estimates[cell]
+            else:
+                probabilities[cell] = weight / total
+        return probabilities
+
+
+    def analyse(self):
+        # Returns (safe cells, mine cells, probabilities). Probabilities are
+        # only computed when the deductions find nothing safe to open.
+        state = self.state
+        safe, mines, constraints = self.deduce(self.constraints())
+        self.mines |= mines
+        unknown = [(r, c) for r in range(state.rows) for c in range(state.columns)
+                   if not state.revealed[r][c] and (r, c) not in self.mines]
+        if safe:
+            return safe, self.mines, None
+        if len(self.mines) == state.mines:
+            return set(unknown), self.mines, None
+        probabilities = self.probabilities(constraints, unknown)
+        if probabilities is None:
+            return set(), self.mines, None
+        safe = {cell for cell, p in probabilities.items() if p == 0.0}
+        self.mines |= {cell for cell, p in probabilities.items() if p == 1.0}
+        return safe, self.mines, probabilities
+
+
+    def hint(self):
+        # The best next cell to open and its chance of being a mine.
+        state = self.state
+        if state.is_over:
+            return None
+        if not state.generated:
+            return (state.rows // 2, state.columns // 2), 0.0
+        safe, _, probabilities = self.analyse()
+        if safe:
+            return min(safe), 0.0
+        if not probabilities:
+            return None
+        cell = min(sorted(probabilities), key=probabilities.get)
+        return cell, probabilities[cell]
+
+
+    def solve(self, guess=False):
+        # Plays the state to the end. Without guess it stops as soon as no
+        # cell is provably safe; returns whether the game was won.
+        state = self.state
+        while not state.is_over:
+            safe, _, probabilities = self.analyse()
+            if not safe:
+                if not guess or not probabilities:
+                    return False
+                safe = {min(sorted(probabilities), key=probabilities.get)}
+            for cell in sorted(safe):
+                state.flagged.discard(cell)
+                state.apply_move(*cell)
+        return state.won
+
+
+def create_no_guess_board(state, safe, attempts=NO_GUESS_ATTEMPTS):
+    # Regenerates the board until the solver can clear it from `safe` without
+    # guessing. Returns False, leaving the last board, if no attempt does.
+    for _ in range(attempts):
+        state.create_board(safe=safe)
+        trial = MinesweeperState(state.rows, state.columns, state.mines)
+        trial.board = state.board
+        trial.generated = True
+        trial.apply_move(*safe)
+        if MinesweeperSolver(trial).solve():
+            return True
+    return False
@@ -0,0 +1,20 @@
+import random
+
+
+class NumberGuessingState:
+    def __init__(self, low=1, high=100, rng=random):
+        self.low = low
+        self.high = high
+        self.number = rng.randint(low, high)
+        self.guesses = 0
+        self.solved = False
+
+
+    def apply_move(self, guess):
+        self.guesses += 1
+        if guess < self.number:
+            return 'low'
+        if guess > self.number:
+            return 'high'
+        self.solved = True
+        return 'correct'
@@ -0,0 +1,143 @@
+class PongState:
+    WIDTH = 600
+    HEIGHT = 400
+    PADDLE_WIDTH = 10
+    PADDLE_HEIGHT = 100
+    BALL_SIZE = 20
+    PADDLE_SPEED = 5
+    BALL_SPEED = 3
+    # Every paddle hit speeds the ball up, to at most MAX_BALL_SPEED pixels
+    # per tick horizontally.
+    SPEEDUP = 1.05
+    MAX_BALL_SPEED = 24
+    # Where the ball meets a paddle sets the return angle: dy/dx runs from
+    # -MAX_SLOPE at the top end through 0 at the middle to MAX_SLOPE.
+    MAX_SLOPE = 1.0
+    # Physics runs at a fixed SUBSTEPS steps per game tick.
+    SUBSTEPS = 2
+    MAX_BOUNCES = 4
+
+    def __init__(self):
+        self.paddle_x = [20, self.WIDTH - 30]
+        self.paddle_y = [150.0, 150.0]
+        self.paddle_dy = [0, 0]
+        self.scores = [0, 0]
+        self.hits = 0
+        self.reset_ball()
+
+
+    def reset_ball(self):
+        self.ball_x = (self.WIDTH - self.BALL_SIZE) / 2
+        self.ball_y = (self.HEIGHT - self.BALL_SIZE) / 2
+        self.ball_dx = self.BALL_SPEED
+        self.ball_dy = self.BALL_SPEED
+
+
+    def set_paddle(self, player, direction):
+        self.paddle_dy[player] = direction * self.PADDLE_SPEED
+
+
+    def paddle_coords(self, player):
+        x, y = self.paddle_x[player], self.paddle_y[player]
+        return x, y, x + self.PADDLE_WIDTH, y + self.PADDLE_HEIGHT
+
+
+    def ball_coords(self):
+        return self.ball_x, self.ball_y, self.ball_x + self.BALL_SIZE, self.ball_y + self.BALL_SIZE
+
+
+    def step(self):
+        dt = 1 / self.SUBSTEPS
+        for _ in range(self.SUBSTEPS):
+            self.move_paddles(dt)
+            self.move_ball(dt)
+            if self.ball_x <= 0 or self.ball_x + self.BALL_SIZE >= self.WIDTH:
+                self.scores[1 if self.ball_x <= 0 else 0] += 1
+                self.reset_ball()
+
+
+    def move_paddles(self, dt):
+        top = self.HEIGHT - self.PADDLE_HEIGHT
+        for player in (0, 1):
+            if self.paddle_dy[player]:
+                self.paddle_y[player] = min(max(self.paddle_y[player] + self.paddle_dy[player] * dt, 0), top)
+
+
+    def move_ball(self, dt):
+        # Moves the ball along its path for dt ticks, stopping at the first
+        # wall or paddle it meets on the way and carrying on with the time
+        # left after bouncing, so a fast ball cannot skip over a paddle.
+        bottom = self.HEIGHT - self.BALL_SIZE
+        for _ in range(self.MAX_BOUNCES):
+            dx, dy = self.ball_dx * dt, self.ball_dy * dt
+            x, y = self.ball_x, self.ball_y
+            t, hit = 1.0, None
+            if dy < 0 and y + dy < 0:
+                t, hit = -y / dy, 'wall'
+            elif dy > 0 and y + dy > bottom:
+                t, hit = (bottom - y) / dy, 'wall'
+            # Only the paddle the ball is heading for can be hit.
+            player = 0 if dx < 0 else 1
+            contact = self.sweep_paddle(player, x, y, dx, dy)
+            if contact is not None and contact[0] <= t:
+                t, hit = contact
+            self.ball_x = x + dx * t
+            self.ball_y = y + dy * t
+            if hit is None:
+                return
+            if hit == 'wall':
+                self.ball_dy = -self.ball_dy
+            elif hit == 'face':
+                self.bounce(player)
+            else:
+                # The end of the paddle: send the ball away from it vertically.
+                above = self.ball_y < self.paddle_y[player]
+                self.ball_dy = -abs(self.ball_dy) if above else abs(self.ball_dy)
+            dt *= 1 - t
+
+
+    def sweep_paddle(self, player, x, y, dx, dy):
+        # Swept box test: the ball's corner against the paddle grown by the
+        # ball's size. Returns (time of contact in 0..1, 'face' or 'end'),
+        # or None if the ball's path misses the paddle.
+        left = self.paddle_x[player] - self.BALL_SIZE
+        right = self.paddle_x[player] + self.PADDLE_WIDTH
+        top = self.paddle_y[player] - self.BALL_SIZE
+        bottom = self.paddle_y[player] + self.PADDLE_HEIGHT
+        if dx > 0:
+            x_entry, x_exit = (left - x) / dx, (right - x) / dx
+        elif dx < 0:
+            x_entry, x_exit = (right - x) / dx, (left - x) / dx
+        else:
+            return None
+        if dy > 0:
+            y_entry, y_exit = (top - y) / dy, (bottom - y) / dy
+        elif dy < 0:
+            y_entry, y_exit = (bottom - y) / dy, (top - y) / dy
+        elif top < y < bottom:
+            y_entry, y_exit = float('-inf'), float('inf')
+        else:
+            return None
+        entry, exit = max(x_entry, y_entry), min(x_exit, y_exit)
+        if entry > exit or entry > 1 or exit <= 0:
+            return None
+        if entry < 0:
+            # Already overlapping, because the paddle moved onto the ball:
+            # turn it around now instead of letting it flip back and forth.
+            return 0.0, 'face'
+        return entry, 'face' if x_entry >= y_entry else 'end'
+
+
+    def hit_offset(self, player):
+        # -1 when the ball's centre is level with the top of the paddle's
+        # reach, 1 at the bottom.
+        reach = (self.PADDLE_HEIGHT + self.BALL_SIZE) / 2
+        centre = self.paddle_y[player] + self.PADDLE_HEIGHT / 2
+        return max(-1.0, min(1.0, (self.ball_y + self.BALL_SIZE / 2 - centre) / reach))
+
+
+    def bounce(self, player):
+        speed = min(abs(self.ball_dx) * self.SPEEDUP, self.MAX_BALL_SPEED)
+        self.ball_dx = speed if player == 0 else -speed
+        self.ball_dy = speed * self.MAX_SLOPE * self.hit_offset(player)
+        self.hits += 1
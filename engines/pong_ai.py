@@ -0,0 +1,105 @@
+import random
+
+
+# difficulty: (ticks between re-aiming, aim error in pixels, moves back to
+# the middle between shots, aims its returns away from the opponent)
+DIFFICULTIES = {
+    'easy': (10, 35.0, False, False),
+    'medium': (5, 15.0, True, False),
+    'hard': (2, 4.0, True, True),
+}
+
+# Hit offsets (see PongState.hit_offset) an aiming paddle considers.
+AIM_OFFSETS = [i / 5 for i in range(-4, 5)]
+
+
+def fold(y, low, high):
+    # Maps a height on the unfolded straight-line path back into
+    # [low, high], mirroring at each wall the way bounces do.
+    span = high - low
+    y = (y - low) % (2 * span)
+    return low + (y if y <= span else 2 * span - y)
+
+
+def faces(state, player):
+    # The ball's x when it touches the player's paddle and the opponent's.
+    left = state.paddle_x[0] + state.PADDLE_WIDTH
+    right = state.paddle_x[1] - state.BALL_SIZE
+    return (left, right) if player == 0 else (right, left)
+
+
+def predict_intercept(state, player):
+    # When (in ticks) and at what height of its top edge the ball reaches
+    # the player's paddle, or None while it is heading away. Wall bounces
+    # are handled by unfolding the path into a straight line.
+    dx, dy = state.ball_dx, state.ball_dy
+    if not dx or (dx < 0) != (player == 0):
+        return None
+    near, _ = faces(state, player)
+    ticks = abs(near - state.ball_x) / abs(dx)
+    return ticks, fold(state.ball_y + dy * ticks, 0, state.HEIGHT - state.BALL_SIZE)
+
+
+def return_height(state, player, y, offset):
+    # Where a ball hit at height y with the given hit offset reaches the
+    # opponent's paddle; the return's slope only depends on the offset.
+    near, far = faces(state, player)
+    return fold(y + state.MAX_SLOPE * offset * abs(far - near), 0, state.HEIGHT - state.BALL_SIZE)
+
+
+class PongAI:
+    def __init__(self, player, difficulty='medium', rng=random):
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        self.player = player
+        self.reaction, self.error, self.recentre, self.aims = DIFFICULTIES[difficulty]
+        self.rng = rng
+        self.target = None
+        self.offset = 0.0
+        self.incoming = None
+        self.wait = 0
+
+
+    def control(self, state):
+        # Called once per tick; returns the paddle direction -1, 0 or 1.
+        incoming = (state.ball_dx < 0) == (self.player == 0)
+        if incoming != self.incoming:
+            # A new approach: draw its aiming error and react straight away.
+            self.incoming = incoming
+            self.offset = self.rng.gauss(0, self.error) if self.error else 0.0
+            self.wait = 0
+        if self.wait <= 0:
+            self.wait = self.reaction
+            self.target = self.plan(state)
+        self.wait -= 1
+        if self.target is None:
+            return 0
+        centre = state.paddle_y[self.player] + state.PADDLE_HEIGHT / 2
+        if abs(self.target - centre) <= state.PADDLE_SPEED:
+            return 0
+        return 1 if self.target > centre else -1
+
+
+    def plan(self, state):
+        # The height the paddle's centre should move to.
+        intercept = predict_intercept(state, self.player)
+        if intercept is None:
+            return state.HEIGHT / 2 if self.recentre else None
+        ticks, y = intercept
+        ball_centre = y + state.BALL_SIZE / 2
+        if not self.aims:
+            return ball_centre + self.offset
+        # Pick the reachable hit offset that sends the ball farthest from
+        # the opponent's paddle.
+        reach = (state.PADDLE_HEIGHT + state.BALL_SIZE) / 2
+        centre = state.paddle_y[self.player] + state.PADDLE_HEIGHT / 2
+        opponent = state.paddle_y[1 - self.player] + state.PADDLE_HEIGHT / 2
+        best, best_gap = ball_centre, -1.0
+        for offset in AIM_OFFSETS:
+            target = ball_centre - offset * reach
+            if abs(target - centre) > ticks * state.PADDLE_SPEED:
+                continue
+            gap = abs(return_height(state, self.player, y, offset) + state.BALL_SIZE / 2 - opponent)
+            if gap > best_gap:
+                best, best_gap = target, gap
+        return best + self.offset
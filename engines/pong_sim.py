@@ -0,0 +1,122 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import time
+
+from engines.pong import PongState
+from engines.pong_ai import DIFFICULTIES, PongAI
+
+
+POINTS = 5
+TICK_MS = 20
+# Ten minutes of game time; matches still going then count as timeouts.
+MAX_TICKS = 10 * 60 * 1000 // TICK_MS
+
+
+def play_match(job):
+    # One headless match between two AIs. Returns (left difficulty, right
+    # difficulty, winner 0/1 or None on timeout, paddle hits per rally,
+    # ticks played).
+    left, right, seed, points, max_ticks = job
+    rng = random.Random(seed)
+    state = PongState()
+    players = [PongAI(0, left, rng), PongAI(1, right, rng)]
+    rallies = []
+    hits = ticks = 0
+    scored = 0
+    while max(state.scores) < points and ticks < max_ticks:
+        for player, ai in enumerate(players):
+            state.set_paddle(player, ai.control(state))
+        state.step()
+        ticks += 1
+        total = state.scores[0] + state.scores[1]
+        if total != scored:
+            scored = total
+            rallies.append(state.hits - hits)
+            hits = state.hits
+    winner = None
+    if max(state.scores) >= points:
+        winner = 0 if state.scores[0] > state.scores[1] else 1
+    return left, right, winner, rallies, ticks
+
+
+def run_matches(pairs, matches, workers, seed, points=POINTS, max_ticks=MAX_TICKS):
+    # Each pairing plays half its matches from either side, since the ball is
+    # always served to the right.
+    jobs = []
+    for a, b in pairs:
+        for i in range(matches):
+            left, right = (a, b) if i % 2 == 0 else (b, a)
+            jobs.append((left, right, seed * 1000003 + len(jobs), points, max_ticks))
+    if workers == 1:
+        return list(map(play_match, jobs))
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(play_match, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else 0
+
+
+def summarise(results):
+    # {(a, b): [a's wins, b's wins, timeouts]} for a != b, and every rally
+    # length.
+    table = {}
+    rallies = []
+    for left, right, winner, match_rallies, _ in results:
+        rallies += match_rallies
+        if left == right:
+            continue
+        for a, b in ((left, right), (right, left)):
+            row = table.setdefault((a, b), [0, 0, 0])
+            if winner is None:
+                row[2] += 1
+            elif (left, right)[winner] == a:
+                row[0] += 1
+            else:
+                row[1] += 1
+    return table, sorted(rallies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless AI-vs-AI Pong matches for tuning difficulty")
+    parser.add_argument('--matches', type=int, default=200, help="matches per pairing")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--points', type=int, default=POINTS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('difficulties', nargs='*', default=list(DIFFICULTIES))
+    args = parser.parse_args()
+
+    pairs = list(itertools.combinations_with_replacement(args.difficulties, 2))
+    start = time.perf_counter()
+    results = run_matches(pairs, args.matches, args.workers, args.seed, args.points)
+    elapsed = time.perf_counter() - start
+    ticks = sum(result[4] for result in results)
+    print(f"{len(results)} matches, {ticks} ticks in {elapsed:.1f}s on {args.workers} workers "
+          f"({ticks * TICK_MS / 1000 / elapsed:,.0f}x real time)")
+
+    table, rallies = summarise(results)
+    print("\nWin rate of row against column:")
+    print(' ' * 8 + ''.join(f"{name:>10}" for name in args.difficulties))
+    for a in args.difficulties:
+        cells = []
+        for b in args.difficulties:
+            won, lost, _ = table.get((a, b), (0, 0, 0))
+            cells.append(f"{won / (won + lost):>10.0%}" if won + lost else f"{'-':>10}")
+        print(f"{a:>8}" + ''.join(cells))
+    timeouts = sum(1 for result in results if result[2] is None)
+    if timeouts:
+        print(f"{timeouts} matches hit the {MAX_TICKS} tick limit")
+
+    print(f"\nRally length (paddle hits per point) over {len(rallies)} points: "
+          f"mean {sum(rallies) / max(1, len(rallies)):.1f}, p50 {percentile(rallies, 0.5)}, "
+          f"p90 {percentile(rallies, 0.9)}, p99 {percentile(rallies, 0.99)}, max {rallies[-1] if rallies else 0}")
+    counts = {}
+    for length in rallies:
+        bucket = min(length // 5 * 5, 50)
+        counts[bucket] = counts.get(bucket, 0) + 1
+    for bucket in sorted(counts):
+        label = f"{bucket}+" if bucket == 50 else f"{bucket}-{bucket + 4}"
+        print(f"{label:>7} {counts[bucket]:>7} {'#' * max(1, 60 * counts[bucket] // len(rallies))}")
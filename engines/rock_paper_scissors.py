@@ -0,0 +1,40 @@
+import random
+
+
+CHOICES = ['Rock', 'Paper', 'Scissors']
+RESULTS = ["It's a draw!", "You win!", "Computer wins!"]
+# OUTCOMES[player][computer] indexes RESULTS: 0 for a draw, 1 when the
+# player wins and 2 when the computer does. Each move beats the one before
+# it in CHOICES.
+OUTCOMES = [[(player - computer) % 3 for computer in range(3)] for player in range(3)]
+
+
+class RockPaperScissorsState:
+    choices = CHOICES
+
+    def __init__(self, rng=random, opponent=None):
+        self.rng = rng
+        # Something with choose() and update(player, computer) taking move
+        # indices, such as RPSPredictor; None picks uniformly at random.
+        self.opponent = opponent
+        self.player_choice = None
+        self.computer_choice = None
+        self.result = None
+        self.scores = [0, 0]
+
+
+    def apply_move(self, choice):
+        self.player_choice = choice
+        player = CHOICES.index(choice)
+        if self.opponent is None:
+            self.computer_choice = self.rng.choice(self.choices)
+            computer = CHOICES.index(self.computer_choice)
+        else:
+            computer = self.opponent.choose()
+            self.opponent.update(player, computer)
+            self.computer_choice = CHOICES[computer]
+        outcome = OUTCOMES[player][computer]
+        self.result = RESULTS[outcome]
+        if outcome:
+            self.scores[outcome - 1] += 1
+        return self.result
@@ -0,0 +1,91 @@
+import random
+
+from engines.rock_paper_scissors import OUTCOMES
+
+
+# Highest context lengths, in moves, for the predictors that look at the
+# player's own moves and at both players' moves.
+PLAYER_ORDER = 5
+PAIR_ORDER = 4
+# A context's counts are halved once one of them passes this, so they stay
+# small and recent play outweighs old play.
+MAX_COUNT = 255
+# Weight kept by a predictor's score each move; the rest is the last result.
+DECAY = 0.9
+
+
+class NGram:
+    # Counts of the player's next move after each context of the last
+    # `order` symbols, where a symbol is the player's move (base 3) or both
+    # moves (base 9). Contexts are kept as a rolling number, and the counts
+    # live in one flat list of base**order * 3 entries, so an update and a
+    # prediction touch a fixed number of entries and memory does not grow
+    # with the history.
+    __slots__ = ('order', 'pairs', 'modulus', 'counts', 'context', 'prediction')
+
+    def __init__(self, order, pairs):
+        self.order = order
+        self.pairs = pairs
+        self.modulus = (9 if pairs else 3) ** order
+        self.counts = [0] * (self.modulus * 3)
+        self.context = 0
+        self.prediction = None
+
+
+    def update(self, player, computer):
+        counts = self.counts
+        i = self.context * 3
+        counts[i + player] += 1
+        if counts[i + player] > MAX_COUNT:
+            counts[i] >>= 1
+            counts[i + 1] >>= 1
+            counts[i + 2] >>= 1
+        symbol = player * 3 + computer if self.pairs else player
+        self.context = (self.context * (9 if self.pairs else 3) + symbol) % self.modulus
+        i = self.context * 3
+        rock, paper, scissors = counts[i], counts[i + 1], counts[i + 2]
+        if rock >= paper and rock >= scissors:
+            self.prediction = 0 if rock else None
+        else:
+            self.prediction = 1 if paper >= scissors else 2
+
+
+class RPSPredictor:
+    # An ensemble of NGram predictors from order 0 (plain move frequencies)
+    # up. Each is also read at three rotations: expecting the predicted
+    # move, the move that beats it and the one that beats that, which
+    # catches a player who counters the counter. Every reading keeps a
+    # decayed score of how its answer would have done, and the computer
+    # plays the answer of the best one; while none is ahead it plays at
+    # random. Work per move depends only on the number of predictors.
+    def __init__(self, rng=random, player_order=PLAYER_ORDER, pair_order=PAIR_ORDER):
+        self.rng = rng
+        self.predictors = [NGram(order, False) for order in range(player_order + 1)]
+        self.predictors += [NGram(order, True) for order in range(1, pair_order + 1)]
+        self.scores = [[0.0, 0.0, 0.0] for _ in self.predictors]
+
+
+    def choose(self):
+        best, move = 0.0, None
+        for predictor, scores in zip(self.predictors, self.scores):
+            if predictor.prediction is None:
+                continue
+            for rotation in range(3):
+                if scores[rotation] > best:
+                    best = scores[rotation]
+                    # Play what beats the player's expected move.
+                    move = (predictor.prediction + rotation + 1) % 3
+        if move is None:
+            return self.rng.randrange(3)
+        return move
+
+
+    def update(self, player, computer):
+        for predictor, scores in zip(self.predictors, self.scores):
+            if predictor.prediction is not None:
+                for rotation in range(3):
+                    # 1 if this reading's answer would have won, -1 if it
+                    # would have lost, 0 for a draw.
+                    outcome = OUTCOMES[(predictor.prediction + rotation + 1) % 3][player]
+                    scores[rotation] = scores[rotation] * DECAY + (1 if outcome == 1 else -1 if outcome == 2 else 0)
+            predictor.update(player, computer)
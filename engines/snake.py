@@ -0,0 +1,74 @@
+import random
+from collections import deque
+
+
+DIRECTIONS = {'Up': (0, -1), 'Down': (0, 1), 'Left': (-1, 0), 'Right': (1, 0)}
+
+
+class SnakeState:
+    def __init__(self, width=20, height=20, body=None, direction='Down', rng=random):
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.body = deque(body or [(1, 1), (1, 2), (1, 3)])
+        # Free cells in a list, with each one's position in it, so a cell can
+        # be taken out (swapped with the last) or put back in O(1) and food
+        # can be drawn uniformly by index. A cell not in free_index is either
+        # part of the snake or off the board.
+        occupied = set(self.body)
+        self.free = [(x, y) for y in range(height) for x in range(width) if (x, y) not in occupied]
+        self.free_index = {cell: i for i, cell in enumerate(self.free)}
+        self.direction = direction
+        self.alive = True
+        self.food = self.place_food()
+
+
+    def place_food(self):
+        # None once the snake fills the board.
+        if not self.free:
+            return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+
+    @property
+    def head(self):
+        return self.body[-1]
+
+
+    @property
+    def won(self):
+        return self.food is None
+
+
+    def step(self):
+        # Returns (new_head, removed_tail); removed_tail is None when the
+        # snake grew. Returns None once the snake has crashed.
+        if not self.alive:
+            return None
+        dx, dy = DIRECTIONS[self.direction]
+        x, y = self.body[-1]
+        new_head = (x + dx, y + dy)
+        free, free_index = self.free, self.free_index
+        if new_head not in free_index:
+            # The head may follow into the cell the tail is leaving; food is
+            # never on the snake, so the tail really does move.
+            if new_head != self.body[0] or len(self.body) < 3:
+                self.alive = False
+                return None
+            self.body.append(new_head)
+            return new_head, self.body.popleft()
+
+        self.body.append(new_head)
+        last = free.pop()
+        if last != new_head:
+            i = free_index[new_head]
+            free[i] = last
+            free_index[last] = i
+        del free_index[new_head]
+        if new_head == self.food:
+            self.food = self.place_food()
+            return new_head, None
+        tail = self.body.popleft()
+        free_index[tail] = len(free)
+        free.append(tail)
+        return new_head, tail
@@ -0,0 +1,205 @@
+import heapq
+from collections import deque
+
+from engines.snake import DIRECTIONS
+
+
+NAMES = {delta: name for name, delta in DIRECTIONS.items()}
+# Above this share of the board a snake in cycle order stops planning A*
+# paths and only takes single-step shortcuts along the cycle.
+PLANNING_LIMIT = 0.5
+
+
+def hamiltonian_cycle(width, height):
+    # Row 0 left to right, then a boustrophedon over columns 1.. on the
+    # remaining rows, returning to the start up column 0. With an odd height
+    # the same walk is made over the transposed board; a board with both
+    # sides odd has no Hamiltonian cycle.
+    if height % 2:
+        if width % 2:
+            raise ValueError(f"No Hamiltonian cycle on a {width}x{height} board")
+        return [(y, x) for x, y in hamiltonian_cycle(height, width)]
+    cycle = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(height - 1, 0, -1))
+    return cycle
+
+
+def neighbours(cell):
+    x, y = cell
+    return (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)
+
+
+class SnakeAutopilot:
+    # Follows a Hamiltonian cycle, which on its own always finishes the
+    # board, and shortens it where that is safe. While the snake's body lies
+    # in cycle order between tail and head, any move that lands before the
+    # tail in cycle order keeps it that way, so the cells ahead of the head
+    # up to the tail stay free and the tail stays reachable: at worst the
+    # head follows the tail round the cycle.
+    #
+    # Each food, the autopilot first looks for an A* path to it and takes it
+    # if following it passes the safety test: the tail must be reachable
+    # from where the path ends. While the body is in cycle order the test is
+    # that every step of the path keeps the order. Otherwise (the autopilot
+    # took over a game mid-way) it is a search from the end of the path to
+    # the tail, with the body as it would be then. Without a safe path it
+    # falls back to the cycle, taking the neighbour that gets closest to the
+    # food along it without passing the tail.
+    def __init__(self, state):
+        self.state = state
+        self.cycle = hamiltonian_cycle(state.width, state.height)
+        self.size = len(self.cycle)
+        self.order = {cell: i for i, cell in enumerate(self.cycle)}
+        self.path = deque()
+        self.planned_for = None
+        self.ordered = self.in_cycle_order()
+
+
+    def forward(self, a, b):
+        # Steps from a to b going forward around the cycle.
+        return (self.order[b] - self.order[a]) % self.size
+
+
+    def in_cycle_order(self):
+        body = self.state.body
+        tail = body[0]
+        distances = [self.forward(tail, cell) for cell in body]
+        return all(a < b for a, b in zip(distances, distances[1:]))
+
+
+    def choose(self):
+        # Returns the direction to take this step.
+        state = self.state
+        if state.food is None:
+            return state.direction
+        if not self.ordered and self.in_cycle_order():
+            # Back in cycle order: a path planned without it may not keep it.
+            self.ordered = True
+            self.planned_for = None
+        # Out of cycle order there is no fallback that is sure to get back to
+        # the food, so a path is looked for again every step.
+        if state.food != self.planned_for or not (self.path or self.ordered):
+            self.planned_for = state.food
+            self.path = deque()
+            if not self.ordered or len(state.body) < PLANNING_LIMIT * self.size:
+                path = self.a_star(state.head, state.food)
+                if path and self.is_safe(path):
+                    self.path = deque(path)
+        if self.path and self.path[0] in state.free_index:
+            cell = self.path.popleft()
+        else:
+            self.path = deque()
+            cell = self.shortcut() if self.ordered else self.towards_tail()
+            if cell is None:
+                return state.direction
+        head = state.head
+        return NAMES[(cell[0] - head[0], cell[1] - head[1])]
+
+
+    def a_star(self, start, goal):
+        # Shortest path over free cells (food included), as a list of cells
+        # after start, or None.
+        free = self.state.free_index
+        gx, gy = goal
+        came_from = {start: None}
+        cost = {start: 0}
+        heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            if cell == goal:
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return path
+            if g > cost[cell]:
+                continue
+            for nxt in neighbours(cell):
+                if nxt in free and g + 1 < cost.get(nxt, self.size):
+                    cost[nxt] = g + 1
+                    came_from[nxt] = cell
+                    heapq.heappush(heap, (g + 1 + abs(nxt[0] - gx) + abs(nxt[1] - gy), g + 1, nxt))
+        return None
+
+
+    def is_safe(self, path):
+        body = self.state.body
+        if self.ordered:
+            # Replays the path: each step has to land strictly before the
+            # tail of that moment, and the last one (which eats, so the tail
+            # stays) one further back still.
+            head = body[-1]
+            for i, cell in enumerate(path):
+                tail = body[i] if i < len(body) else path[i - len(body)]
+                margin = 1 if i == len(path) - 1 else 0
+                if self.forward(head, cell) >= self.forward(head, tail) - margin:
+                    return False
+                head = cell
+            return True
+        # The body after eating at the end of the path: one longer than now,
+        # made of its newest cells.
+        kept = (list(body) + path)[-len(body) - 1:]
+        blocked = set(kept)
+        return self.reachable(kept[-1], kept[0], blocked)
+
+
+    def reachable(self, start, goal, blocked):
+        # Breadth-first search over cells inside the board and not blocked.
+        width, height = self.state.width, self.state.height
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for nxt in neighbours(cell):
+                if nxt == goal:
+                    return True
+                if nxt not in seen and nxt not in blocked and 0 <= nxt[0] < width and 0 <= nxt[1] < height:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return False
+
+
+    def shortcut(self):
+        # The free neighbour closest to the food along the cycle that still
+        # lands before the tail. Without one the cycle's next cell is taken:
+        # it is free, or it is the tail, which moves away this step.
+        state = self.state
+        head, tail = state.head, state.body[0]
+        room = self.forward(head, tail)
+        target = self.forward(head, state.food)
+        best, best_left = self.cycle[(self.order[head] + 1) % self.size], None
+        for cell in neighbours(head):
+            if cell not in state.free_index:
+                continue
+            ahead = self.forward(head, cell)
+            margin = 1 if cell == state.food else 0
+            if ahead >= room - margin:
+                continue
+            left = (target - ahead) % self.size
+            if best_left is None or left < best_left:
+                best, best_left = cell, left
+        return best
+
+
+    def towards_tail(self):
+        # Out of cycle order and without a safe path: a move from which the
+        # tail can still be reached, preferring the cycle's next cell, or
+        # onto the tail itself. None when every move crashes.
+        state = self.state
+        head, tail = state.head, state.body[0]
+        blocked = set(state.body)
+        candidates = [self.cycle[(self.order[head] + 1) % self.size]] + list(neighbours(head))
+        fallback = None
+        for cell in candidates:
+            if cell == tail and cell != state.body[-2]:
+                return cell
+            if cell not in state.free_index:
+                continue
+            fallback = fallback or cell
+            if self.reachable(cell, tail, blocked | {cell}):
+                return cell
+        return fallback
@@ -0,0 +1,108 @@
+import random
+
+from engines.cards import DECK_SIZE, is_red, rank_of, suit_of
+
+
+# Cards on the table carry a face-up flag above the 0..51 card number.
+FACE_UP = 64
+CARD = FACE_UP - 1
+STOCK_SIZE = DECK_SIZE - 28
+
+
+class SolitaireState:
+    def __init__(self, rng=random):
+        cards = list(range(DECK_SIZE))
+        rng.shuffle(cards)
+        # Pile i of the tableau gets i + 1 cards, only the top one face up.
+        self.tableau = []
+        for i in range(7):
+            pile = [cards.pop() for _ in range(i + 1)]
+            pile[-1] |= FACE_UP
+            self.tableau.append(pile)
+        self.stock = cards
+        self.waste = []
+        self.foundation = [[] for _ in range(4)]
+
+
+    @property
+    def piles(self):
+        # Every pile in a fixed order: tableau, foundation, stock, waste.
+        return self.tableau + self.foundation + [self.stock, self.waste]
+
+
+    @property
+    def untouched(self):
+        # True until a card has left the stock or its tableau pile. Turning
+        # the whole stock over and back leaves the deal as it was.
+        return (not self.waste and len(self.stock) == STOCK_SIZE
+                and all(len(pile) == i + 1 for i, pile in enumerate(self.tableau)))
+
+
+    def draw(self):
+        # Turns the top stock card onto the waste, or the waste back over
+        # when the stock is empty.
+        if self.stock:
+            self.waste.append(self.stock.pop() | FACE_UP)
+        else:
+            self.stock = [card & CARD for card in reversed(self.waste)]
+            self.waste = []
+
+
+    def source(self, index):
+        # index 0..6 is a tableau pile, 7 the waste.
+        return self.waste if index == 7 else self.tableau[index]
+
+
+    def can_found(self, card):
+        card &= CARD
+        pile = self.foundation[suit_of(card)]
+        return rank_of(card) == len(pile)
+
+
+    def move_to_foundation(self, index):
+        pile = self.source(index)
+        if not pile or not pile[-1] & FACE_UP or not self.can_found(pile[-1]):
+            return False
+        card = pile.pop() & CARD
+        self.foundation[suit_of(card)].append(card | FACE_UP)
+        self.turn_up(pile)
+        return True
+
+
+    def can_stack(self, card, target):
+        # Tableau building: alternate colours, one rank down; kings on space.
+        card &= CARD
+        if not target:
+            return rank_of(card) == 12
+        top = target[-1]
+        return bool(top & FACE_UP) and is_red(top & CARD) != is_red(card) and rank_of(top & CARD) == rank_of(card) + 1
+
+
+    def move_to_tableau(self, index, target):
+        # Moves the longest face-up run from a tableau pile (or the waste
+        # card) that fits onto the target pile.
+        pile = self.source(index)
+        destination = self.tableau[target]
+        if pile is destination or not pile:
+            return False
+        first = len(pile) - 1
+        if index != 7:
+            while first > 0 and pile[first - 1] & FACE_UP:
+                first -= 1
+        for start in range(first, len(pile)):
+            if pile[start] & FACE_UP and self.can_stack(pile[start], destination):
+                destination.extend(pile[start:])
+                del pile[start:]
+                self.turn_up(pile)
+                return True
+        return False
+
+
+    def turn_up(self, pile):
+        if pile and not pile[-1] & FACE_UP:
+            pile[-1] |= FACE_UP
+
+
+    @property
+    def won(self):
+        return all(len(pile) == 13 for pile in self.foundation)
@@ -0,0 +1,174 @@
+import math
+import random
+import sys
+import time
+
+from engines.exact_cover import ExactCover
+
+
+# Values 1..25 are written with these symbols; '.' or '0' is an empty cell.
+SYMBOLS = '123456789ABCDEFGHIJKLMNOP'
+
+
+def parse_grid(text):
+    # The grid size is taken from the number of cells: 81, 256 or 625.
+    cells = []
+    for ch in text.upper():
+        if ch in '.0':
+            cells.append(0)
+        elif ch in SYMBOLS:
+            cells.append(SYMBOLS.index(ch) + 1)
+    size = math.isqrt(len(cells))
+    box = math.isqrt(size)
+    if size * size != len(cells) or box * box != size or size > len(SYMBOLS):
+        raise ValueError(f"{len(cells)} cells is not a square Sudoku grid")
+    if max(cells) > size:
+        raise ValueError(f"Value out of range for a {size}x{size} grid")
+    return cells
+
+
+def format_grid(cells):
+    return ''.join(SYMBOLS[v - 1] if v else '.' for v in cells)
+
+
+class SudokuDLX:
+    # Sudoku of any box size as exact cover: each (cell, value) candidate is
+    # a row covering four columns - the cell, and the value in its row,
+    # column and box. Columns already satisfied by the givens are left out,
+    # as are the candidates that would hit them, so the matrix only holds
+    # the open part of the puzzle.
+    def __init__(self, board):
+        if isinstance(board, str):
+            cells = parse_grid(board)
+        elif board and isinstance(board[0], list):
+            cells = [v for row in board for v in row]
+        else:
+            cells = list(board)
+        self.cells = cells
+        self.size = size = math.isqrt(len(cells))
+        self.box = box = math.isqrt(size)
+        if size * size != len(cells) or box * box != size:
+            raise ValueError(f"{len(cells)} cells is not a square Sudoku grid")
+
+        area = size * size
+        self.valid = True
+        satisfied = bytearray(4 * area)
+        for i, v in enumerate(cells):
+            if v:
+                for col in self.constraints(i, v - 1):
+                    if satisfied[col]:
+                        self.valid = False
+                    satisfied[col] = 1
+
+        index = [-1] * (4 * area)
+        open_columns = 0
+        for col in range(4 * area):
+            if not satisfied[col]:
+                index[col] = open_columns
+                open_columns += 1
+        self.matrix = ExactCover(open_columns)
+        self.candidates = []
+        for i, v in enumerate(cells):
+            if v:
+                continue
+            for value in range(size):
+                columns = self.constraints(i, value)
+                if not any(satisfied[col] for col in columns):
+                    self.matrix.add_row([index[col] for col in columns])
+                    self.candidates.append((i, value + 1))
+
+
+    def constraints(self, i, value):
+        size, box = self.size, self.box
+        row, col = divmod(i, size)
+        area = size * size
+        block = (row // box) * box + col // box
+        return (i, area + row * size + value, 2 * area + col * size + value, 3 * area + block * size + value)
+
+
+    def solutions(self, limit=None):
+        # Yields each solution as a flat list of cell values.
+        if not self.valid:
+            return
+        for rows in self.matrix.solutions(limit):
+            cells = self.cells[:]
+            for row in rows:
+                i, value = self.candidates[row]
+                cells[i] = value
+            yield cells
+
+
+    def count_solutions(self, limit=2):
+        return sum(1 for _ in self.solutions(limit))
+
+
+    def find_solutions(self, limit):
+        return list(self.solutions(limit))
+
+
+    def solve(self):
+        for cells in self.solutions(1):
+            self.cells = cells
+            return True
+        return False
+
+
+    def to_board(self):
+        return [self.cells[r * self.size:(r + 1) * self.size] for r in range(self.size)]
+
+
+def random_grid(box, rng=random):
+    # A solved grid from the standard pattern, with bands, stacks, the rows
+    # and columns inside them and the values shuffled.
+    size = box * box
+
+    def shuffled_lines():
+        bands = rng.sample(range(box), box)
+        return [band * box + line for band in bands for line in rng.sample(range(box), box)]
+
+    rows, cols = shuffled_lines(), shuffled_lines()
+    values = rng.sample(range(1, size + 1), size)
+    return [values[(box * (r % box) + r // box + c) % size] for r in rows for c in cols]
+
+
+def make_puzzle(box, clues, rng=random, unique=True):
+    # Empties cells of a random grid in random order until only `clues`
+    # remain, keeping a removal only while the solution stays unique.
+    cells = random_grid(box, rng)
+    order = rng.sample(range(len(cells)), len(cells))
+    filled = len(cells)
+    for i in order:
+        if filled <= clues:
+            break
+        value = cells[i]
+        cells[i] = 0
+        if unique and SudokuDLX(cells).count_solutions(2) != 1:
+            cells[i] = value
+        else:
+            filled -= 1
+    return cells
+
+
+def solve_file(path):
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line, SudokuDLX(line).find_solutions(2)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python -m engines.sudoku_dlx PUZZLE_FILE")
+        sys.exit(2)
+    start = time.perf_counter()
+    total = unique = 0
+    for puzzle, solutions in solve_file(sys.argv[1]):
+        total += 1
+        if len(solutions) == 1:
+            unique += 1
+        else:
+            print(f"{puzzle}: {'no solution' if not solutions else 'multiple solutions'}")
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed else 0.0
+    print(f"{total} puzzles, {unique} with a unique solution, {elapsed:.3f}s ({rate:.1f} puzzles/s)")
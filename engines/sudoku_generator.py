@@ -0,0 +1,235 @@
+import os
+import random
+import sys
+import threading
+
+from engines.sudoku_solver import (ALL_DIGITS, BIT_COUNT, BOX_OF, COL_OF, DIGIT_OF_BIT, ROW_OF, UNITS,
+                                   SudokuSolver, format_puzzle, parse_puzzle)
+from settings import data_path
+
+
+TIERS = ['easy', 'medium', 'hard', 'expert']
+TARGET_CLUES = {'easy': 36, 'medium': 28, 'hard': 24, 'expert': 17}
+MAX_ATTEMPTS = 50
+# Every PuzzlePool reads and rewrites its whole file, and each Sudoku window
+# has its own pool object, so they all share this lock.
+POOL_LOCK = threading.Lock()
+
+PEERS = [sorted({j for unit in UNITS if i in unit for j in unit} - {i}) for i in range(81)]
+BOX_UNITS = UNITS[18:]
+LINE_UNITS = UNITS[:18]
+
+
+def random_solution(rng=random):
+    cells = [0] * 81
+    for box in (0, 4, 8):
+        digits = list(range(1, 10))
+        rng.shuffle(digits)
+        for i, d in zip(BOX_UNITS[box], digits):
+            cells[i] = d
+    solver = SudokuSolver(cells)
+    solver.solve()
+    return solver.cells
+
+
+def has_unique_solution(cells):
+    return SudokuSolver(cells).count_solutions(2) == 1
+
+
+def grade(cells):
+    # Solves with human techniques only and reports the hardest one needed;
+    # puzzles that cannot be finished without guessing are 'expert'.
+    cells = list(cells)
+    cand = [0] * 81
+    for i in range(81):
+        if not cells[i]:
+            used = 0
+            for j in PEERS[i]:
+                if cells[j]:
+                    used |= 1 << (cells[j] - 1)
+            cand[i] = ALL_DIGITS & ~used
+
+    def assign(i, bit):
+        cells[i] = DIGIT_OF_BIT[bit]
+        cand[i] = 0
+        for j in PEERS[i]:
+            cand[j] &= ~bit
+
+    level = 0
+    while 0 in cells:
+        placed = False
+        for i in range(81):
+            if not cells[i] and BIT_COUNT[cand[i]] == 1:
+                assign(i, cand[i])
+                placed = True
+        if placed:
+            continue
+        if hidden_single(cells, cand, assign):
+            level = max(level, 1)
+        elif locked_candidates(cand) or naked_pairs(cand):
+            level = max(level, 2)
+        else:
+            return 'expert'
+    return TIERS[level]
+
+
+def hidden_single(cells, cand, assign):
+    for unit in UNITS:
+        once = twice = 0
+        for i in unit:
+            twice |= once & cand[i]
+            once |= cand[i]
+        hidden = once & ~twice
+        if hidden:
+            for i in unit:
+                if cand[i] & hidden:
+                    assign(i, cand[i] & hidden & -(cand[i] & hidden))
+                    return True
+    return False
+
+
+def locked_candidates(cand):
+    changed = False
+    for box in BOX_UNITS:
+        for d in range(9):
+            bit = 1 << d
+            spots = [i for i in box if cand[i] & bit]
+            if len(spots) < 2:
+                continue
+            for line_of, units in ((ROW_OF, UNITS[:9]), (COL_OF, UNITS[9:18])):
+                if len({line_of[i] for i in spots}) == 1:
+                    for j in units[line_of[spots[0]]]:
+                        if j not in box and cand[j] & bit:
+                            cand[j] &= ~bit
+                            changed = True
+    for line in LINE_UNITS:
+        for d in range(9):
+            bit = 1 << d
+            spots = [i for i in line if cand[i] & bit]
+            if len(spots) >= 2 and len({BOX_OF[i] for i in spots}) == 1:
+                for j in BOX_UNITS[BOX_OF[spots[0]]]:
+                    if j not in line and cand[j] & bit:
+                        cand[j] &= ~bit
+                        changed = True
+    return changed
+
+
+def naked_pairs(cand):
+    changed = False
+    for unit in UNITS:
+        pairs = {}
+        for i in unit:
+            if BIT_COUNT[cand[i]] == 2:
+                pairs.setdefault(cand[i], []).append(i)
+        for mask, cells in pairs.items():
+            if len(cells) != 2:
+                continue
+            for j in unit:
+                if j not in cells and cand[j] & mask:
+                    cand[j] &= ~mask
+                    changed = True
+    return changed
+
+
+def carve(solution, difficulty, rng=random):
+    target = TIERS.index(difficulty)
+    cells = list(solution)
+    order = list(range(81))
+    rng.shuffle(order)
+    clues = 81
+    for i in order:
+        if clues <= TARGET_CLUES[difficulty]:
+            break
+        digit = cells[i]
+        cells[i] = 0
+        if has_unique_solution(cells) and TIERS.index(grade(cells)) <= target:
+            clues -= 1
+        else:
+            cells[i] = digit
+    return cells
+
+
+def generate(difficulty='medium', rng=random):
+    if difficulty not in TIERS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    for _ in range(MAX_ATTEMPTS):
+        puzzle = carve(random_solution(rng), difficulty, rng)
+        if grade(puzzle) == difficulty:
+            return puzzle
+    return puzzle
+
+
+class PuzzlePool:
+    def __init__(self, path=None, size_per_tier=10):
+        self.path = path or data_path('sudoku_pool.txt')
+        self.size_per_tier = size_per_tier
+        self.lock = POOL_LOCK
+
+
+    def load(self):
+        entries = []
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0] in TIERS:
+                        entries.append((parts[0], parts[1]))
+        except FileNotFoundError:
+            pass
+        return entries
+
+
+    def save(self, entries):
+        # Written next to the pool and renamed over it, so a crash mid-write
+        # leaves the previous pool intact.
+        temp = self.path + '.tmp'
+        with open(temp, 'w') as f:
+            for tier, puzzle in entries:
+                f.write(f"{tier} {puzzle}\n")
+        os.replace(temp, self.path)
+
+
+    def take(self, difficulty='medium'):
+        with self.lock:
+            entries = self.load()
+            for n, (tier, puzzle) in enumerate(entries):
+                if tier == difficulty:
+                    del entries[n]
+                    self.save(entries)
+                    return parse_puzzle(puzzle)
+        return None
+
+
+    def missing(self):
+        with self.lock:
+            entries = self.load()
+        return {tier: self.size_per_tier - sum(1 for t, _ in entries if t == tier) for tier in TIERS}
+
+
+    def add(self, difficulty, puzzle):
+        # Returns False, adding nothing, once the tier is full: another
+        # window's refill may have topped it up meanwhile.
+        with self.lock:
+            entries = self.load()
+            if sum(1 for tier, _ in entries if tier == difficulty) >= self.size_per_tier:
+                return False
+            entries.append((difficulty, format_puzzle(puzzle)))
+            self.save(entries)
+        return True
+
+
+    def refill(self, task=None, rng=random):
+        for tier, count in self.missing().items():
+            for _ in range(count):
+                if task is not None and task.cancelled:
+                    return
+                if not self.add(tier, generate(tier, rng)):
+                    break
+                if task is not None:
+                    task.report(tier)
+
+
+if __name__ == "__main__":
+    pool = PuzzlePool(size_per_tier=int(sys.argv[1]) if len(sys.argv) > 1 else 10)
+    pool.refill()
+    print(f"Pool at {pool.path} is full")
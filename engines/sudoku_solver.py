@@ -0,0 +1,190 @@
+import sys
+import time
+
+
+ALL_DIGITS = 0x1FF
+SOLVED = -1
+CONFLICT = -2
+
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [3 * (i // 27) + (i % 9) // 3 for i in range(81)]
+UNITS = ([[r * 9 + c for c in range(9)] for r in range(9)] +
+         [[r * 9 + c for r in range(9)] for c in range(9)] +
+         [[(3 * (b // 3) + i // 3) * 9 + 3 * (b % 3) + i % 3 for i in range(9)] for b in range(9)])
+BIT_COUNT = [bin(mask).count('1') for mask in range(ALL_DIGITS + 1)]
+DIGIT_OF_BIT = {1 << d: d + 1 for d in range(9)}
+
+
+def parse_puzzle(text):
+    cells = []
+    for ch in text:
+        if ch in '123456789':
+            cells.append(int(ch))
+        elif ch in '0.':
+            cells.append(0)
+    if len(cells) != 81:
+        raise ValueError(f"Expected 81 cells, got {len(cells)}")
+    return cells
+
+
+def format_puzzle(cells):
+    return ''.join(str(v) if v else '.' for v in cells)
+
+
+class SudokuSolver:
+    def __init__(self, board):
+        if isinstance(board, str):
+            cells = parse_puzzle(board)
+        elif len(board) == 9:
+            cells = [v for row in board for v in row]
+        else:
+            cells = list(board)
+        self.cells = cells
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.valid = True
+        for i, v in enumerate(cells):
+            if not v:
+                continue
+            bit = 1 << (v - 1)
+            r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+            if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:
+                self.valid = False
+            self.rows[r] |= bit
+            self.cols[c] |= bit
+            self.boxes[b] |= bit
+
+
+    def solve(self):
+        solutions = self.find_solutions(1)
+        if not solutions:
+            return False
+        self.cells = solutions[0]
+        return True
+
+
+    def count_solutions(self, limit=2):
+        return len(self.find_solutions(limit))
+
+
+    def find_solutions(self, limit):
+        solutions = []
+        if self.valid:
+            state = (self.cells[:], self.rows[:], self.cols[:], self.boxes[:])
+            search(state, limit, solutions)
+        return solutions
+
+
+    def to_board(self):
+        return [self.cells[r * 9:r * 9 + 9] for r in range(9)]
+
+
+def place(state, i, bit):
+    cells, rows, cols, boxes = state
+    cells[i] = DIGIT_OF_BIT[bit]
+    rows[ROW_OF[i]] |= bit
+    cols[COL_OF[i]] |= bit
+    boxes[BOX_OF[i]] |= bit
+
+
+def propagate(state):
+    # Fills naked and hidden singles until stuck. Returns SOLVED, CONFLICT
+    # or the index of the empty cell with the fewest candidates.
+    cells, rows, cols, boxes = state
+    while True:
+        progress = False
+        best, best_count = SOLVED, 10
+        for i in range(81):
+            if cells[i]:
+                continue
+            cand = ALL_DIGITS & ~(rows[ROW_OF[i]] | cols[COL_OF[i]] | boxes[BOX_OF[i]])
+            if not cand:
+                return CONFLICT
+            if not cand & (cand - 1):
+                place(state, i, cand)
+                progress = True
+            elif not progress and BIT_COUNT[cand] < best_count:
+                best, best_count = i, BIT_COUNT[cand]
+        if progress:
+            continue
+        if best == SOLVED:
+            return SOLVED
+
+        for unit in UNITS:
+            once = twice = placed = 0
+            for i in unit:
+                if cells[i]:
+                    placed |= 1 << (cells[i] - 1)
+                    continue
+                cand = ALL_DIGITS & ~(rows[ROW_OF[i]] | cols[COL_OF[i]] | boxes[BOX_OF[i]])
+                twice |= once & cand
+                once |= cand
+            if (once | placed) != ALL_DIGITS:
+                return CONFLICT
+            hidden = once & ~twice
+            if not hidden:
+                continue
+            for i in unit:
+                if cells[i]:
+                    continue
+                cand = ALL_DIGITS & ~(rows[ROW_OF[i]] | cols[COL_OF[i]] | boxes[BOX_OF[i]])
+                single = cand & hidden
+                if not single:
+                    continue
+                if single & (single - 1):
+                    return CONFLICT
+                place(state, i, single)
+                progress = True
+        if not progress:
+            return best
+
+
+def search(state, limit, solutions):
+    cell = propagate(state)
+    if cell == CONFLICT:
+        return
+    cells, rows, cols, boxes = state
+    if cell == SOLVED:
+        solutions.append(cells[:])
+        return
+    cand = ALL_DIGITS & ~(rows[ROW_OF[cell]] | cols[COL_OF[cell]] | boxes[BOX_OF[cell]])
+    while cand:
+        bit = cand & -cand
+        cand ^= bit
+        child = (cells[:], rows[:], cols[:], boxes[:])
+        place(child, cell, bit)
+        search(child, limit, solutions)
+        if len(solutions) >= limit:
+            return
+
+
+def solve_batch(lines):
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        yield line, SudokuSolver(line).find_solutions(2)
+
+
+def solve_file(path):
+    with open(path) as f:
+        yield from solve_batch(f)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python -m engines.sudoku_solver PUZZLE_FILE")
+        sys.exit(2)
+    start = time.perf_counter()
+    total = unique = 0
+    for puzzle, solutions in solve_file(sys.argv[1]):
+        total += 1
+        if len(solutions) == 1:
+            unique += 1
+        else:
+            print(f"{puzzle}: {'no solution' if not solutions else 'multiple solutions'}")
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed else 0.0
+    print(f"{total} puzzles, {unique} with a unique solution, {elapsed:.3f}s ({rate:.0f} puzzles/s)")
@@ -0,0 +1,63 @@
+def winning_lines(size, k):
+    lines = []
+    for r in range(size):
+        for c in range(size):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r, end_c = r + (k - 1) * dr, c + (k - 1) * dc
+                if 0 <= end_r < size and 0 <= end_c < size:
+                    lines.append(tuple((r + i * dr, c + i * dc) for i in range(k)))
+    return lines
+
+
+class TicTacToeState:
+    def __init__(self, size=3, k=3):
+        self.size = size
+        self.k = k
+        self.turn = 'X'
+        self.board = [['' for _ in range(size)] for _ in range(size)]
+        self.winner = None
+        self.moves = 0
+        self.lines = winning_lines(size, k)
+        self.lines_through = {(r, c): [] for r in range(size) for c in range(size)}
+        for line in self.lines:
+            for cell in line:
+                self.lines_through[cell].append(line)
+
+
+    def apply_move(self, row, col):
+        if self.board[row][col] or self.is_over:
+            return False
+        self.board[row][col] = self.turn
+        self.moves += 1
+        if self.check_winner(row, col):
+            self.winner = self.turn
+        elif not self.is_full:
+            self.turn = 'O' if self.turn == 'X' else 'X'
+        return True
+
+
+    def valid_moves(self):
+        if self.is_over:
+            return []
+        return [(r, c) for r in range(self.size) for c in range(self.size) if not self.board[r][c]]
+
+
+    def check_winner(self, row=None, col=None):
+        # Only lines through the last move can have been completed by it.
+        lines = self.lines if row is None else self.lines_through[(row, col)]
+        board = self.board
+        for line in lines:
+            first = board[line[0][0]][line[0][1]]
+            if first and all(board[r][c] == first for r, c in line):
+                return True
+        return False
+
+
+    @property
+    def is_full(self):
+        return self.moves == self.size * self.size
+
+
+    @property
+    def is_over(self):
+        return self.winner is not None or self.is_full
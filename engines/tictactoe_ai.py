@@ -0,0 +1,221 @@
+import os
+
+from engines.tictactoe import winning_lines
+from settings import data_path
+
+
+CODES = {'': 0, 'X': 1, 'O': 2}
+WIN_SCORE = 1000
+INFINITY = 2 * WIN_SCORE
+
+
+def encode(cells):
+    key = 0
+    for code in reversed(cells):
+        key = key * 3 + code
+    return key
+
+
+def flatten(board):
+    return [CODES[value] for row in board for value in row]
+
+
+def flat_lines(size, k):
+    return [tuple(r * size + c for r, c in line) for line in winning_lines(size, k)]
+
+
+def symmetries(size):
+    def rotate(perm):
+        return [perm[(size - 1 - c) * size + r] for r in range(size) for c in range(size)]
+
+    def mirror(perm):
+        return [perm[r * size + size - 1 - c] for r in range(size) for c in range(size)]
+
+    perms = []
+    perm = list(range(size * size))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(mirror(perm))
+        perm = rotate(perm)
+    return perms
+
+
+def build_table():
+    # Exhaustive minimax over every reachable 3x3 position. Each entry packs
+    # the score for the side to move (faster wins score higher) and the best
+    # cell: ((score + 16) << 4) | cell.
+    lines = flat_lines(3, 3)
+    through = [[line for line in lines if i in line] for i in range(9)]
+    table = {}
+    cells = [0] * 9
+
+    def solve(player, empty):
+        key = encode(cells)
+        if key in table:
+            return (table[key] >> 4) - 16
+        best, best_move = -16, -1
+        for i in range(9):
+            if cells[i]:
+                continue
+            cells[i] = player
+            if any(all(cells[j] == player for j in line) for line in through[i]):
+                score = empty
+            elif empty == 1:
+                score = 0
+            else:
+                score = -solve(3 - player, empty - 1)
+            cells[i] = 0
+            if score > best:
+                best, best_move = score, i
+        table[key] = ((best + 16) << 4) | best_move
+        return best
+
+    solve(1, 9)
+    return table
+
+
+def load_table(path=None):
+    path = path or data_path('tictactoe_3x3.table')
+    if os.path.exists(path):
+        table = {}
+        try:
+            with open(path) as f:
+                for line in f:
+                    key, packed = line.split()
+                    table[int(key)] = int(packed)
+            return table
+        except ValueError:
+            # A damaged table is rebuilt and written over.
+            pass
+    table = build_table()
+    # Written next to the table and renamed over it, so a crash mid-write
+    # never leaves a partial table behind.
+    temp = path + '.tmp'
+    with open(temp, 'w') as f:
+        for key, packed in table.items():
+            f.write(f"{key} {packed}\n")
+    os.replace(temp, path)
+    return table
+
+
+class TicTacToeSearch:
+    def __init__(self, size, k, max_depth=None):
+        self.size = size
+        self.k = k
+        self.max_depth = max_depth
+        self.lines = flat_lines(size, k)
+        self.through = [[line for line in self.lines if i in line] for i in range(size * size)]
+        self.perms = symmetries(size)
+        center = (size - 1) / 2
+        self.order = sorted(range(size * size), key=lambda i: abs(i // size - center) + abs(i % size - center))
+        self.memo = {}
+
+
+    def canonical(self, cells):
+        return min(tuple(cells[p] for p in perm) for perm in self.perms)
+
+
+    def best_move(self, cells, player):
+        empty = cells.count(0)
+        depth = empty if self.max_depth is None else min(empty, self.max_depth)
+        best, best_move = -INFINITY, None
+        alpha = -INFINITY
+        for i in self.order:
+            if cells[i]:
+                continue
+            score = self.score_move(cells, i, player, empty, depth, alpha, INFINITY)
+            if score > best:
+                best, best_move = score, i
+                alpha = max(alpha, score)
+        return best_move
+
+
+    def score_move(self, cells, i, player, empty, depth, alpha, beta):
+        cells[i] = player
+        if any(all(cells[j] == player for j in line) for line in self.through[i]):
+            score = WIN_SCORE + empty
+        elif empty == 1:
+            score = 0
+        elif depth == 1:
+            score = -self.evaluate(cells, 3 - player)
+        else:
+            score = -self.negamax(cells, 3 - player, empty - 1, depth - 1, -beta, -alpha)
+        cells[i] = 0
+        return score
+
+
+    def negamax(self, cells, player, empty, depth, alpha, beta):
+        key = (self.canonical(cells), depth)
+        entry = self.memo.get(key)
+        if entry is not None:
+            flag, value = entry
+            if flag == 0:
+                return value
+            if flag > 0:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        alpha_orig = alpha
+        best = -INFINITY
+        for i in self.order:
+            if cells[i]:
+                continue
+            score = self.score_move(cells, i, player, empty, depth, alpha, beta)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= alpha_orig:
+            flag = -1
+        elif best >= beta:
+            flag = 1
+        else:
+            flag = 0
+        self.memo[key] = (flag, best)
+        return best
+
+
+    def evaluate(self, cells, player):
+        # Lines still open for one side count quadratically in the number of
+        # marks already on them.
+        score = 0
+        for line in self.lines:
+            mine = theirs = 0
+            for j in line:
+                if cells[j] == player:
+                    mine += 1
+                elif cells[j]:
+                    theirs += 1
+            if not theirs:
+                score += mine * mine
+            elif not mine:
+                score -= theirs * theirs
+        return score
+
+
+class TicTacToeAI:
+    def __init__(self, size=3, k=3, max_depth=6):
+        self.size = size
+        if size == 3 and k == 3:
+            self.table = load_table()
+            self.search = None
+        else:
+            self.table = None
+            self.search = TicTacToeSearch(size, k, max_depth)
+
+
+    def best_move(self, board, player):
+        cells = flatten(board)
+        if self.table is not None:
+            packed = self.table.get(encode(cells))
+            if packed is None:
+                return None
+            return divmod(packed & 15, 3)
+        move = self.search.best_move(cells, CODES[player])
+        return None if move is None else divmod(move, self.size)
@@ -0,0 +1,129 @@
+import queue
+import sys
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class Task:
+    def __init__(self, on_done, on_error, on_progress, owner):
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.owner = owner
+        self.future = None
+        self.progress = queue.SimpleQueue()
+        self.cancel_event = threading.Event()
+
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+    def cancel(self):
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+
+    def report(self, value):
+        if self.on_progress is not None:
+            self.progress.put(value)
+
+
+class BackgroundExecutor:
+    def __init__(self, root, workers=2, poll_ms=30):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='game-worker')
+        self.tasks = []
+        self.after_id = None
+
+
+    def submit(self, fn, *args, on_done=None, on_error=None, on_progress=None, owner=None):
+        # fn runs on a worker thread as fn(task, *args) and must not touch
+        # widgets; the callbacks are always invoked on the Tk thread.
+        task = Task(on_done, on_error, on_progress, owner)
+        task.future = self.pool.submit(self.run, task, fn, args)
+        self.tasks.append(task)
+        if self.after_id is None:
+            self.after_id = self.root.after(self.poll_ms, self.poll)
+        return task
+
+
+    def run(self, task, fn, args):
+        if task.cancelled:
+            raise CancelledError()
+        return fn(task, *args)
+
+
+    def poll(self):
+        self.after_id = None
+        pending = []
+        tasks, self.tasks = self.tasks, []
+        processed = 0
+        try:
+            for task in tasks:
+                if not self.process(task):
+                    pending.append(task)
+                processed += 1
+        finally:
+            # Tasks not reached (only if something escaped the per-callback
+            # handling) go back on the list, and polling carries on.
+            self.tasks = pending + tasks[processed:] + self.tasks
+            if self.tasks and self.after_id is None:
+                self.after_id = self.root.after(self.poll_ms, self.poll)
+
+
+    def process(self, task):
+        # Delivers the task's progress and, once it has finished, its result
+        # or error. Returns whether the task is done with.
+        done = task.future.done()
+        while not task.progress.empty():
+            value = task.progress.get()
+            if not task.cancelled:
+                self.callback(task.on_progress, value)
+        if not done:
+            return False
+        if task.cancelled or task.future.cancelled():
+            return True
+        error = task.future.exception()
+        if error is None:
+            if task.on_done is not None:
+                self.callback(task.on_done, task.future.result())
+        elif isinstance(error, CancelledError):
+            pass
+        elif task.on_error is not None:
+            self.callback(task.on_error, error)
+        else:
+            self.root.report_callback_exception(type(error), error, error.__traceback__)
+        return True
+
+
+    def callback(self, fn, *args):
+        # A failing callback is reported like any other Tk callback error,
+        # without losing the other tasks in this poll.
+        try:
+            fn(*args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+
+    def cancel_owner(self, owner):
+        for task in self.tasks:
+            if task.owner is owner:
+                task.cancel()
+
+
+    def cancel_all(self):
+        for task in self.tasks:
+            task.cancel()
+
+
+    def shutdown(self):
+        self.cancel_all()
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.tasks = []
+        self.pool.shutdown(wait=False, cancel_futures=True)
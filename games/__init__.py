@@ -0,0 +1,39 @@
+import importlib
+
+
+class GameEntry:
+    def __init__(self, name, entry_point):
+        self.name = name
+        self.entry_point = entry_point
+        self.factory = None
+
+
+    def load(self):
+        # The game's module is only imported the first time it is launched.
+        if self.factory is None:
+            module_name, attr = self.entry_point.split(':')
+            self.factory = getattr(importlib.import_module(module_name), attr)
+        return self.factory
+
+
+GAMES = [
+    GameEntry("Memory Game", 'games.memory:launch'),
+    GameEntry("Tic Tac Toe", 'games.tictactoe:launch'),
+    GameEntry("Rock Paper Scissors", 'games.rock_paper_scissors:launch'),
+    GameEntry("Number Guessing Game", 'games.number_guessing:launch'),
+    GameEntry("Hangman", 'games.hangman:launch'),
+    GameEntry("Connect Four", 'games.connect_four:launch'),
+    GameEntry("Snake", 'games.snake:launch'),
+    GameEntry("Pong", 'games.pong:launch'),
+    GameEntry("Sudoku", 'games.sudoku:launch'),
+    GameEntry("Sudoku 16x16", 'games.sudoku:launch_16'),
+    GameEntry("Minesweeper", 'games.minesweeper:launch'),
+    GameEntry("Blackjack", 'games.blackjack:launch'),
+    GameEntry("Solitaire", 'games.solitaire:launch'),
+]
+
+
+def register(name, entry_point):
+    entry = GameEntry(name, entry_point)
+    GAMES.append(entry)
+    return entry
@@ -0,0 +1,118 @@
+import time
+import tkinter as tk
+from tkinter import messagebox
+
+from engines.blackjack import BlackjackState
+from engines.cards import Shoe, card_name
+from replay import MOVE, ReplayRecorder
+
+
+DECKS = 6
+HIT, STAND, DEAL = range(3)
+
+
+class Blackjack:
+    def __init__(self, root, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Blackjack")
+
+        self.recorder = None
+        self.new_shoe()
+
+        self.create_widgets()
+
+
+    def new_shoe(self):
+        # One replay per shoe: it starts with the shuffle, records each
+        # further hand as a DEAL and ends when the cut card comes out.
+        self.end_replay()
+        self.recorder = ReplayRecorder('blackjack', (DECKS,))
+        self.state = BlackjackState(Shoe(DECKS, rng=self.recorder.rng))
+        self.wins = [0, 0]
+        self.start_hand()
+
+
+    def start_hand(self):
+        self.hand_started = time.monotonic()
+        self.hand_moves = self.recorder.moves
+
+
+    def end_replay(self):
+        # (player wins, dealer wins) over the shoe, as BlackjackReplayer
+        # counts them.
+        if self.recorder is not None:
+            self.recorder.end(*self.wins)
+
+
+    def create_widgets(self):
+        self.player_label = tk.Label(self.root, text="")
+        self.player_label.pack(pady=10)
+
+        self.dealer_label = tk.Label(self.root, text="")
+        self.dealer_label.pack(pady=10)
+
+        self.hit_button = tk.Button(self.root, text="Hit", command=self.player_hit)
+        self.hit_button.pack(pady=5)
+
+        self.stand_button = tk.Button(self.root, text="Stand", command=self.dealer_play)
+        self.stand_button.pack(pady=5)
+
+        self.deal_button = tk.Button(self.root, text="Deal", command=self.deal)
+        self.deal_button.pack(pady=5)
+
+        self.update_labels()
+
+
+    def update_labels(self):
+        player, dealer = self.state.player_hand, self.state.dealer_hand
+        self.player_label.config(text=f"Player's Hand: {player} ({player.value})")
+        if self.state.game_over:
+            self.dealer_label.config(text=f"Dealer's Hand: {dealer} ({dealer.value})")
+        else:
+            self.dealer_label.config(text="Dealer's Hand: " + card_name(dealer.cards[0]) + ", [Hidden]")
+
+
+    def deal(self):
+        if self.state.shoe.needs_shuffle:
+            self.new_shoe()
+        else:
+            self.recorder.record(MOVE, DEAL)
+            self.state.deal()
+            self.start_hand()
+        self.update_labels()
+
+
+    def player_hit(self):
+        if not self.state.game_over:
+            self.recorder.record(MOVE, HIT)
+            self.state.hit()
+            if self.state.game_over:
+                self.finish("Player busts! Dealer wins.")
+            self.update_labels()
+
+
+    def dealer_play(self):
+        if not self.state.game_over:
+            self.recorder.record(MOVE, STAND)
+            self.state.stand()
+            self.finish("Player wins!" if self.state.winner == 'player' else "Dealer wins!")
+            self.update_labels()
+
+
+    def finish(self, message):
+        # A row per hand, so duration and moves are the hand's rather than
+        # the session's that record_session would give.
+        result = 'win' if self.state.winner == 'player' else 'loss'
+        self.wins[self.state.winner == 'dealer'] += 1
+        self.scoreboard.record('blackjack', result, time.monotonic() - self.hand_started,
+                               self.recorder.moves - self.hand_moves, self.state.player_hand.value, self.recorder.seed)
+        messagebox.showinfo("Game Over", message)
+
+
+    def close(self):
+        self.end_replay()
+
+
+def launch(root, launcher):
+    return Blackjack(root, launcher.scoreboard)
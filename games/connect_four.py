@@ -0,0 +1,94 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from engines.connect_four import ConnectFourState
+from engines.connect_four_ai import ConnectFourAI
+from profiling import instrument
+from replay import MOVE, ReplayRecorder
+
+
+class ConnectFour:
+    opponents = ['Human', 'easy', 'medium', 'hard']
+
+    def __init__(self, root, executor, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Connect Four")
+        self.executor = executor
+        self.state = ConnectFourState()
+        self.recorder = ReplayRecorder('connect_four')
+        self.ai = None
+        self.thinking = None
+        self.create_widgets()
+
+
+    def create_widgets(self):
+        self.canvas = tk.Canvas(self.root, width=700, height=600, bg='blue')
+        self.canvas.pack()
+
+        for row in range(self.state.rows):
+            for col in range(self.state.columns):
+                self.canvas.create_oval(col * 100, row * 100, col * 100 + 100, row * 100 + 100, fill='white')
+
+        self.canvas.bind("<Button-1>", self.handle_click)
+
+        self.opponent = tk.StringVar(self.root, value='Human')
+        tk.Label(self.root, text="Yellow is played by:").pack(side='left', padx=5)
+        tk.OptionMenu(self.root, self.opponent, *self.opponents, command=self.change_opponent).pack(side='left')
+
+
+    def change_opponent(self, choice):
+        self.ai = None if choice == 'Human' else ConnectFourAI(choice)
+        self.maybe_think()
+
+
+    @instrument('connect_four.handle_click')
+    def handle_click(self, event):
+        if self.thinking is not None:
+            return
+        self.play(event.x // 100)
+
+
+    def play(self, col):
+        color = self.state.turn
+        row = self.state.apply_move(col)
+        if row is None:
+            return
+        self.recorder.record(MOVE, col)
+        if self.state.is_over:
+            result = {'Red': 'win', 'Yellow': 'loss', None: 'draw'}[self.state.winner]
+            self.scoreboard.record_session(self.recorder, result)
+            self.close()
+        self.draw_piece(row, col, color)
+        if self.state.winner:
+            messagebox.showinfo("Connect Four", f"{self.state.winner} wins!")
+        else:
+            self.maybe_think()
+
+
+    def close(self):
+        # Also called when the window closes: an unfinished game's replay
+        # ends with the position reached.
+        self.recorder.end(['', 'Red', 'Yellow'].index(self.state.winner or ''), self.state.moves)
+
+
+    def maybe_think(self):
+        if self.ai is None or self.thinking is not None or self.state.is_over or self.state.turn != 'Yellow':
+            return
+        ai, position = self.ai, self.state.position()
+        self.thinking = self.executor.submit(lambda task: ai.choose_move(position, task),
+                                            on_done=self.ai_move, owner=self.root)
+
+
+    def ai_move(self, col):
+        self.thinking = None
+        if self.root.winfo_exists() and col is not None:
+            self.play(col)
+
+
+    def draw_piece(self, row, col, color):
+        self.canvas.create_oval(col * 100, row * 100, col * 100 + 100, row * 100 + 100, fill=color)
+
+
+def launch(root, launcher):
+    return ConnectFour(root, launcher.executor, launcher.scoreboard)
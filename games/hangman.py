@@ -0,0 +1,64 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from engines.hangman import HangmanState
+from replay import MOVE, ReplayRecorder
+
+
+class Hangman:
+    def __init__(self, root, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Hangman")
+        self.recorder = ReplayRecorder('hangman')
+        self.state = HangmanState(rng=self.recorder.rng)
+
+        self.create_widgets()
+        self.update_display()
+
+
+    def create_widgets(self):
+        self.word_label = tk.Label(self.root, text="", font=('Helvetica', 16))
+        self.word_label.pack(pady=10)
+
+        self.letter_entry = tk.Entry(self.root)
+        self.letter_entry.pack(pady=10)
+
+        self.guess_button = tk.Button(self.root, text="Guess", command=self.guess_letter)
+        self.guess_button.pack(pady=10)
+
+        self.attempts_label = tk.Label(self.root, text=f"Attempts left: {self.state.attempts_left}")
+        self.attempts_label.pack(pady=10)
+
+
+    def update_display(self):
+        self.word_label.config(text=self.state.display_word)
+
+
+    def guess_letter(self):
+        letter = self.letter_entry.get()
+        self.letter_entry.delete(0, tk.END)
+        if not self.state.apply_move(letter):
+            return
+        self.recorder.record(MOVE, *map(ord, letter))
+        self.update_display()
+        self.attempts_label.config(text=f"Attempts left: {self.state.attempts_left}")
+
+        if self.state.is_over:
+            self.scoreboard.record_session(self.recorder, 'win' if self.state.won else 'loss',
+                                           score=self.state.attempts_left)
+            self.close()
+        if self.state.won:
+            messagebox.showinfo("Hangman", "Congratulations! You guessed the word!")
+        elif self.state.lost:
+            messagebox.showinfo("Hangman", f"Game Over! The word was: {self.state.word}")
+
+
+    def close(self):
+        # Also called when the window closes: an unfinished game's replay
+        # ends where the player left it.
+        self.recorder.end(int(self.state.won), self.state.attempts_left)
+
+
+def launch(root, launcher):
+    return Hangman(root, launcher.scoreboard)
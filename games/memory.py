@@ -0,0 +1,112 @@
+import os
+import tkinter as tk
+
+from grid_canvas import GridCanvas
+from engines.memory import MemoryState
+from replay import MATCH, MOVE, ReplayRecorder
+from snapshots import Autosaver, decode_memory, encode_memory
+
+
+class Memory:
+    def __init__(self, root, rows, columns, executor, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.rows = rows
+        self.columns = columns
+        self.recorder = None
+        self.autosave = Autosaver(self.root, executor, 'memory', self.snapshot)
+
+        self.create_widgets()
+        self.reset()
+
+
+    def reset(self):
+        if self.recorder is not None:
+            self.recorder.close()
+        self.grid.clear()
+        if not self.restore():
+            self.recorder = ReplayRecorder('memory', (self.rows, self.columns))
+            self.state = MemoryState(self.rows, self.columns, self.recorder.rng)
+        self.update_status()
+
+
+    def restore(self):
+        payload = self.autosave.load()
+        if payload is None:
+            return False
+        state, seed, replay_path, elapsed, moves = decode_memory(payload)
+        if (state.rows, state.columns) != (self.rows, self.columns):
+            return False
+        if not os.path.exists(replay_path):
+            # The replay was pruned, so it can no longer reach this position:
+            # start a new game rather than a replay that begins mid-game.
+            self.autosave.discard()
+            return False
+        self.recorder = ReplayRecorder('memory', (self.rows, self.columns), seed, replay_path, elapsed, moves)
+        state.rng = self.recorder.rng
+        self.state = state
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if state.shown[row][col]:
+                    self.grid.set_cell(row, col, text=state.board[row][col], fill='white')
+        if state.second_card is not None:
+            self.root.after(50, self.check_match)
+        return True
+
+
+    def snapshot(self):
+        if self.state.is_over or not any(map(any, self.state.shown)):
+            return None
+        recorder = self.recorder
+        return encode_memory(self.state, recorder.seed, recorder.path, recorder.elapsed, recorder.moves)
+
+
+    def save(self):
+        self.autosave.save()
+
+
+    def close(self):
+        # The replay stays open-ended: a resumed game keeps appending to it.
+        self.recorder.close()
+        self.autosave.release()
+
+
+    def create_widgets(self):
+        self.grid = GridCanvas(self.root, self.rows, self.columns, cell_size=60, on_click=self.reveal_card)
+        self.grid.grid(row=0, column=0)
+
+        self.status_label = tk.Label(self.root, text="")
+        self.status_label.grid(row=1, column=0)
+
+
+    def update_status(self):
+        scores = self.state.scores
+        self.status_label.config(text=f"Player 1: {scores[0]}  Player 2: {scores[1]}  Turn: Player {self.state.turn + 1}")
+
+
+    def reveal_card(self, row, col):
+        if self.state.apply_move(row, col):
+            self.recorder.record(MOVE, row, col)
+            self.autosave.changed()
+            self.grid.set_cell(row, col, text=self.state.board[row][col], fill='white')
+            if self.state.second_card is not None:
+                self.root.after(50, self.check_match)
+
+
+    def check_match(self):
+        cards = (self.state.first_card, self.state.second_card)
+        self.recorder.record(MATCH)
+        if not self.state.check_match():
+            for row, col in cards:
+                self.grid.reset_cell(row, col)
+        self.update_status()
+        if self.state.is_over:
+            self.autosave.discard()
+            first, second = self.state.scores
+            result = 'win' if first > second else 'loss' if first < second else 'draw'
+            self.scoreboard.record_session(self.recorder, result, score=first)
+            self.recorder.end(*self.state.scores)
+
+
+def launch(root, launcher):
+    return Memory(root, 10, 10, launcher.executor, launcher.scoreboard)
@@ -0,0 +1,250 @@
+import os
+import tkinter as tk
+from tkinter import messagebox
+
+from grid_canvas import GridCanvas
+from profiling import instrument
+from engines.minesweeper import MinesweeperState
+from engines.minesweeper_solver import MinesweeperSolver, create_no_guess_board
+from replay import FLAG, GENERATE, MOVE, ReplayRecorder
+from snapshots import Autosaver, decode_minesweeper, encode_minesweeper
+
+
+AUTO_PLAY_MS = 150
+
+
+class Minesweeper:
+    def __init__(self, root, rows, columns, mines, executor, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.executor = executor
+        self.auto_playing = False
+        self.auto_id = None
+        self.recorder = None
+        self.autosave = Autosaver(self.root, executor, 'minesweeper', self.snapshot)
+        self.create_widgets()
+        self.reset()
+
+
+    def reset(self):
+        # Mines are placed on the first click so that it never hits one.
+        self.stop_auto_play()
+        self.ready = True
+        if self.recorder is not None:
+            self.recorder.close()
+        self.grid.clear()
+        self.status.config(text="")
+        if not self.restore():
+            self.recorder = ReplayRecorder('minesweeper', (self.rows, self.columns, self.mines))
+            self.state = MinesweeperState(self.rows, self.columns, self.mines, self.recorder.rng)
+        self.solver = MinesweeperSolver(self.state)
+
+
+    def restore(self):
+        payload = self.autosave.load()
+        if payload is None:
+            return False
+        state, seed, replay_path, elapsed, moves = decode_minesweeper(payload)
+        if (state.rows, state.columns, state.mines) != (self.rows, self.columns, self.mines):
+            return False
+        if not os.path.exists(replay_path):
+            # The replay was pruned, so it can no longer reach this position:
+            # start a new game rather than a replay that begins mid-game.
+            self.autosave.discard()
+            return False
+        self.recorder = ReplayRecorder('minesweeper', (self.rows, self.columns, self.mines), seed, replay_path,
+                                       elapsed, moves)
+        state.rng = self.recorder.rng
+        self.state = state
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if state.revealed[row][col]:
+                    self.grid.set_cell(row, col, text=state.board[row][col] or '', fill='white')
+        for row, col in state.flagged:
+            self.grid.set_cell(row, col, text='F', fill='yellow')
+        return True
+
+
+    def snapshot(self):
+        if not self.state.generated or self.state.is_over:
+            return None
+        recorder = self.recorder
+        return encode_minesweeper(self.state, recorder.seed, recorder.path, recorder.elapsed, recorder.moves)
+
+
+    def save(self):
+        self.autosave.save()
+
+
+    def close(self):
+        # The replay stays open-ended: a resumed game keeps appending to it.
+        self.recorder.close()
+        self.autosave.release()
+
+
+    def board_ready(self, cell, found):
+        # found is False when no layout within the attempt budget could be
+        # cleared without guessing; the last one tried is played.
+        self.ready = True
+        self.click(*cell)
+        if found is False and not self.state.is_over:
+            self.status.config(text="No guess-free board found: this one may need a guess")
+
+
+    def create_widgets(self):
+        self.grid = GridCanvas(self.root, self.rows, self.columns, cell_size=24,
+                               on_click=self.click, on_right_click=self.flag)
+        self.grid.pack()
+
+        self.no_guess = tk.BooleanVar(self.root, value=False)
+        tk.Checkbutton(self.root, text="No guessing", variable=self.no_guess).pack(side='left', padx=5)
+        tk.Button(self.root, text="Hint", command=self.hint).pack(side='left')
+        self.auto_button = tk.Button(self.root, text="Auto-play", command=self.toggle_auto_play)
+        self.auto_button.pack(side='left')
+        self.status = tk.Label(self.root, text="")
+        self.status.pack(side='left', padx=5)
+
+
+    @instrument('minesweeper.click')
+    def click(self, row, col):
+        if not self.ready:
+            return
+        if not self.state.generated:
+            self.ready = False
+            state = self.state
+            self.recorder.record(GENERATE, row, col, int(self.no_guess.get()))
+            if self.no_guess.get():
+                create = lambda task: create_no_guess_board(state, (row, col))
+            else:
+                create = lambda task: state.create_board(safe=(row, col))
+            self.executor.submit(create, on_done=lambda found: self.board_ready((row, col), found),
+                                 owner=self.root)
+            return
+        opened = self.state.apply_move(row, col)
+        if opened:
+            self.recorder.record(MOVE, row, col)
+            self.autosave.changed()
+        if self.state.exploded:
+            self.stop_auto_play()
+            self.end_replay()
+            self.grid.set_cell(row, col, text='*', fill='red')
+            messagebox.showinfo("Game Over", "You clicked on a mine!")
+            return
+        for r, c in opened:
+            self.grid.set_cell(r, c, text=self.state.board[r][c] or '', fill='white')
+        self.check_win()
+
+
+    def flag(self, row, col):
+        if not self.ready:
+            return
+        flagged = self.state.toggle_flag(row, col)
+        if flagged is not None:
+            self.recorder.record(FLAG, row, col)
+            self.autosave.changed()
+        if flagged:
+            self.grid.set_cell(row, col, text='F', fill='yellow')
+        elif flagged is not None:
+            self.grid.reset_cell(row, col)
+
+
+    def think(self, on_done):
+        # Exact enumeration of a large frontier can take a noticeable time,
+        # so the solver runs on a worker; clicks wait for it as they wait for
+        # board generation. on_done gets (hint, proven mines) unless the game
+        # was reset meanwhile.
+        self.ready = False
+        self.status.config(text="Thinking...")
+        solver = self.solver
+
+        def done(result):
+            if solver is self.solver:
+                self.ready = True
+                self.status.config(text="")
+                on_done(result)
+        self.executor.submit(lambda task: (solver.hint(), set(solver.mines)), on_done=done, owner=self.root)
+
+
+    def hint(self):
+        if self.ready:
+            self.think(self.show_hint)
+
+
+    def show_hint(self, result):
+        hint, _ = result
+        if hint is None:
+            return
+        (row, col), probability = hint
+        if probability == 0.0:
+            self.status.config(text="Safe to open")
+        else:
+            self.status.config(text=f"Guess: {probability:.0%} chance of a mine")
+        self.grid.set_cell(row, col, fill='light green')
+
+
+    def toggle_auto_play(self):
+        if self.auto_playing:
+            self.stop_auto_play()
+        else:
+            self.auto_playing = True
+            self.auto_button.config(relief='sunken')
+            self.auto_play()
+
+
+    def stop_auto_play(self):
+        self.auto_playing = False
+        if self.auto_id is not None:
+            self.root.after_cancel(self.auto_id)
+            self.auto_id = None
+        self.auto_button.config(relief='raised')
+
+
+    def auto_play(self):
+        # One move per tick: flag every proven mine, then open the best cell.
+        self.auto_id = None
+        if self.state.is_over:
+            self.stop_auto_play()
+        elif self.ready:
+            self.think(self.auto_move)
+        else:
+            self.auto_id = self.root.after(AUTO_PLAY_MS, self.auto_play)
+
+
+    def auto_move(self, result):
+        if not self.auto_playing:
+            return
+        hint, mines = result
+        for row, col in mines - self.state.flagged:
+            self.flag(row, col)
+        if hint is None:
+            self.stop_auto_play()
+            return
+        row, col = hint[0]
+        if (row, col) in self.state.flagged:
+            self.flag(row, col)
+        self.click(row, col)
+        if self.auto_playing and not self.state.is_over:
+            self.auto_id = self.root.after(AUTO_PLAY_MS, self.auto_play)
+        else:
+            self.stop_auto_play()
+
+
+    def end_replay(self):
+        self.autosave.discard()
+        state = self.state
+        self.scoreboard.record_session(self.recorder, 'win' if state.won else 'loss', score=state.revealed_count)
+        self.recorder.end(int(state.won), int(state.exploded), state.revealed_count)
+
+
+    def check_win(self):
+        if self.state.won:
+            self.stop_auto_play()
+            self.end_replay()
+            messagebox.showinfo("Congratulations!", "You win!")
+
+
+def launch(root, launcher):
+    return Minesweeper(root, 10, 10, 25, launcher.executor, launcher.scoreboard)
@@ -0,0 +1,60 @@
+import tkinter as tk
+
+from engines.number_guessing import NumberGuessingState
+from replay import MOVE, ReplayRecorder
+
+
+class NumberGuessing:
+    messages = {'low': "Too low!", 'high': "Too high!", 'correct': "Correct! You guessed the number!"}
+
+    def __init__(self, root, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Number Guessing Game")
+
+        self.recorder = ReplayRecorder('number_guessing', (1, 100))
+        self.state = NumberGuessingState(1, 100, self.recorder.rng)
+
+        self.create_widgets()
+
+
+    def create_widgets(self):
+        self.label = tk.Label(self.root, text="Guess the number (between 1 and 100):3")
+        self.label.pack(pady=10)
+
+        self.entry = tk.Entry(self.root)
+        self.entry.pack(pady=10)
+
+        self.button = tk.Button(self.root, text="Guess", command=self.check_guess)
+        self.button.pack(pady=10)
+
+        self.result_label = tk.Label(self.root, text="", font=('Helvetica', 16))
+        self.result_label.pack(pady=10)
+
+
+    def check_guess(self):
+        if self.state.solved:
+            return
+        try:
+            guess = int(self.entry.get())
+        except ValueError:
+            self.result_label.config(text="Enter a whole number.")
+            return
+        self.recorder.record(MOVE, guess)
+        result = self.state.apply_move(guess)
+        self.result_label.config(text=self.messages[result])
+        if result == 'correct':
+            self.button.config(state='disabled')
+            self.scoreboard.record_session(self.recorder, 'win', score=self.state.guesses)
+            self.close()
+
+
+    def close(self):
+        # Also called when the window closes: an unfinished game's replay
+        # ends where the player left it.
+        if not self.recorder.ended:
+            self.recorder.end(self.state.guesses, int(self.state.solved))
+
+
+def launch(root, launcher):
+    return NumberGuessing(root, launcher.scoreboard)
@@ -0,0 +1,103 @@
+import tkinter as tk
+
+from engines.pong import PongState
+from engines.pong_ai import PongAI
+from profiling import instrument
+from replay import PADDLE, ReplayRecorder
+
+
+class Pong:
+    keys = {'w': (0, -1), 's': (0, 1), 'Up': (1, -1), 'Down': (1, 1)}
+    opponents = ['Human', 'easy', 'medium', 'hard']
+
+    def __init__(self, root, scheduler):
+        self.root = root
+        self.root.title("Pong")
+        self.recorder = ReplayRecorder('pong')
+        self.state = PongState()
+        self.canvas = tk.Canvas(self.root, width=self.state.WIDTH, height=self.state.HEIGHT, bg='black')
+        self.canvas.pack()
+
+        self.paddles = [self.canvas.create_rectangle(*self.state.paddle_coords(player), fill='white')
+                        for player in (0, 1)]
+        self.ball = self.canvas.create_oval(*self.state.ball_coords(), fill='white')
+        self.drawn_paddles = list(self.state.paddle_y)
+
+        self.ai = None
+        self.opponent = tk.StringVar(self.root, value='Human')
+        tk.Label(self.root, text="Right paddle:").pack(side='left', padx=5)
+        tk.OptionMenu(self.root, self.opponent, *self.opponents, command=self.change_opponent).pack(side='left')
+
+        self.scheduler = scheduler
+        self.start()
+
+
+    def start(self):
+        self.root.bind('<KeyPress>', self.key_down)
+        self.root.bind('<KeyRelease>', self.key_up)
+        self.frame = self.scheduler.register(self.root, "Pong", self.update, step_ms=20, render=self.render)
+
+
+    def reset(self):
+        self.recorder.end(*self.state.scores)
+        self.recorder = ReplayRecorder('pong')
+        self.state = PongState()
+        if self.ai is not None:
+            self.ai = PongAI(1, self.opponent.get())
+        self.render()
+        self.start()
+
+
+    def close(self):
+        self.recorder.end(*self.state.scores)
+
+
+    def change_opponent(self, choice):
+        self.ai = None if choice == 'Human' else PongAI(1, choice)
+        self.set_paddle(1, 0)
+
+
+    def key_down(self, event):
+        if event.keysym in self.keys:
+            player, direction = self.keys[event.keysym]
+            if not (player == 1 and self.ai):
+                self.set_paddle(player, direction)
+
+
+    def key_up(self, event):
+        if event.keysym in self.keys:
+            player, _ = self.keys[event.keysym]
+            if not (player == 1 and self.ai):
+                self.set_paddle(player, 0)
+
+
+    def set_paddle(self, player, direction):
+        # Key repeat sends the same press many times; only changes matter.
+        if self.state.paddle_dy[player] != direction * self.state.PADDLE_SPEED:
+            self.state.set_paddle(player, direction)
+            self.recorder.record(PADDLE, player, direction)
+
+
+    @instrument('pong.update')
+    def update(self):
+        if self.ai is not None:
+            # The computer's paddle changes are recorded like key presses,
+            # before the tick, so replays do not need to re-run the AI.
+            self.set_paddle(1, self.ai.control(self.state))
+        self.recorder.tick()
+        self.state.step()
+
+
+    @instrument('pong.render')
+    def render(self):
+        # Positions only live in the state; the canvas is written once per
+        # frame, and a paddle only when it has moved.
+        for player, paddle in enumerate(self.paddles):
+            if self.drawn_paddles[player] != self.state.paddle_y[player]:
+                self.drawn_paddles[player] = self.state.paddle_y[player]
+                self.canvas.coords(paddle, *self.state.paddle_coords(player))
+        self.canvas.coords(self.ball, *self.state.ball_coords())
+
+
+def launch(root, launcher):
+    return Pong(root, launcher.scheduler)
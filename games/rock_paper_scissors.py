@@ -0,0 +1,74 @@
+import tkinter as tk
+
+from engines.rock_paper_scissors import RockPaperScissorsState
+from engines.rps_ai import RPSPredictor
+from replay import MOVE, ReplayRecorder
+
+
+class RockPaperScissors:
+    results = {"You win!": 'win', "Computer wins!": 'loss', "It's a draw!": 'draw'}
+    opponents = ['Adaptive', 'Random']
+
+    def __init__(self, root, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Rock Paper Scissors")
+
+        self.opponent = tk.StringVar(self.root, value='Adaptive')
+        self.recorder = None
+        self.new_session()
+
+        self.create_widgets()
+
+
+    def new_session(self):
+        # The adaptive computer's moves follow from the player's and the
+        # seed, so the replay only needs to know which computer was played.
+        if self.recorder is not None:
+            self.recorder.end(*self.state.scores)
+        adaptive = self.opponent.get() == 'Adaptive'
+        self.recorder = ReplayRecorder('rock_paper_scissors', (int(adaptive),))
+        opponent = RPSPredictor(self.recorder.rng) if adaptive else None
+        self.state = RockPaperScissorsState(self.recorder.rng, opponent)
+
+
+    def create_widgets(self):
+        self.player_label = tk.Label(self.root, text="Choose: Rock, Paper, or Scissors")
+        self.player_label.pack(pady=10)
+
+        self.result_label = tk.Label(self.root, text="")
+        self.result_label.pack(pady=10)
+
+        for choice in self.state.choices:
+            button = tk.Button(self.root, text=choice, width=10, height=2,
+                               command=lambda c=choice: self.make_choice(c))
+            button.pack(pady=5)
+
+        tk.Label(self.root, text="Computer:").pack(side='left', padx=5)
+        tk.OptionMenu(self.root, self.opponent, *self.opponents, command=self.change_opponent).pack(side='left')
+
+
+    def change_opponent(self, choice):
+        self.new_session()
+        self.result_label.config(text="")
+
+
+    def make_choice(self, choice):
+        self.recorder.record(MOVE, self.state.choices.index(choice))
+        result = self.state.apply_move(choice)
+        self.scoreboard.record('rock_paper_scissors', self.results[result], moves=1, seed=self.recorder.seed)
+        self.update_result()
+
+
+    def update_result(self):
+        wins, losses = self.state.scores
+        self.result_label.config(text=f"You chose: {self.state.player_choice}\nComputer chose: {self.state.computer_choice}\n"
+                                      f"{self.state.result}\nYou {wins} - {losses} Computer")
+
+
+    def close(self):
+        self.recorder.end(*self.state.scores)
+
+
+def launch(root, launcher):
+    return RockPaperScissors(root, launcher.scoreboard)
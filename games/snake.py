@@ -0,0 +1,120 @@
+import tkinter as tk
+from tkinter import messagebox
+from collections import deque
+
+from engines.snake import DIRECTIONS, SnakeState
+from engines.snake_ai import SnakeAutopilot
+from profiling import instrument
+from replay import DIRECTION, ReplayRecorder
+
+
+class Snake:
+    CELL = 20
+
+    def __init__(self, root, scheduler, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Snake")
+        self.canvas = tk.Canvas(self.root, width=400, height=400, bg='black')
+        self.canvas.pack()
+        self.autopilot_button = tk.Button(self.root, text="Autopilot", command=self.toggle_autopilot)
+        self.autopilot_button.pack()
+        self.scheduler = scheduler
+        self.recorder = None
+        self.autopilot = None
+        self.reset()
+
+
+    def reset(self):
+        self.canvas.delete('all')
+        size = 400 // self.CELL
+        self.end_replay()
+        self.recorder = ReplayRecorder('snake', (size, size))
+        self.state = SnakeState(size, size, rng=self.recorder.rng)
+        if self.autopilot is not None:
+            self.autopilot = SnakeAutopilot(self.state)
+        self.segments = deque(self.canvas.create_rectangle(*self.cell_coords(cell), fill='green')
+                              for cell in self.state.body)
+        self.food_item = self.canvas.create_oval(*self.cell_coords(self.state.food), fill='red')
+        self.moves = []
+        self.running = True
+        self.root.bind('<KeyPress>', self.change_direction)
+        self.frame = self.scheduler.register(self.root, "Snake", self.update, step_ms=100, render=self.render)
+
+
+    def cell_coords(self, cell):
+        x, y = cell[0] * self.CELL, cell[1] * self.CELL
+        return x, y, x + self.CELL, y + self.CELL
+
+
+    def change_direction(self, event):
+        if event.keysym in DIRECTIONS and self.autopilot is None:
+            self.set_direction(event.keysym)
+
+
+    def set_direction(self, direction):
+        if direction != self.state.direction:
+            self.state.direction = direction
+            self.recorder.record(DIRECTION, list(DIRECTIONS).index(direction))
+
+
+    def toggle_autopilot(self):
+        if self.autopilot is None:
+            self.autopilot = SnakeAutopilot(self.state)
+            self.autopilot_button.config(relief='sunken')
+        else:
+            self.autopilot = None
+            self.autopilot_button.config(relief='raised')
+
+
+    def end_replay(self):
+        if self.recorder is not None:
+            self.recorder.end(len(self.state.body), int(self.state.alive))
+
+
+    def close(self):
+        self.end_replay()
+
+
+    @instrument('snake.update')
+    def update(self):
+        if not self.running:
+            return
+
+        if self.autopilot is not None:
+            # Recorded like a key press, before the tick.
+            self.set_direction(self.autopilot.choose())
+        self.recorder.tick()
+        moved = self.state.step()
+        if moved is None:
+            self.finish('loss', "You lost!")
+            return
+        self.moves.append(moved)
+        if self.state.won:
+            self.finish('win', "You filled the board!")
+
+
+    def finish(self, result, message):
+        self.scoreboard.record_session(self.recorder, result, score=len(self.state.body))
+        self.end_replay()
+        self.running = False
+        self.frame.stop()
+        self.root.after_idle(lambda: messagebox.showinfo("Game Over", message))
+
+
+    @instrument('snake.render')
+    def render(self):
+        for head, tail in self.moves:
+            if tail is None:
+                self.segments.append(self.canvas.create_rectangle(*self.cell_coords(head), fill='green'))
+                if self.state.food is not None:
+                    self.canvas.coords(self.food_item, *self.cell_coords(self.state.food))
+            else:
+                item = self.segments.popleft()
+                self.canvas.coords(item, *self.cell_coords(head))
+                self.segments.append(item)
+        self.moves.clear()
+
+
+def launch(root, launcher):
+    return Snake(root, launcher.scheduler, launcher.scoreboard)
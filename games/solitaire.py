@@ -0,0 +1,176 @@
+import os
+import tkinter as tk
+
+from engines.cards import card_name, is_red
+from engines.solitaire import CARD, FACE_UP, SolitaireState
+from replay import MOVE, ReplayRecorder
+from snapshots import Autosaver, decode_solitaire, encode_solitaire
+
+
+CARD_WIDTH, CARD_HEIGHT = 70, 95
+LEFT, TOP, PITCH = 50, 40, 100
+TABLEAU_TOP = 170
+FACE_DOWN_GAP, FACE_UP_GAP = 10, 22
+WASTE = 7
+DRAW, FOUND, STACK = range(3)
+
+
+class Solitaire:
+    def __init__(self, root, executor, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Solitaire")
+        self.selected = None
+        self.autosave = Autosaver(self.root, executor, 'solitaire', self.snapshot)
+
+        if not self.restore():
+            self.recorder = ReplayRecorder('solitaire')
+            self.state = SolitaireState(self.recorder.rng)
+
+        self.create_widgets()
+
+
+    def restore(self):
+        payload = self.autosave.load()
+        if payload is None:
+            return False
+        state, seed, replay_path, elapsed, moves = decode_solitaire(payload)
+        if not os.path.exists(replay_path):
+            # The replay was pruned, so it can no longer reach this position:
+            # start a new game rather than a replay that begins mid-game.
+            self.autosave.discard()
+            return False
+        self.state = state
+        self.recorder = ReplayRecorder('solitaire', (), seed, replay_path, elapsed, moves)
+        return True
+
+
+    def snapshot(self):
+        # Decided by the table rather than the recorder, whose move count
+        # starts again at 0 in a resumed game.
+        if self.state.won or self.state.untouched:
+            return None
+        recorder = self.recorder
+        return encode_solitaire(self.state, recorder.seed, recorder.path, recorder.elapsed, recorder.moves)
+
+
+    def save(self):
+        self.autosave.save()
+
+
+    def close(self):
+        # The replay stays open-ended: a resumed game keeps appending to it.
+        self.recorder.close()
+        self.autosave.release()
+
+
+    def create_widgets(self):
+        self.canvas = tk.Canvas(self.root, width=800, height=600, bg='green')
+        self.canvas.pack()
+        self.canvas.bind('<Button-1>', self.click)
+        self.canvas.bind('<Double-Button-1>', self.double_click)
+
+        self.draw_piles()
+
+
+    def draw_card(self, x, y, card, selected=False):
+        outline = 'yellow' if selected else 'black'
+        if card & FACE_UP:
+            card &= CARD
+            self.canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, fill='white', outline=outline, width=2)
+            self.canvas.create_text(x + 6, y + 4, text=card_name(card), anchor='nw',
+                                    fill='red' if is_red(card) else 'black')
+        else:
+            self.canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, fill='navy', outline=outline, width=2)
+
+
+    def draw_slot(self, x, y):
+        self.canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, outline='darkgreen', width=2)
+
+
+    def draw_piles(self):
+        # The whole table is at most 52 cards, so it is redrawn after each move.
+        self.canvas.delete('all')
+        state = self.state
+        top_row = [(0, state.stock), (1, state.waste)] + [(3 + i, pile) for i, pile in enumerate(state.foundation)]
+        for column, pile in top_row:
+            x = LEFT + column * PITCH
+            if pile:
+                self.draw_card(x, TOP, pile[-1], selected=column == 1 and self.selected == WASTE)
+            else:
+                self.draw_slot(x, TOP)
+        for i, pile in enumerate(state.tableau):
+            x, y = LEFT + i * PITCH, TABLEAU_TOP
+            if not pile:
+                self.draw_slot(x, y)
+            for card in pile:
+                self.draw_card(x, y, card, selected=self.selected == i and card & FACE_UP)
+                y += FACE_UP_GAP if card & FACE_UP else FACE_DOWN_GAP
+
+
+    def pile_at(self, x, y):
+        # Returns ('stock' | 'waste' | 'foundation' | 'tableau', index) or None.
+        column = (x - LEFT) // PITCH
+        if not 0 <= column < 7 or (x - LEFT) % PITCH > CARD_WIDTH:
+            return None
+        if TOP <= y <= TOP + CARD_HEIGHT:
+            if column == 0:
+                return 'stock', 0
+            if column == 1:
+                return 'waste', WASTE
+            if column >= 3:
+                return 'foundation', column - 3
+            return None
+        if y >= TABLEAU_TOP:
+            return 'tableau', column
+        return None
+
+
+    def click(self, event):
+        target = self.pile_at(event.x, event.y)
+        if target is None:
+            self.selected = None
+        elif target[0] == 'stock':
+            self.recorder.record(MOVE, DRAW)
+            self.state.draw()
+            self.selected = None
+            self.changed()
+        elif self.selected is None:
+            if target[0] != 'foundation' and self.state.source(target[1]):
+                self.selected = target[1]
+        elif target[0] == 'foundation':
+            self.move_to_foundation(self.selected)
+        elif target[0] == 'tableau':
+            if self.state.move_to_tableau(self.selected, target[1]):
+                self.recorder.record(MOVE, STACK, self.selected, target[1])
+                self.changed()
+            self.selected = None
+        else:
+            self.selected = target[1]
+        self.draw_piles()
+
+
+    def double_click(self, event):
+        target = self.pile_at(event.x, event.y)
+        if target is not None and target[0] in ('waste', 'tableau'):
+            self.move_to_foundation(target[1])
+            self.draw_piles()
+
+
+    def move_to_foundation(self, index):
+        if self.state.move_to_foundation(index):
+            self.recorder.record(MOVE, FOUND, index)
+            self.changed()
+        self.selected = None
+
+
+    def changed(self):
+        self.autosave.changed()
+        if self.state.won:
+            self.autosave.discard()
+            self.scoreboard.record_session(self.recorder, 'win', score=52)
+            self.recorder.end(1, 52)
+
+
+def launch(root, launcher):
+    return Solitaire(root, launcher.executor, launcher.scoreboard)
@@ -0,0 +1,151 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from engines.sudoku_dlx import SYMBOLS, SudokuDLX, make_puzzle
+from engines.sudoku_generator import PuzzlePool
+from engines.sudoku_solver import SudokuSolver
+from profiling import instrument
+from snapshots import Autosaver, decode_sudoku, encode_sudoku
+
+
+# Share of the cells given in generated puzzles larger than 9x9.
+LARGE_CLUES = 0.6
+FONT_SIZES = {3: 18, 4: 12, 5: 10}
+
+
+class Sudoku:
+    DEFAULT_BOARD = [[5, 3, 0, 0, 7, 0, 0, 0, 0],
+                     [6, 0, 0, 1, 9, 5, 0, 0, 0],
+                     [0, 9, 8, 0, 0, 0, 0, 6, 0],
+                     [8, 0, 0, 0, 6, 0, 0, 0, 3],
+                     [4, 0, 0, 8, 0, 3, 0, 0, 1],
+                     [7, 0, 0, 0, 2, 0, 0, 0, 6],
+                     [0, 6, 0, 0, 0, 0, 2, 8, 0],
+                     [0, 0, 0, 4, 1, 9, 0, 0, 5],
+                     [0, 0, 0, 0, 8, 0, 0, 7, 9]]
+
+    def __init__(self, root, executor, difficulty='medium', box=3):
+        self.root = root
+        self.box = box
+        self.size = box * box
+        self.root.title("Sudoku" if box == 3 else f"Sudoku {self.size}x{self.size}")
+        self.executor = executor
+        self.solved = False
+        self.board = None
+        self.autosave = Autosaver(self.root, executor, 'sudoku' if box == 3 else f'sudoku{self.size}', self.snapshot)
+
+        self.create_widgets()
+        payload = self.autosave.load()
+        if payload is not None:
+            board, entries = decode_sudoku(payload)
+            self.show_puzzle(board, entries)
+        elif box == 3:
+            self.pool = PuzzlePool()
+            puzzle = self.pool.take(difficulty)
+            if puzzle is None:
+                self.show_puzzle([row[:] for row in self.DEFAULT_BOARD])
+            else:
+                self.show_puzzle([puzzle[r * 9:r * 9 + 9] for r in range(9)])
+            self.executor.submit(lambda task: self.pool.refill(task), owner=self.root)
+        else:
+            # Larger puzzles take a few seconds to generate with a unique
+            # solution, so that happens on a worker.
+            clues = int(self.size * self.size * LARGE_CLUES)
+            self.executor.submit(lambda task: make_puzzle(box, clues), on_done=self.show_generated, owner=self.root)
+
+
+    def create_widgets(self):
+        font = ('Helvetica', FONT_SIZES.get(self.box, 10))
+        self.entries = [[tk.Entry(self.root, width=2 if self.box > 3 else 3, font=font, justify='center')
+                         for _ in range(self.size)] for _ in range(self.size)]
+        for row in range(self.size):
+            for col in range(self.size):
+                self.entries[row][col].grid(row=row, column=col)
+
+        self.solve_button = tk.Button(self.root, text="Solve", command=self.solve, state='disabled')
+        self.solve_button.grid(row=self.size, column=0, columnspan=self.size)
+
+
+    def show_generated(self, cells):
+        if self.root.winfo_exists():
+            self.show_puzzle([cells[r * self.size:(r + 1) * self.size] for r in range(self.size)])
+
+
+    def show_puzzle(self, board, entries=None):
+        self.board = board
+        self.givens = [row[:] for row in board]
+        for row in range(self.size):
+            for col in range(self.size):
+                entry = self.entries[row][col]
+                if board[row][col] != 0:
+                    entry.insert(0, SYMBOLS[board[row][col] - 1])
+                    entry.config(state='disabled')
+                else:
+                    if entries is not None and entries[row][col]:
+                        entry.insert(0, SYMBOLS[entries[row][col] - 1])
+                    entry.bind('<KeyRelease>', lambda event: self.autosave.changed())
+        self.solve_button.config(state='normal')
+
+
+    def entered(self):
+        symbols = SYMBOLS[:self.size]
+        values = []
+        for row in range(self.size):
+            values.append([])
+            for col in range(self.size):
+                text = self.entries[row][col].get().upper()
+                valid = not self.givens[row][col] and len(text) == 1 and text in symbols
+                values[row].append(symbols.index(text) + 1 if valid else 0)
+        return values
+
+
+    def snapshot(self):
+        if self.solved or self.board is None:
+            return None
+        return encode_sudoku(self.givens, self.entered())
+
+
+    def save(self):
+        self.autosave.save()
+
+
+    def close(self):
+        self.autosave.release()
+
+
+    def solve(self):
+        self.solve_button.config(state='disabled')
+        self.executor.submit(lambda task: self.solve_board(), on_done=self.show_solution, owner=self.root)
+
+
+    def show_solution(self, solved):
+        if not self.root.winfo_exists():
+            return
+        self.solve_button.config(state='normal')
+        if solved:
+            self.solved = True
+            self.autosave.discard()
+            for row in range(self.size):
+                for col in range(self.size):
+                    self.entries[row][col].delete(0, tk.END)
+                    self.entries[row][col].insert(0, SYMBOLS[self.board[row][col] - 1])
+        else:
+            messagebox.showinfo("Sudoku", "No solution exists")
+
+
+    @instrument('sudoku.solve_board')
+    def solve_board(self):
+        # 9x9 keeps the bitmask solver the generator uses; larger grids need Dancing Links.
+        solver = SudokuSolver(self.board) if self.box == 3 else SudokuDLX(self.board)
+        if not solver.solve():
+            return False
+        self.board = solver.to_board()
+        return True
+
+
+def launch(root, launcher):
+    return Sudoku(root, launcher.executor)
+
+
+def launch_16(root, launcher):
+    return Sudoku(root, launcher.executor, box=4)
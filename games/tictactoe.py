@@ -0,0 +1,76 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from grid_canvas import GridCanvas
+from engines.tictactoe import TicTacToeState
+from engines.tictactoe_ai import TicTacToeAI
+from replay import MOVE, ReplayRecorder
+
+
+class TicTacToe:
+    def __init__(self, root, scoreboard):
+        self.root = root
+        self.scoreboard = scoreboard
+        self.root.title("Tic Tac Toe")
+
+        self.state = TicTacToeState()
+        self.recorder = ReplayRecorder('tictactoe', (3, 3))
+        self.ai = None
+
+        self.create_widgets()
+
+
+    def reset(self):
+        self.state = TicTacToeState()
+        self.recorder.close()
+        self.recorder = ReplayRecorder('tictactoe', (3, 3))
+        self.grid.clear()
+        self.computer_turn()
+
+
+    def close(self):
+        self.recorder.end(' XO'.index(self.state.winner or ' '), self.state.moves)
+
+
+    def create_widgets(self):
+        self.grid = GridCanvas(self.root, 3, 3, cell_size=100, font=('Helvetica', 32), on_click=self.click)
+        self.grid.pack()
+
+        self.opponent = tk.StringVar(self.root, value='Human')
+        tk.Label(self.root, text="O is played by:").pack(side='left', padx=5)
+        tk.OptionMenu(self.root, self.opponent, 'Human', 'Computer', command=self.change_opponent).pack(side='left')
+
+
+    def change_opponent(self, choice):
+        self.ai = TicTacToeAI() if choice == 'Computer' else None
+        self.computer_turn()
+
+
+    def click(self, row, col):
+        if self.ai is not None and self.state.turn == 'O':
+            return
+        self.play(row, col)
+        self.computer_turn()
+
+
+    def computer_turn(self):
+        if self.ai is not None and self.state.turn == 'O' and not self.state.is_over:
+            self.play(*self.ai.best_move(self.state.board, 'O'))
+
+
+    def play(self, row, col):
+        if self.state.apply_move(row, col):
+            self.recorder.record(MOVE, row, col)
+            self.grid.set_cell(row, col, text=self.state.board[row][col])
+            if self.state.is_over:
+                result = {'X': 'win', 'O': 'loss', None: 'draw'}[self.state.winner]
+                self.scoreboard.record_session(self.recorder, result)
+                self.recorder.end(' XO'.index(self.state.winner or ' '), self.state.moves)
+            if self.state.winner:
+                messagebox.showinfo("Game Over", f"{self.state.winner} wins!")
+            elif self.state.is_full:
+                messagebox.showinfo("Game Over", "It's a draw!")
+
+
+def launch(root, launcher):
+    return TicTacToe(root, launcher.scoreboard)
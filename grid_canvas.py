@@ -0,0 +1,118 @@
+import tkinter as tk
+
+from profiling import instrument
+
+
+class GridCanvas:
+    def __init__(self, root, rows, columns, cell_size=40, fill='gray80', outline='gray40',
+                 font=('Helvetica', 12), on_click=None, on_right_click=None):
+        self.root = root
+        self.rows = rows
+        self.columns = columns
+        self.cell_size = cell_size
+        self.default_fill = fill
+        self.font = font
+        self.on_click = on_click
+        self.on_right_click = on_right_click
+
+        self.fills = [fill] * (rows * columns)
+        self.texts = [''] * (rows * columns)
+        self.colors = ['black'] * (rows * columns)
+        self.rect_ids = []
+        self.text_ids = {}
+        self.dirty = set()
+        self.flush_id = None
+
+        self.canvas = tk.Canvas(root, width=columns * cell_size, height=rows * cell_size,
+                                highlightthickness=0, bg=outline)
+        for row in range(rows):
+            for col in range(columns):
+                x, y = col * cell_size, row * cell_size
+                self.rect_ids.append(self.canvas.create_rectangle(x + 1, y + 1, x + cell_size - 1, y + cell_size - 1,
+                                                                  fill=fill, width=0))
+
+        self.canvas.bind("<Button-1>", self.handle_click)
+        self.canvas.bind("<Button-3>", self.handle_right_click)
+
+
+    def grid(self, **kwargs):
+        self.canvas.grid(**kwargs)
+
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+
+    def cell_at(self, x, y):
+        row, col = int(y) // self.cell_size, int(x) // self.cell_size
+        if 0 <= row < self.rows and 0 <= col < self.columns:
+            return row, col
+        return None
+
+
+    def handle_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and self.on_click is not None:
+            self.on_click(*cell)
+
+
+    def handle_right_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and self.on_right_click is not None:
+            self.on_right_click(*cell)
+
+
+    def set_cell(self, row, col, text=None, fill=None, color=None):
+        index = row * self.columns + col
+        if text is not None:
+            self.texts[index] = str(text)
+        if fill is not None:
+            self.fills[index] = fill
+        if color is not None:
+            self.colors[index] = color
+        self.dirty.add(index)
+        self.schedule_flush()
+
+
+    def schedule_flush(self):
+        if self.flush_id is None:
+            self.flush_id = self.root.after_idle(self.flush)
+
+
+    def reset_cell(self, row, col):
+        self.set_cell(row, col, text='', fill=self.default_fill, color='black')
+
+
+    def clear(self):
+        size = self.rows * self.columns
+        self.fills = [self.default_fill] * size
+        self.texts = [''] * size
+        self.colors = ['black'] * size
+        self.dirty = set(range(size))
+        self.flush_id = None
+        self.schedule_flush()
+
+
+    def get_text(self, row, col):
+        return self.texts[row * self.columns + col]
+
+
+    @instrument('grid_canvas.flush')
+    def flush(self):
+        # Redraws only the cells touched since the last flush; text items
+        # are created the first time a cell gets any text.
+        self.flush_id = None
+        for index in self.dirty:
+            self.canvas.itemconfig(self.rect_ids[index], fill=self.fills[index])
+            text = self.texts[index]
+            text_id = self.text_ids.get(index)
+            if text_id is None:
+                if not text:
+                    continue
+                row, col = divmod(index, self.columns)
+                self.text_ids[index] = self.canvas.create_text(
+                    col * self.cell_size + self.cell_size // 2, row * self.cell_size + self.cell_size // 2,
+                    text=text, fill=self.colors[index], font=self.font)
+            else:
+                self.canvas.itemconfig(text_id, text=text, fill=self.colors[index])
+        self.dirty.clear()
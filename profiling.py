@@ -0,0 +1,221 @@
+import functools
+import os
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from contextlib import nullcontext
+
+
+# Instrumentation is decided when a hot path is decorated: with profiling
+# off the decorators hand back the original function, so there is no cost at
+# all. Set GAME_PROFILE=1, or call enable() before the games are imported
+# (they are loaded lazily on first launch).
+enabled = bool(os.environ.get('GAME_PROFILE'))
+
+MAX_EVENTS = 100000
+BUCKETS = 32
+OVERLAY_MS = 500
+
+sections = {}
+events = deque(maxlen=MAX_EVENTS)
+tcl_calls = 0
+origin = time.perf_counter_ns()
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+class SectionStats:
+    # Call count, total time and a latency histogram with power-of-two
+    # microsecond buckets: bucket i holds calls that took < 2**i us.
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.tcl_calls = 0
+        self.buckets = [0] * BUCKETS
+
+
+    def add(self, elapsed_ns, tcl):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.tcl_calls += tcl
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.buckets[min(BUCKETS - 1, (elapsed_ns // 1000).bit_length())] += 1
+
+
+    def percentile(self, fraction):
+        # Upper bound of the bucket holding the requested rank, in ms.
+        rank = fraction * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(2 ** i / 1000, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+
+    def stats(self):
+        return {
+            'calls': self.calls,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.total_ns / 1e6 / self.calls if self.calls else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ns / 1e6,
+            'tcl_calls': self.tcl_calls,
+            'histogram_us': {f"<{2 ** i}": count for i, count in enumerate(self.buckets) if count},
+        }
+
+
+def get_section(name):
+    section = sections.get(name)
+    if section is None:
+        section = sections[name] = SectionStats(name)
+    return section
+
+
+def record(name, start_ns, end_ns, tcl):
+    get_section(name).add(end_ns - start_ns, tcl)
+    events.append((name, start_ns, end_ns - start_ns, threading.get_ident()))
+
+
+def instrument(name):
+    def decorate(fn):
+        if not enabled:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tcl = tcl_calls
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter_ns(), tcl_calls - tcl)
+        return wrapper
+    return decorate
+
+
+class Timed:
+    def __init__(self, name):
+        self.name = name
+
+
+    def __enter__(self):
+        self.tcl = tcl_calls
+        self.start = time.perf_counter_ns()
+        return self
+
+
+    def __exit__(self, *exc):
+        record(self.name, self.start, time.perf_counter_ns(), tcl_calls - self.tcl)
+        return False
+
+
+NOT_TIMED = nullcontext()
+
+
+def timed(name):
+    # with timed('name'): ... - the context manager form of instrument().
+    return Timed(name) if enabled else NOT_TIMED
+
+
+class CountingTk:
+    # Stands in for a Tk interpreter and counts the commands sent to it.
+    # Widgets copy their master's .tk, so installing it on the root before
+    # any widget exists makes every widget go through it.
+    def __init__(self, tkapp):
+        self.tkapp = tkapp
+
+
+    def call(self, *args):
+        global tcl_calls
+        tcl_calls += 1
+        return self.tkapp.call(*args)
+
+
+    def __getattr__(self, name):
+        return getattr(self.tkapp, name)
+
+
+def install_tcl_counter(root):
+    if enabled and not isinstance(root.tk, CountingTk):
+        root.tk = CountingTk(root.tk)
+
+
+def pending_afters(root):
+    return len(root.tk.splitlist(root.tk.call('after', 'info')))
+
+
+def snapshot():
+    return {name: section.stats() for name, section in sorted(sections.items())}
+
+
+def export_json(path):
+    import json
+    with open(path, 'w') as f:
+        json.dump({'sections': snapshot(), 'tcl_calls': tcl_calls}, f, indent=2)
+
+
+def export_chrome_trace(path):
+    # Complete ('X') events in microseconds; load the file in about:tracing
+    # or Perfetto.
+    import json
+    trace = [{'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': tid,
+              'ts': (start - origin) / 1000, 'dur': duration / 1000}
+             for name, start, duration, tid in list(events)]
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+
+class ProfilerOverlay:
+    # A small always-on-top window with frame rates and frame times from the
+    # scheduler, pending after callbacks and the busiest hot paths.
+    def __init__(self, root, scheduler):
+        self.root = root
+        self.scheduler = scheduler
+        self.window = tk.Toplevel(root)
+        self.window.title("Profiler")
+        self.window.attributes('-topmost', True)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.label = tk.Label(self.window, text="", font=('Courier', 10), justify='left', anchor='w')
+        self.label.pack(fill='both', padx=5, pady=5)
+        self.frames = {}
+        self.last = time.perf_counter()
+        self.after_id = self.root.after(OVERLAY_MS, self.refresh)
+
+
+    def refresh(self):
+        now = time.perf_counter()
+        elapsed = now - self.last
+        self.last = now
+        lines = []
+        for client in self.scheduler.clients:
+            stats = client.stats()
+            fps = (client.frames - self.frames.get(client.name, client.frames)) / elapsed
+            self.frames[client.name] = client.frames
+            if 'p50_ms' in stats:
+                lines.append(f"{client.name}: {fps:5.1f} fps  p50 {stats['p50_ms']:.1f}ms  "
+                             f"p99 {stats['p99_ms']:.1f}ms  dropped {stats['dropped']}")
+        lines.append(f"pending after: {pending_afters(self.root)}  tcl calls: {tcl_calls}")
+        busiest = sorted(sections.values(), key=lambda section: section.total_ns, reverse=True)[:5]
+        for section in busiest:
+            lines.append(f"{section.name}: {section.calls} calls  p50 {section.percentile(0.5):.2f}ms  "
+                         f"p99 {section.percentile(0.99):.2f}ms  tcl {section.tcl_calls}")
+        self.label.config(text='\n'.join(lines))
+        self.after_id = self.root.after(OVERLAY_MS, self.refresh)
+
+
+    def close(self):
+        # Runs when the window is closed and again when the launcher quits.
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.window.winfo_exists():
+            self.window.destroy()
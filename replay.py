@@ -0,0 +1,486 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+from engines.blackjack import BlackjackState
+from engines.cards import Shoe
+from engines.connect_four import ConnectFourState
+from engines.hangman import HangmanState
+from engines.memory import MemoryState
+from engines.minesweeper import MinesweeperState
+from engines.minesweeper_solver import create_no_guess_board
+from engines.number_guessing import NumberGuessingState
+from engines.pong import PongState
+from engines.rock_paper_scissors import RockPaperScissorsState
+from engines.rps_ai import RPSPredictor
+from engines.snake import DIRECTIONS, SnakeState
+from engines.solitaire import SolitaireState
+from engines.tictactoe import TicTacToeState
+from settings import data_path
+from snapshots import referenced_replays
+
+
+MAGIC = b'RPLY'
+VERSION = 1
+MAX_REPLAYS = 50
+
+# Event codes. Each record is: steps since the previous record, code,
+# argument count, arguments (zigzag varints so negative values stay short).
+END, MOVE, FLAG, MATCH, GENERATE, DIRECTION, PADDLE = range(7)
+
+
+def new_seed():
+    return int.from_bytes(os.urandom(4), 'little')
+
+
+def write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def replay_dir():
+    path = data_path('replays')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+# Replay files an open ReplayRecorder is writing to.
+recording = set()
+
+
+def prune_replays(path, keep=MAX_REPLAYS, in_use=()):
+    # Removes the oldest replays beyond keep, skipping those in use: a file
+    # still being recorded, or one a saved game will append to on resume.
+    names = sorted(name for name in os.listdir(path) if name.endswith('.rpl'))
+    removable = [name for name in names if os.path.join(path, name) not in in_use]
+    for name in removable[:max(0, len(names) - keep)]:
+        os.remove(os.path.join(path, name))
+
+
+class ReplayRecorder:
+    # Owns the seeded Random a game draws from and appends the game's input
+    # events to its replay file as they happen. Given the path of an existing
+    # replay (a game resumed from a snapshot) it keeps appending to it, and
+    # elapsed and moves carry on the play time and move count saved with it.
+    def __init__(self, game, params=(), seed=None, path=None, elapsed=0.0, moves=0):
+        self.game = game
+        self.params = tuple(params)
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.steps = 0
+        self.last_step = 0
+        self.moves = moves
+        self.started = time.monotonic() - elapsed
+        self.ended = False
+        if path and os.path.exists(path):
+            self.path = path
+            self.file = open(path, 'ab')
+            recording.add(path)
+            return
+        if not path:
+            directory = replay_dir()
+            prune_replays(directory, MAX_REPLAYS - 1, recording | referenced_replays())
+            path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{game}-{self.seed}.rpl")
+        self.path = path
+        header = bytearray(MAGIC)
+        write_varint(header, VERSION)
+        name = game.encode()
+        write_varint(header, len(name))
+        header += name
+        write_varint(header, self.seed)
+        write_varint(header, len(self.params))
+        for value in self.params:
+            write_varint(header, zigzag(value))
+        self.file = open(path, 'wb')
+        self.file.write(header)
+        self.file.flush()
+        recording.add(path)
+
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+
+    def tick(self):
+        self.steps += 1
+
+
+    def record(self, code, *args):
+        if self.ended:
+            return
+        out = bytearray()
+        write_varint(out, self.steps - self.last_step)
+        write_varint(out, code)
+        write_varint(out, len(args))
+        for value in args:
+            write_varint(out, zigzag(value))
+        self.last_step = self.steps
+        if code != END:
+            self.moves += 1
+        self.file.write(out)
+        self.file.flush()
+
+
+    def end(self, *summary):
+        # Records the outcome so the runner can check that the replay
+        # reaches it, and closes the file.
+        self.record(END, *summary)
+        self.close()
+
+
+    def close(self):
+        self.ended = True
+        recording.discard(self.path)
+        if not self.file.closed:
+            self.file.close()
+
+
+def read_replay(path):
+    # Returns (game, seed, params, events) with events as (step, code, args).
+    # A record cut short by a crash ends the event list.
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    version, pos = read_varint(data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported replay version: {version}")
+    length, pos = read_varint(data, pos)
+    game = data[pos:pos + length].decode()
+    seed, pos = read_varint(data, pos + length)
+    count, pos = read_varint(data, pos)
+    params = []
+    for _ in range(count):
+        value, pos = read_varint(data, pos)
+        params.append(unzigzag(value))
+
+    events = []
+    step = 0
+    try:
+        while pos < len(data):
+            delta, pos = read_varint(data, pos)
+            code, pos = read_varint(data, pos)
+            count, pos = read_varint(data, pos)
+            args = []
+            for _ in range(count):
+                value, pos = read_varint(data, pos)
+                args.append(unzigzag(value))
+            step += delta
+            events.append((step, code, tuple(args)))
+    except IndexError:
+        pass
+    return game, seed, params, events
+
+
+class Replayer:
+    realtime = False
+
+    def __init__(self, seed, params):
+        self.rng = random.Random(seed)
+        self.steps = 0
+
+
+    def step(self):
+        self.steps += 1
+
+
+class MemoryReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = MemoryState(*params, rng=self.rng)
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(*args)
+        elif code == MATCH:
+            self.state.check_match()
+
+
+    def summary(self):
+        return tuple(self.state.scores)
+
+
+class MinesweeperReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = MinesweeperState(*params, rng=self.rng)
+
+
+    def apply(self, code, args):
+        if code == GENERATE:
+            row, col, no_guess = args
+            if no_guess:
+                create_no_guess_board(self.state, (row, col))
+            else:
+                self.state.create_board(safe=(row, col))
+        elif code == MOVE:
+            self.state.apply_move(*args)
+        elif code == FLAG:
+            self.state.toggle_flag(*args)
+
+
+    def summary(self):
+        return int(self.state.won), int(self.state.exploded), self.state.revealed_count
+
+
+class SnakeReplayer(Replayer):
+    realtime = True
+
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.directions = list(DIRECTIONS)
+        self.state = SnakeState(*params, rng=self.rng)
+
+
+    def step(self):
+        super().step()
+        self.state.step()
+
+
+    def apply(self, code, args):
+        if code == DIRECTION:
+            self.state.direction = self.directions[args[0]]
+
+
+    def summary(self):
+        return len(self.state.body), int(self.state.alive)
+
+
+class PongReplayer(Replayer):
+    realtime = True
+
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = PongState()
+
+
+    def step(self):
+        super().step()
+        self.state.step()
+
+
+    def apply(self, code, args):
+        if code == PADDLE:
+            self.state.set_paddle(*args)
+
+
+    def summary(self):
+        return tuple(self.state.scores)
+
+
+class RockPaperScissorsReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        # Replays from before the adaptive computer have no params.
+        opponent = RPSPredictor(self.rng) if params and params[0] else None
+        self.state = RockPaperScissorsState(self.rng, opponent)
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(self.state.choices[args[0]])
+
+
+    def summary(self):
+        return tuple(self.state.scores)
+
+
+class NumberGuessingReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = NumberGuessingState(*params, rng=self.rng)
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(args[0])
+
+
+    def summary(self):
+        return self.state.guesses, int(self.state.solved)
+
+
+class HangmanReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = HangmanState(rng=self.rng)
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(''.join(map(chr, args)))
+
+
+    def summary(self):
+        return int(self.state.won), self.state.attempts_left
+
+
+class TicTacToeReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = TicTacToeState(*params)
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(*args)
+
+
+    def summary(self):
+        return ' XO'.index(self.state.winner or ' '), self.state.moves
+
+
+class ConnectFourReplayer(Replayer):
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = ConnectFourState()
+
+
+    def apply(self, code, args):
+        if code == MOVE:
+            self.state.apply_move(args[0])
+
+
+    def summary(self):
+        return ['', 'Red', 'Yellow'].index(self.state.winner or ''), self.state.moves
+
+
+class BlackjackReplayer(Replayer):
+    # MOVE 0 = hit, 1 = stand, 2 = deal the next hand from the same shoe. A
+    # replay covers one shoe, from its shuffle to the cut card.
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = BlackjackState(Shoe(*params, rng=self.rng))
+        self.wins = [0, 0]
+
+
+    def apply(self, code, args):
+        if code != MOVE:
+            return
+        if args[0] == 2:
+            self.state.deal()
+            return
+        if args[0] == 0:
+            self.state.hit()
+        else:
+            self.state.stand()
+        if self.state.game_over:
+            self.wins[self.state.winner == 'dealer'] += 1
+
+
+    def summary(self):
+        return tuple(self.wins)
+
+
+class SolitaireReplayer(Replayer):
+    # MOVE 0 = draw, (1, source) = to the foundation, (2, source, target) =
+    # onto a tableau pile.
+    def __init__(self, seed, params):
+        super().__init__(seed, params)
+        self.state = SolitaireState(self.rng)
+
+
+    def apply(self, code, args):
+        if code != MOVE:
+            return
+        if args[0] == 0:
+            self.state.draw()
+        elif args[0] == 1:
+            self.state.move_to_foundation(args[1])
+        else:
+            self.state.move_to_tableau(args[1], args[2])
+
+
+    def summary(self):
+        return int(self.state.won), sum(map(len, self.state.foundation))
+
+
+REPLAYERS = {
+    'memory': MemoryReplayer,
+    'minesweeper': MinesweeperReplayer,
+    'snake': SnakeReplayer,
+    'pong': PongReplayer,
+    'rock_paper_scissors': RockPaperScissorsReplayer,
+    'number_guessing': NumberGuessingReplayer,
+    'hangman': HangmanReplayer,
+    'tictactoe': TicTacToeReplayer,
+    'connect_four': ConnectFourReplayer,
+    'blackjack': BlackjackReplayer,
+    'solitaire': SolitaireReplayer,
+}
+
+
+def run(path):
+    # Re-executes a replay headlessly. Returns (replayer, recorded summary
+    # or None, number of events).
+    game, seed, params, events = read_replay(path)
+    if game not in REPLAYERS:
+        raise ValueError(f"No replayer for game: {game}")
+    replayer = REPLAYERS[game](seed, params)
+    expected = None
+    for step, code, args in events:
+        if replayer.realtime:
+            while replayer.steps < step:
+                replayer.step()
+        if code == END:
+            expected = args
+            break
+        replayer.apply(code, args)
+    return replayer, expected, len(events)
+
+
+def replay_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.rpl'))
+        else:
+            yield path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-run recorded games headlessly and check their outcomes")
+    parser.add_argument('paths', nargs='*', help="replay files or directories (default: the replay directory)")
+    parser.add_argument('--repeat', type=int, default=1, help="run each replay this many times for timing")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in replay_paths(args.paths or [replay_dir()]):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            replayer, expected, count = run(path)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        summary = replayer.summary()
+        if expected is None:
+            status = "unfinished"
+        elif tuple(expected) == summary:
+            status = "ok"
+        else:
+            status = f"MISMATCH: recorded {tuple(expected)}, replayed {summary}"
+            failures += 1
+        print(f"{os.path.basename(path)}: {count} events, {replayer.steps} steps, {elapsed * 1000:.2f}ms, {status}")
+    sys.exit(1 if failures else 0)
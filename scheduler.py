@@ -0,0 +1,153 @@
+import time
+from collections import deque
+
+
+class FrameClient:
+    def __init__(self, scheduler, window, name, update, render, step_ms, max_steps):
+        self.scheduler = scheduler
+        self.window = window
+        self.name = name
+        self.update = update
+        self.render = render
+        self.step = step_ms / 1000
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last = time.perf_counter()
+        self.frame_times = deque(maxlen=240)
+        self.frames = 0
+        self.steps = 0
+        self.dropped = 0
+        self.active = True
+
+
+    def advance(self, now):
+        # Fixed timestep: run whole simulation steps for the time that has
+        # passed, but never more than max_steps per frame; anything beyond
+        # that is dropped so a slow frame cannot snowball.
+        begin = time.perf_counter()
+        self.accumulator += now - self.last
+        self.last = now
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps and self.active:
+            self.update()
+            self.accumulator -= self.step
+            steps += 1
+        if self.accumulator >= self.step:
+            self.dropped += int(self.accumulator // self.step)
+            self.accumulator %= self.step
+        if steps and self.active and self.render is not None:
+            self.render()
+        if steps:
+            self.steps += steps
+            self.frames += 1
+            self.frame_times.append(time.perf_counter() - begin)
+
+
+    def pause(self, now):
+        self.last = now
+
+
+    def stop(self):
+        self.active = False
+        self.scheduler.unregister(self)
+
+
+    def stats(self):
+        times = sorted(self.frame_times)
+        if not times:
+            return {'frames': 0, 'steps': self.steps, 'dropped': self.dropped}
+        return {
+            'frames': self.frames,
+            'steps': self.steps,
+            'dropped': self.dropped,
+            'mean_ms': 1000 * sum(times) / len(times),
+            'p50_ms': 1000 * times[len(times) // 2],
+            'p99_ms': 1000 * times[min(len(times) - 1, len(times) * 99 // 100)],
+            'max_ms': 1000 * times[-1],
+        }
+
+
+class FrameScheduler:
+    def __init__(self, root, frame_ms=16):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.clients = []
+        self.after_id = None
+        self.watched = set()
+
+
+    def register(self, window, name, update, step_ms, render=None, max_steps=5):
+        taken = {client.name for client in self.clients}
+        unique, n = name, 1
+        while unique in taken:
+            n += 1
+            unique = f"{name} ({n})"
+        client = FrameClient(self, window, unique, update, render, step_ms, max_steps)
+        self.clients.append(client)
+        if self.after_id is None:
+            self.after_id = self.root.after(self.frame_ms, self.tick)
+        return client
+
+
+    def unregister(self, client):
+        client.active = False
+        if client in self.clients:
+            self.clients.remove(client)
+
+
+    def unregister_window(self, window):
+        self.watched.discard(window)
+        for client in list(self.clients):
+            if client.window is window:
+                self.unregister(client)
+
+
+    def watch(self, window):
+        # <Map> fires when a withdrawn or iconified window is shown again.
+        if window not in self.watched:
+            self.watched.add(window)
+            window.bind('<Map>', self.wake, add='+')
+
+
+    def wake(self, event=None):
+        if self.after_id is None and self.clients:
+            now = time.perf_counter()
+            for client in self.clients:
+                client.pause(now)
+            self.after_id = self.root.after(self.frame_ms, self.tick)
+
+
+    def tick(self):
+        self.after_id = None
+        start = time.perf_counter()
+        viewable = False
+        for client in list(self.clients):
+            if not client.window.winfo_exists():
+                self.unregister(client)
+            elif not client.window.winfo_viewable():
+                client.pause(start)
+            else:
+                client.advance(start)
+                viewable = True
+        if not self.clients:
+            return
+        if viewable:
+            elapsed_ms = int(1000 * (time.perf_counter() - start))
+            self.after_id = self.root.after(max(1, self.frame_ms - elapsed_ms), self.tick)
+        else:
+            # Nothing is on screen: sleep until a window is mapped again
+            # rather than polling at the frame rate.
+            for client in self.clients:
+                self.watch(client.window)
+
+
+    def stats(self):
+        return {client.name: client.stats() for client in self.clients}
+
+
+    def stop(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        for client in list(self.clients):
+            self.unregister(client)
@@ -0,0 +1,181 @@
+import math
+import queue
+import threading
+import time
+
+from settings import data_path
+
+
+BATCH_SIZE = 100
+LINGER = 0.2
+# How often flush checks that the writer is still running.
+FLUSH_POLL = 0.5
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    finished REAL NOT NULL,
+    result TEXT NOT NULL,
+    duration REAL,
+    moves INTEGER,
+    score REAL,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_by_result ON results (game, result);
+CREATE INDEX IF NOT EXISTS results_by_score ON results (game, score);
+CREATE INDEX IF NOT EXISTS results_by_duration ON results (game, duration);
+CREATE INDEX IF NOT EXISTS results_by_moves ON results (game, moves);
+'''
+
+# Columns that leaderboards and percentiles may sort on; each has an index
+# led by game.
+RANKED = ('score', 'duration', 'moves')
+
+
+def connect(path):
+    # sqlite3 is imported here so that loading it happens on the writer
+    # thread rather than during launcher start-up.
+    import sqlite3
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class Scoreboard:
+    # Finished games are queued by the Tk thread and written by one worker
+    # thread in batches, one transaction per batch. Queries run on the
+    # caller's thread against a separate connection; WAL lets them read while
+    # a batch is being written, so they may miss results still queued.
+    def __init__(self, path=None, batch_size=BATCH_SIZE, linger=LINGER):
+        self.path = path or data_path('scoreboard.sqlite3')
+        self.batch_size = batch_size
+        self.linger = linger
+        self.queue = queue.SimpleQueue()
+        self.reader = None
+        self.reader_lock = threading.Lock()
+        self.error = None
+        self.writer = threading.Thread(target=self.write_loop, name='scoreboard-writer', daemon=True)
+        self.writer.start()
+
+
+    def record(self, game, result, duration=None, moves=None, score=None, seed=None):
+        self.queue.put((game, time.time(), result, duration, moves, score, seed))
+
+
+    def record_session(self, recorder, result, score=None):
+        # A game's ReplayRecorder already knows its seed, start time and
+        # number of input events.
+        self.record(recorder.game, result, recorder.elapsed, recorder.moves, score, recorder.seed)
+
+
+    def write_loop(self):
+        # Keeps whatever stopped the writer so that flush can report it.
+        try:
+            self.write_batches()
+        except BaseException as error:
+            self.error = error
+            raise
+
+
+    def write_batches(self):
+        connection = connect(self.path)
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            rows = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    continue
+                else:
+                    rows.append(item)
+            if rows:
+                with connection:
+                    connection.executemany('INSERT INTO results (game, finished, result, duration, moves, score, seed) '
+                                           'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+        connection.close()
+
+
+    def flush(self, timeout=None):
+        # Blocks until everything recorded so far is committed. Raises if
+        # the writer has stopped, since nothing would ever be committed.
+        done = threading.Event()
+        self.queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(FLUSH_POLL if deadline is None else
+                            max(0, min(FLUSH_POLL, deadline - time.monotonic()))):
+            if not self.writer.is_alive() and not done.is_set():
+                raise RuntimeError("Scoreboard writer has stopped") from self.error
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return True
+
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+
+    def query(self, sql, params=()):
+        with self.reader_lock:
+            if self.reader is None:
+                self.reader = connect(self.path)
+            return self.reader.execute(sql, params).fetchall()
+
+
+    def leaderboard(self, game, column='score', descending=True, limit=10, result=None):
+        if column not in RANKED:
+            raise ValueError(f"Cannot rank by {column}")
+        order = 'DESC' if descending else 'ASC'
+        where = f'game = ? AND {column} IS NOT NULL'
+        params = [game]
+        if result is not None:
+            where += ' AND result = ?'
+            params.append(result)
+        return self.query(f'SELECT {column}, result, duration, moves, seed, finished FROM results '
+                          f'WHERE {where} ORDER BY {column} {order} LIMIT ?', params + [limit])
+
+
+    def win_rates(self):
+        # {game: (played, won, win rate)}
+        rows = self.query("SELECT game, COUNT(*), SUM(result = 'win') FROM results GROUP BY game")
+        return {game: (played, won, won / played) for game, played, won in rows}
+
+
+    def percentile(self, game, column, fraction):
+        # Nearest-rank percentile, read straight off the (game, column) index.
+        if column not in RANKED:
+            raise ValueError(f"Cannot rank by {column}")
+        where = f'game = ? AND {column} IS NOT NULL'
+        (count,), = self.query(f'SELECT COUNT(*) FROM results WHERE {where}', (game,))
+        if not count:
+            return None
+        offset = min(count - 1, max(0, math.ceil(fraction * count) - 1))
+        (value,), = self.query(f'SELECT {column} FROM results WHERE {where} ORDER BY {column} LIMIT 1 OFFSET ?',
+                               (game, offset))
+        return value
+
+
+    def summary(self):
+        lines = []
+        for game, (played, won, rate) in sorted(self.win_rates().items()):
+            median = self.percentile(game, 'duration', 0.5)
+            duration = '' if median is None else f", median {median:.0f}s"
+            lines.append(f"{game}: {played} played, {rate:.0%} won{duration}")
+        return '\n'.join(lines) or "No games finished yet."
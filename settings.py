@@ -0,0 +1,9 @@
+import os
+
+
+DATA_DIR = os.path.join(os.path.expanduser('~'), '.game_launcher')
+
+
+def data_path(name):
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, name)
@@ -0,0 +1,340 @@
+import math
+import os
+import struct
+import threading
+import zlib
+from array import array
+
+from engines.memory import MemoryState
+from engines.minesweeper import MinesweeperState
+from engines.solitaire import SolitaireState
+from settings import data_path
+
+
+MAGIC = b'SNAP'
+VERSION = 2
+AUTOSAVE_MS = 1000
+
+# Minesweeper cells are one byte each: board value + 1 in the low nibble,
+# then a revealed bit and a flagged bit.
+REVEALED_BIT = 0x10
+FLAGGED_BIT = 0x20
+# Maps a cell byte to its board value as a signed byte (mines become 0xff,
+# read back as -1 through array('b')).
+BOARD_TABLE = bytes(((b & 0x0f) - 1) & 0xff for b in range(256))
+REVEALED_TABLE = bytes(int(bool(b & REVEALED_BIT)) for b in range(256))
+FLAGGED_TABLE = bytes(int(bool(b & FLAGGED_BIT)) for b in range(256))
+
+
+# Snapshot paths held by an Autosaver of an open window.
+claimed = set()
+
+
+def snapshot_dir():
+    directory = data_path('snapshots')
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def snapshot_path(game, slot=1):
+    return os.path.join(snapshot_dir(), f"{game}.snap" if slot == 1 else f"{game}-{slot}.snap")
+
+
+def encode_snapshot(game, payload):
+    name = game.encode()
+    return MAGIC + struct.pack('<BB', VERSION, len(name)) + name + zlib.compress(payload, 1)
+
+
+def decode_snapshot(data, game):
+    if data[:4] != MAGIC:
+        raise ValueError("Not a snapshot")
+    version, length = struct.unpack_from('<BB', data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if data[6:6 + length].decode() != game:
+        raise ValueError("Snapshot belongs to another game")
+    return zlib.decompress(data[6 + length:])
+
+
+def write_snapshot(path, data):
+    # Written next to the target and renamed over it, so a crash mid-write
+    # leaves the previous snapshot intact.
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def pack_bits(flags):
+    flags = list(flags)
+    out = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            out[i >> 3] |= 1 << (i & 7)
+    return bytes(out)
+
+
+def unpack_bits(data, count):
+    return [bool(data[i >> 3] & (1 << (i & 7))) for i in range(count)]
+
+
+def pack_string(text):
+    data = text.encode()
+    return struct.pack('<H', len(data)) + data
+
+
+def unpack_string(data, pos):
+    length, = struct.unpack_from('<H', data, pos)
+    return data[pos + 2:pos + 2 + length].decode(), pos + 2 + length
+
+
+def pack_session(replay_path, elapsed, moves):
+    # The replay being appended to, plus the play time and move count so far
+    # so that a resumed game's scoreboard row covers the whole game.
+    return pack_string(replay_path) + struct.pack('<dI', elapsed, moves)
+
+
+def unpack_session(data, pos):
+    # Returns (replay path, elapsed, moves, position after them).
+    replay_path, pos = unpack_string(data, pos)
+    elapsed, moves = struct.unpack_from('<dI', data, pos)
+    return replay_path, elapsed, moves, pos + struct.calcsize('<dI')
+
+
+# Where pack_session starts in each game's payload, after its fixed header.
+SESSION_OFFSETS = {
+    'minesweeper': struct.calcsize('<HHIBI'),
+    'memory': struct.calcsize('<HHBHHHHI'),
+    'solitaire': struct.calcsize('<I'),
+}
+
+
+def referenced_replays():
+    # Replay paths that saved games will append to when they are resumed.
+    directory = snapshot_dir()
+    paths = set()
+    for name in os.listdir(directory):
+        if not name.endswith('.snap'):
+            continue
+        try:
+            with open(os.path.join(directory, name), 'rb') as f:
+                data = f.read()
+            game = data[6:6 + data[5]].decode()
+            if game in SESSION_OFFSETS:
+                paths.add(unpack_session(decode_snapshot(data, game), SESSION_OFFSETS[game])[0])
+        except (OSError, ValueError, IndexError, struct.error, zlib.error):
+            continue
+    return paths
+
+
+def encode_minesweeper(state, seed=0, replay_path='', elapsed=0.0, moves=0):
+    cells = bytes([value + 1 for row in state.board for value in row])
+    revealed = bytes([flag for row in state.revealed for flag in row])
+    # No byte can carry into its neighbour, so one big-int OR merges the
+    # two arrays cell by cell.
+    merged = int.from_bytes(cells, 'little') | (int.from_bytes(revealed, 'little') << 4)
+    cells = bytearray(merged.to_bytes(len(cells), 'little'))
+    for r, c in state.flagged:
+        cells[r * state.columns + c] |= FLAGGED_BIT
+    flags = int(state.generated) | int(state.exploded) << 1
+    header = struct.pack('<HHIBI', state.rows, state.columns, state.mines, flags, seed)
+    return header + pack_session(replay_path, elapsed, moves) + bytes(cells)
+
+
+def decode_minesweeper(payload, rng=None):
+    # Returns (state, seed, replay path, elapsed, moves).
+    rows, columns, mines, flags, seed = struct.unpack_from('<HHIBI', payload)
+    replay_path, elapsed, moves, pos = unpack_session(payload, struct.calcsize('<HHIBI'))
+    state = MinesweeperState(rows, columns, mines) if rng is None else MinesweeperState(rows, columns, mines, rng)
+    cells = payload[pos:pos + rows * columns]
+    board = array('b', cells.translate(BOARD_TABLE))
+    revealed_bytes = cells.translate(REVEALED_TABLE)
+    revealed = list(map(bool, revealed_bytes))
+    state.board = [board[r * columns:(r + 1) * columns].tolist() for r in range(rows)]
+    state.revealed = [revealed[r * columns:(r + 1) * columns] for r in range(rows)]
+    state.revealed_count = revealed_bytes.count(1)
+    flagged = cells.translate(FLAGGED_TABLE)
+    state.flagged = set()
+    index = flagged.find(1)
+    while index != -1:
+        state.flagged.add(divmod(index, columns))
+        index = flagged.find(1, index + 1)
+    state.generated = bool(flags & 1)
+    state.exploded = bool(flags & 2)
+    return state, seed, replay_path, elapsed, moves
+
+
+def encode_memory(state, seed=0, replay_path='', elapsed=0.0, moves=0):
+    # Icons are the strings '0'..'n'; they are stored as n + 1, 0 for none.
+    icons = array('H', [int(icon) + 1 if icon else 0 for row in state.board for icon in row])
+    first, second = (0 if card is None else card[0] * state.columns + card[1] + 1
+                     for card in (state.first_card, state.second_card))
+    header = struct.pack('<HHBHHHHI', state.rows, state.columns, state.turn, state.scores[0], state.scores[1],
+                         first, second, seed)
+    shown = pack_bits(flag for row in state.shown for flag in row)
+    return header + pack_session(replay_path, elapsed, moves) + shown + icons.tobytes()
+
+
+def decode_memory(payload, rng=None):
+    rows, columns, turn, score1, score2, first, second, seed = struct.unpack_from('<HHBHHHHI', payload)
+    replay_path, elapsed, moves, pos = unpack_session(payload, struct.calcsize('<HHBHHHHI'))
+    state = MemoryState(rows, columns) if rng is None else MemoryState(rows, columns, rng)
+    count = rows * columns
+    shown = unpack_bits(payload[pos:], count)
+    icons = array('H')
+    icons.frombytes(payload[pos + (count + 7) // 8:pos + (count + 7) // 8 + 2 * count])
+    state.board = [[str(icons[r * columns + c] - 1) if icons[r * columns + c] else '' for c in range(columns)]
+                   for r in range(rows)]
+    state.shown = [shown[r * columns:(r + 1) * columns] for r in range(rows)]
+    state.turn = turn
+    state.scores = [score1, score2]
+    state.first_card = divmod(first - 1, columns) if first else None
+    state.second_card = divmod(second - 1, columns) if second else None
+    return state, seed, replay_path, elapsed, moves
+
+
+def encode_sudoku(givens, entries):
+    return bytes(value for row in givens for value in row) + bytes(value for row in entries for value in row)
+
+
+def decode_sudoku(payload):
+    # Givens then entries, one byte per cell; the grid size follows from the
+    # length.
+    size = math.isqrt(len(payload) // 2)
+    area = size * size
+    givens = [list(payload[r * size:(r + 1) * size]) for r in range(size)]
+    entries = [list(payload[area + r * size:area + (r + 1) * size]) for r in range(size)]
+    return givens, entries
+
+
+def encode_piles(piles):
+    # Piles of small-int cards (face-up cards have bit 6 set): a pile count,
+    # then each pile as its length followed by its cards.
+    out = bytearray([len(piles)])
+    for pile in piles:
+        out.append(len(pile))
+        out += bytes(pile)
+    return bytes(out)
+
+
+def decode_piles(payload, pos=0):
+    piles = []
+    count = payload[pos]
+    pos += 1
+    for _ in range(count):
+        length = payload[pos]
+        piles.append(list(payload[pos + 1:pos + 1 + length]))
+        pos += 1 + length
+    return piles, pos
+
+
+def encode_solitaire(state, seed=0, replay_path='', elapsed=0.0, moves=0):
+    # Piles in SolitaireState.piles order: tableau, foundation, stock, waste.
+    return struct.pack('<I', seed) + pack_session(replay_path, elapsed, moves) + encode_piles(state.piles)
+
+
+def decode_solitaire(payload):
+    seed, = struct.unpack_from('<I', payload)
+    replay_path, elapsed, moves, pos = unpack_session(payload, 4)
+    piles, _ = decode_piles(payload, pos)
+    state = SolitaireState.__new__(SolitaireState)
+    state.tableau = piles[:7]
+    state.foundation = piles[7:11]
+    state.stock, state.waste = piles[11:13]
+    return state, seed, replay_path, elapsed, moves
+
+
+class Autosaver:
+    # Debounces saves of one game's snapshot. encode() runs on the Tk thread
+    # (it only packs arrays) and returns None when there is nothing worth
+    # keeping; compression and the disk write happen on a worker thread.
+    #
+    # Every open window of a game needs its own snapshot, so the file is
+    # claimed on first use: the lowest slot no other open window holds,
+    # kept until release() when the window closes.
+    def __init__(self, root, executor, game, encode, delay_ms=AUTOSAVE_MS):
+        self.root = root
+        self.executor = executor
+        self.game = game
+        self.encode = encode
+        self.delay_ms = delay_ms
+        self.path = None
+        self.after_id = None
+        self.lock = threading.Lock()
+        self.generation = 0
+
+
+    def claim(self):
+        if self.path is None:
+            slot = 1
+            while snapshot_path(self.game, slot) in claimed:
+                slot += 1
+            self.path = snapshot_path(self.game, slot)
+            claimed.add(self.path)
+        return self.path
+
+
+    def release(self):
+        self.cancel()
+        claimed.discard(self.path)
+        self.path = None
+
+
+    def changed(self):
+        if self.after_id is None:
+            self.after_id = self.root.after(self.delay_ms, self.flush)
+
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+
+    def flush(self):
+        self.after_id = None
+        payload = self.encode()
+        if payload is None:
+            self.discard()
+            return
+        self.generation += 1
+        generation, path = self.generation, self.claim()
+        self.executor.submit(lambda task: self.write(payload, generation, path))
+
+
+    def write(self, payload, generation, path):
+        data = encode_snapshot(self.game, payload)
+        with self.lock:
+            # A newer save or a discard may have happened while this waited.
+            if generation == self.generation:
+                write_snapshot(path, data)
+
+
+    def save(self):
+        self.cancel()
+        payload = self.encode()
+        if payload is None:
+            self.discard()
+            return
+        self.generation += 1
+        self.write(payload, self.generation, self.claim())
+
+
+    def load(self):
+        try:
+            with open(self.claim(), 'rb') as f:
+                return decode_snapshot(f.read(), self.game)
+        except FileNotFoundError:
+            return None
+        except (ValueError, zlib.error):
+            self.discard()
+            return None
+
+
+    def discard(self):
+        self.cancel()
+        path = self.claim()
+        with self.lock:
+            self.generation += 1
+            if os.path.exists(path):
+                os.remove(path)
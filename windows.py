@@ -0,0 +1,146 @@
+import tkinter as tk
+
+from profiling import timed
+
+
+MAX_POOLED = 2
+
+
+class GameWindow(tk.Toplevel):
+    # A Toplevel that remembers the after callbacks and bindings made on it,
+    # so they can all be dropped when the game is closed.
+    def __init__(self, manager, entry):
+        super().__init__(manager.root)
+        self.manager = manager
+        self.entry = entry
+        self.game = None
+        self.after_ids = set()
+        self.bindings = []
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+
+    def after(self, ms, func=None, *args):
+        if func is None:
+            return super().after(ms)
+
+        def callback(*args):
+            self.after_ids.discard(after_id)
+            return func(*args)
+
+        after_id = super().after(ms, callback, *args)
+        self.after_ids.add(after_id)
+        return after_id
+
+
+    def after_cancel(self, after_id):
+        self.after_ids.discard(after_id)
+        super().after_cancel(after_id)
+
+
+    def bind(self, sequence=None, func=None, add=None):
+        funcid = super().bind(sequence, func, add)
+        if func is not None:
+            self.bindings.append((sequence, funcid))
+        return funcid
+
+
+    def close(self):
+        self.manager.release(self)
+
+
+    def clear(self, keep_widgets=False):
+        for after_id in list(self.after_ids):
+            self.after_cancel(after_id)
+        for sequence, funcid in self.bindings:
+            self.unbind(sequence, funcid)
+        self.bindings = []
+        self.manager.scheduler.unregister_window(self)
+        self.manager.executor.cancel_owner(self)
+        if not keep_widgets:
+            for child in self.winfo_children():
+                child.destroy()
+            self.game = None
+
+
+class WindowManager:
+    def __init__(self, root, executor, scheduler):
+        self.root = root
+        self.executor = executor
+        self.scheduler = scheduler
+        self.open_windows = set()
+        self.pools = {}
+        self.on_change = None
+
+
+    def open(self, entry, launcher):
+        pool = self.pools.get(entry.name)
+        if pool:
+            window = pool.pop()
+            window.deiconify()
+        else:
+            window = GameWindow(self, entry)
+        self.open_windows.add(window)
+        with timed(f"open {entry.name}"):
+            if window.game is not None:
+                window.game.reset()
+            else:
+                window.game = entry.load()(window, launcher)
+        self.changed()
+        return window.game
+
+
+    def release(self, window):
+        # Games with a reset() method keep their widgets and are reset on the
+        # next launch; others are cleared and rebuilt into the same window.
+        self.open_windows.discard(window)
+        self.close_game(window)
+        pool = self.pools.setdefault(window.entry.name, [])
+        if len(pool) >= MAX_POOLED:
+            window.clear()
+            window.destroy()
+        else:
+            window.clear(keep_widgets=hasattr(window.game, 'reset'))
+            window.withdraw()
+            pool.append(window)
+        self.changed()
+
+
+    def close_game(self, window):
+        # save() keeps a resumable game's snapshot; close() lets a game end
+        # or close its replay before the window is cleared.
+        if hasattr(window.game, 'save'):
+            window.game.save()
+        if hasattr(window.game, 'close'):
+            window.game.close()
+
+
+    def changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+
+    def close_all(self):
+        windows = list(self.open_windows) + [window for pool in self.pools.values() for window in pool]
+        for window in self.open_windows:
+            self.close_game(window)
+        for window in windows:
+            window.clear()
+            window.destroy()
+        self.open_windows.clear()
+        self.pools.clear()
+
+
+    def count_widgets(self, widget):
+        return 1 + sum(self.count_widgets(child) for child in widget.winfo_children())
+
+
+    def stats(self):
+        return {
+            'open_windows': len(self.open_windows),
+            'pooled_windows': sum(len(pool) for pool in self.pools.values()),
+            'widgets': self.count_widgets(self.root),
+            'window_timers': sum(len(window.after_ids) for window in self.open_windows),
+            'tcl_timers': len(self.root.tk.splitlist(self.root.tk.call('after', 'info'))),
+            'frame_clients': len(self.scheduler.clients),
+            'background_tasks': len(self.executor.tasks),
+        }